@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Study Topic Benchmark - Synthetic Corpus + Search-Contract Timing
+
+Measures scripts/study_topic.py as the KB grows, so performance work on the
+search contract is a number rather than an impression. Generates a synthetic
+agent tree (L-docs, patterns, plans, SOPs, governance, specs, knowledge,
+ontology YAMLs, session notes, inbox items), runs representative topics
+through every finder and through main(), and reports:
+
+  - per-surface latency (median over --runs), scan and index modes
+  - end-to-end main(), default (scan) and --index: the index stays opt-in
+    until --index beats the default here
+  - files/sec per surface (files on the surface / median latency)
+  - peak RSS (process high-water mark after each phase; getrusage)
+  - ranking stability: each (topic, surface) ranked list compared across
+    runs, and across the full-scan, index and --jobs paths
+
+The full-scan, index and parallel paths are contractually identical
+(tests/test_study_topic_search.py); a cross-mode mismatch here is a bug, and
+the script exits 1 on one, so it doubles as a regression gate on large trees.
+
+Usage:
+    python3 bench_study_topic.py                        # default corpus, 3 runs
+    python3 bench_study_topic.py --scale 10 --runs 5    # 10x corpus
+    python3 bench_study_topic.py --count sessions=5000  # one surface scaled
+    python3 bench_study_topic.py --tree /path/agent     # bench a real agent tree
+    python3 bench_study_topic.py --keep /tmp/corpus     # generate and keep the tree
+    python3 bench_study_topic.py --json                 # machine-readable report
+
+Exit codes:
+    0: Benchmark completed, all modes agree
+    1: Ranking differed between runs or modes
+    3: Configuration/runtime error
+
+Related: study_topic.py (CAP-SESSION-007), L039 (Diagnostic Efficiency)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import study_topic  # noqa: E402
+
+
+# =============================================================================
+# Synthetic corpus
+# =============================================================================
+
+# Files per surface at --scale 1. Roughly the shape of a mature seat: sessions
+# dominate, governance is small. --count overrides one surface at a time.
+DEFAULT_COUNTS = {
+    'ldocs': 400,
+    'patterns': 150,
+    'plans': 40,
+    'sops': 60,
+    'governance': 20,
+    'specs': 120,
+    'knowledge': 150,
+    'ontology': 30,
+    'sessions': 800,
+    'inbox': 50,
+}
+
+DEFAULT_TOPICS = [
+    'wake',
+    'wind down protocol',
+    'release currency signal',
+    'L477',
+    'supervisor lessons',
+    'spec contract verification',
+]
+
+# Filler vocabulary; drawn with Zipf-like weights so term frequencies look
+# like prose (a few very common words, a long tail) rather than uniform noise.
+_FILLER = (
+    'the of and to in is that for it as with be on by this are from at or '
+    'agent session file check status change review update config release '
+    'version scope surface search index score result finding artifact note '
+    'lesson pattern governance charter mission spec requirement capability '
+    'fleet seat registry owner principal evidence decision rationale gate '
+    'migration template instance framework contract protocol wake wind down '
+    'study topic signal currency supervisor verification test failure fix '
+    'drift audit hygiene cache stale fresh token keyword ranking boost floor '
+    'plan phase gate deliverable milestone ontology vocabulary term concept '
+    'inbox notify handoff backlog priority blocker owner deadline budget'
+).split()
+_WEIGHTS = [1.0 / (rank + 1) for rank in range(len(_FILLER))]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = ' '.join(rng.choices(_FILLER, weights=_WEIGHTS, k=words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def _markdown(rng: random.Random, title: str, paragraphs: int) -> str:
+    lines = [f'# {title}', '']
+    for p in range(paragraphs):
+        if p and rng.random() < 0.3:
+            lines += [f'## {_sentence(rng, 3)[:-1]}', '']
+        lines.append(' '.join(_sentence(rng, rng.randint(6, 18))
+                              for _ in range(rng.randint(1, 4))))
+        if rng.random() < 0.2:
+            lines.append(f'- See L{rng.randint(1, 1200)} for context.')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def _yaml(rng: random.Random, name: str, terms: int) -> str:
+    lines = [f'ontology: {name}', 'terms:']
+    for _ in range(terms):
+        term = '_'.join(rng.choices(_FILLER[20:], k=2))
+        lines += [f'  - id: {term}', f'    definition: "{_sentence(rng, 10)}"']
+    return '\n'.join(lines) + '\n'
+
+
+def _slug(rng: random.Random, words: int = 2) -> str:
+    return '_'.join(rng.choices(_FILLER[20:], k=words))
+
+
+def generate_tree(root: Path, counts: dict = None, seed: int = 0) -> dict:
+    """Write a synthetic agent tree under root; returns files written per surface.
+
+    Deterministic for a given (counts, seed). Session names carry dates inside
+    find_sessions' default 90-day window, and inbox files are written now, so
+    both recency-windowed surfaces see the whole generated set.
+    """
+    counts = {**DEFAULT_COUNTS, **(counts or {})}
+    rng = random.Random(seed)
+    written = {}
+
+    def write(rel: str, text: str, surface: str):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        written[surface] = written.get(surface, 0) + 1
+
+    for i in range(counts['ldocs']):
+        slug = _slug(rng)
+        # ~1 in 20 L-docs live in a curated sub-directory (find_ldocs rglob)
+        sub = 'discoveries/' if i % 20 == 19 else ''
+        name = f'{slug}.md' if sub else f'L{i + 1}_{slug}.md'
+        write(f'.aget/evolution/{sub}{name}',
+              _markdown(rng, f'L{i + 1}: {slug.replace("_", " ")}', rng.randint(3, 12)), 'ldocs')
+    for i in range(counts['patterns']):
+        base = 'docs/patterns' if i % 3 else 'patterns/session'
+        slug = _slug(rng)
+        write(f'{base}/PATTERN_{slug}_{i}.md',
+              _markdown(rng, f'Pattern: {slug}', rng.randint(4, 15)), 'patterns')
+    for i in range(counts['plans']):
+        status = rng.choice(['In Progress', 'Complete', 'Proposed'])
+        text = _markdown(rng, f'Project plan {i}', rng.randint(5, 20))
+        write(f'planning/PROJECT_PLAN_{_slug(rng)}_{i}.md',
+              text.replace('\n\n', f'\n\n**Plan_Status**: {status}\n\n', 1), 'plans')
+    for i in range(counts['sops']):
+        write(f'sops/SOP_{_slug(rng)}_{i}.md',
+              _markdown(rng, f'SOP {i}', rng.randint(4, 12)), 'sops')
+    for i in range(counts['governance']):
+        write(f'governance/{_slug(rng).upper()}_{i}.md',
+              _markdown(rng, f'Governance {i}', rng.randint(6, 25)), 'governance')
+    for i in range(counts['specs']):
+        name = f'{_slug(rng).upper()}_SPEC_{i}'
+        if i % 4 == 3:
+            write(f'.aget/specs/{name}.yaml', _yaml(rng, name, rng.randint(5, 30)), 'specs')
+        else:
+            write(f'specs/{name}.md', _markdown(rng, name, rng.randint(8, 40)), 'specs')
+    for i in range(counts['knowledge']):
+        write(f'knowledge/{_slug(rng)}/{_slug(rng)}_{i}.md',
+              _markdown(rng, f'Note {i}', rng.randint(2, 10)), 'knowledge')
+    for i in range(counts['ontology']):
+        write(f'ontology/ONTOLOGY_{_slug(rng)}_{i}.yaml',
+              _yaml(rng, f'ontology_{i}', rng.randint(10, 60)), 'ontology')
+    today = date.today()
+    for i in range(counts['sessions']):
+        day = (today - timedelta(days=i % 60)).isoformat()
+        # Sessions are the bulk surface: long notes, a few very long ones.
+        paragraphs = rng.randint(10, 40) if i % 50 else rng.randint(300, 600)
+        write(f'sessions/session_{day}_{i:05d}.md',
+              _markdown(rng, f'Session {day}', paragraphs), 'sessions')
+    for i in range(counts['inbox']):
+        write(f'inbox/NOTIFY_{_slug(rng)}_{i}.md',
+              _markdown(rng, f'NOTIFY {i}', rng.randint(1, 5)), 'inbox')
+    return written
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+# Finding key -> finder, in collect_findings' order (sessions last, opt-in).
+FINDERS = [
+    ('ldocs', study_topic.find_ldocs),
+    ('patterns', study_topic.find_patterns),
+    ('project_plans', study_topic.find_project_plans),
+    ('sops', study_topic.find_sops),
+    ('governance', study_topic.find_governance),
+    ('specs', study_topic.find_specs),
+    ('knowledge', study_topic.find_knowledge),
+    ('inbox', study_topic.find_inbox),
+    ('sessions', study_topic.find_sessions),
+]
+
+# Files each finder walks, for files/sec. Approximate by design: recency
+# windows and name filters are not re-applied (generated trees sit inside both).
+_SURFACE_GLOBS = {
+    'ldocs': [('.aget/evolution', '**/*.md')],
+    'patterns': [('docs/patterns', '**/*.md'), ('patterns', '**/*.md')],
+    'project_plans': [('planning', 'PROJECT_PLAN*.md')],
+    'sops': [('sops', 'SOP_*.md')],
+    'governance': [('governance', '*.md')],
+    'specs': [('specs', '**/*.md'), ('specs', '**/*.yaml'),
+              ('.aget/specs', '**/*.md'), ('.aget/specs', '**/*.yaml')],
+    'knowledge': [('knowledge', '**/*.md'), ('knowledge', '**/*.yaml'),
+                  ('ontology', '**/*.md'), ('ontology', '**/*.yaml')],
+    'inbox': [('inbox', '**/*.md')],
+    'sessions': [('sessions', '*.md')],
+}
+
+
+def surface_file_counts(root: Path) -> dict:
+    counts = {}
+    for key, globs in _SURFACE_GLOBS.items():
+        counts[key] = sum(1 for rel, pattern in globs if (root / rel).exists()
+                          for _ in (root / rel).glob(pattern))
+    return counts
+
+
+def peak_rss_mb():
+    """Process peak RSS in MB (high-water mark), or None where unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _ranking(items: list) -> list:
+    return [(item.get('file'), item.get('score')) for item in items]
+
+
+@contextlib.contextmanager
+def _agent_root(root: Path):
+    saved = study_topic.get_agent_root
+    study_topic.get_agent_root = lambda: root
+    try:
+        yield
+    finally:
+        study_topic.get_agent_root = saved
+
+
+def time_finders(topic: str, index=None, jobs: int = 1) -> tuple:
+    """One cold (fresh content cache) pass over every finder.
+
+    Returns ({key: seconds}, {key: ranking}). jobs > 1 times collect_findings
+    as a whole instead (surfaces overlap, so per-surface time is not defined).
+    """
+    timings, rankings = {}, {}
+    study_topic.activate_index(index)
+    try:
+        if jobs > 1:
+            start = time.perf_counter()
+            findings = study_topic.collect_findings(topic, include_sessions=True, jobs=jobs)
+            timings['all'] = time.perf_counter() - start
+            return timings, {key: _ranking(items) for key, items in findings.items()}
+        for key, finder in FINDERS:
+            study_topic.activate_content_cache(study_topic.ContentCache())
+            try:
+                start = time.perf_counter()
+                items = finder(topic)
+                timings[key] = time.perf_counter() - start
+            finally:
+                study_topic.activate_content_cache(None)
+            rankings[key] = _ranking(items)
+    finally:
+        study_topic.activate_index(None)
+    return timings, rankings
+
+
+def time_main(topic: str, extra: list = ()) -> float:
+    """End-to-end main() for one topic (JSON mode, in-process, output discarded)."""
+    argv = sys.argv
+    sys.argv = ['study_topic.py', '--topic', topic, '--json', '--no-daemon',
+                '--include-sessions', *extra]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            study_topic.main()
+            return time.perf_counter() - start
+    finally:
+        sys.argv = argv
+
+
+def run_benchmark(root: Path, topics: list, runs: int = 3, jobs: int = 4) -> dict:
+    """Benchmark every finder and main() on the agent tree at root."""
+    report = {'agent_root': str(root), 'runs': runs, 'jobs': jobs,
+              'surface_files': surface_file_counts(root), 'peak_rss_mb': {}}
+    mismatches = []
+    with _agent_root(root):
+        report['peak_rss_mb']['start'] = peak_rss_mb()
+
+        start = time.perf_counter()
+        index = study_topic.build_index(root, include_sessions=True)
+        report['index_build_s'] = round(time.perf_counter() - start, 4)
+        study_topic.activate_content_cache(study_topic.ContentCache())
+        try:
+            start = time.perf_counter()
+            study_topic.refresh_index(index, root, include_sessions=True)
+            report['index_refresh_s'] = round(time.perf_counter() - start, 4)
+        finally:
+            study_topic.activate_content_cache(None)
+        index.save()        # main() --index loads it rather than building it
+        report['peak_rss_mb']['index'] = peak_rss_mb()
+
+        per_topic = {}
+        for topic in topics:
+            samples = {'scan': {}, 'index': {}}
+            parallel = []
+            reference = None
+            for run in range(runs):
+                for mode, idx in (('scan', None), ('index', index)):
+                    timings, rankings = time_finders(topic, index=idx)
+                    for key, seconds in timings.items():
+                        samples[mode].setdefault(key, []).append(seconds)
+                    if reference is None:
+                        reference = rankings
+                    mismatches += [{'topic': topic, 'surface': key, 'mode': mode, 'run': run}
+                                   for key in reference if rankings.get(key) != reference[key]]
+                if jobs > 1:
+                    timings, rankings = time_finders(topic, index=index, jobs=jobs)
+                    parallel.append(timings['all'])
+                    mismatches += [{'topic': topic, 'surface': key, 'mode': f'jobs={jobs}',
+                                    'run': run}
+                                   for key in reference if rankings.get(key) != reference[key]]
+
+            surfaces = {}
+            for key, _ in FINDERS:
+                files = report['surface_files'].get(key, 0)
+                row = {'files': files, 'matches': len(reference.get(key, []))}
+                for mode in ('scan', 'index'):
+                    median = statistics.median(samples[mode][key])
+                    row[f'{mode}_ms'] = round(median * 1000, 2)
+                    row[f'{mode}_files_per_s'] = round(files / median) if median else None
+                surfaces[key] = row
+            per_topic[topic] = {
+                'surfaces': surfaces,
+                'finders_scan_ms': round(sum(r['scan_ms'] for r in surfaces.values()), 2),
+                'finders_index_ms': round(sum(r['index_ms'] for r in surfaces.values()), 2),
+                'collect_jobs_ms': (round(statistics.median(parallel) * 1000, 2)
+                                    if parallel else None),
+                'main_ms': round(statistics.median(
+                    time_main(topic) for _ in range(runs)) * 1000, 2),
+                'main_index_ms': round(statistics.median(
+                    time_main(topic, ['--index']) for _ in range(runs)) * 1000, 2),
+            }
+        report['peak_rss_mb']['end'] = peak_rss_mb()
+
+    report['topics'] = per_topic
+    compared = len(topics) * len(FINDERS) * runs * (3 if jobs > 1 else 2)
+    report['ranking_stability'] = {
+        'comparisons': compared,
+        'identical': compared - len(mismatches),
+        'stable': not mismatches,
+        'mismatches': mismatches[:20],
+    }
+    return report
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+def format_report(report: dict) -> str:
+    lines = ['=' * 78, 'STUDY TOPIC BENCHMARK', '=' * 78,
+             f"Agent root: {report['agent_root']}",
+             f"Runs: {report['runs']} (medians)   --jobs: {report['jobs']}",
+             f"Index build: {report['index_build_s'] * 1000:.0f}ms   "
+             f"no-change refresh: {report['index_refresh_s'] * 1000:.0f}ms",
+             '']
+    for topic, data in report['topics'].items():
+        lines.append(f'Topic: "{topic}"')
+        lines.append(f"  {'surface':<14}{'files':>7}{'hits':>6}{'scan ms':>10}"
+                     f"{'files/s':>10}{'index ms':>10}{'files/s':>10}")
+        for key, row in data['surfaces'].items():
+            lines.append(f"  {key:<14}{row['files']:>7}{row['matches']:>6}"
+                         f"{row['scan_ms']:>10.1f}{row['scan_files_per_s'] or 0:>10}"
+                         f"{row['index_ms']:>10.1f}{row['index_files_per_s'] or 0:>10}")
+        jobs = (f"   collect --jobs: {data['collect_jobs_ms']:.0f}ms"
+                if data['collect_jobs_ms'] is not None else '')
+        lines.append(f"  finders: scan {data['finders_scan_ms']:.0f}ms, "
+                     f"index {data['finders_index_ms']:.0f}ms{jobs}")
+        lines.append(f"  main(): {data['main_ms']:.0f}ms "
+                     f"(--index {data['main_index_ms']:.0f}ms)")
+        lines.append('')
+    rss = report['peak_rss_mb']
+    lines.append(f"Peak RSS (MB, high-water): start {rss['start']}, after index "
+                 f"{rss['index']}, end {rss['end']}")
+    stability = report['ranking_stability']
+    verdict = 'STABLE' if stability['stable'] else 'UNSTABLE'
+    lines.append(f"Ranking stability: {verdict} — {stability['identical']}/"
+                 f"{stability['comparisons']} (topic, surface, mode, run) lists identical")
+    for m in stability['mismatches']:
+        lines.append(f"  ✗ {m['topic']!r} {m['surface']} ({m['mode']}, run {m['run']})")
+    lines.append('=' * 78)
+    return '\n'.join(lines)
+
+
+def _parse_counts(values: list) -> dict:
+    counts = {}
+    for value in values or []:
+        key, _, num = value.partition('=')
+        if key not in DEFAULT_COUNTS or not num.isdigit():
+            raise ValueError(f"--count expects SURFACE=N with SURFACE in "
+                             f"{', '.join(DEFAULT_COUNTS)} (got {value!r})")
+        counts[key] = int(num)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark study_topic.py on a synthetic (or real) agent tree',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split('Usage:')[1].split('Exit codes:')[0])
+    parser.add_argument('--tree', type=Path,
+                        help='Benchmark an existing agent tree instead of generating one')
+    parser.add_argument('--keep', type=Path,
+                        help='Generate the corpus here and keep it (default: temp dir, removed)')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiply every default surface count (default: 1)')
+    parser.add_argument('--count', action='append', metavar='SURFACE=N',
+                        help=f"Override one surface's file count ({', '.join(DEFAULT_COUNTS)})")
+    parser.add_argument('--seed', type=int, default=0, help='Corpus RNG seed (default: 0)')
+    parser.add_argument('--topic', action='append', dest='topics',
+                        help='Topic to run (repeatable; default: a representative set)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per topic (default: 3)')
+    parser.add_argument('--jobs', type=int, default=4,
+                        help='Also time collect_findings(jobs=N); 1 to skip (default: 4)')
+    parser.add_argument('--json', action='store_true', help='JSON output')
+    args = parser.parse_args()
+
+    try:
+        overrides = _parse_counts(args.count)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 3
+    if args.runs < 1:
+        print("Error: --runs must be >= 1", file=sys.stderr)
+        return 3
+
+    tmp = None
+    if args.tree:
+        root = args.tree.resolve()
+        if not root.is_dir():
+            print(f"Error: {root} is not a directory", file=sys.stderr)
+            return 3
+        generated = None
+    else:
+        if args.keep:
+            root = args.keep.resolve()
+        else:
+            # A sub-directory, so find_specs' ../aget/specs tier stays inside it.
+            tmp = Path(tempfile.mkdtemp(prefix='bench_study_topic_'))
+            root = tmp / 'agent'
+        counts = {key: max(0, round(n * args.scale)) for key, n in DEFAULT_COUNTS.items()}
+        counts.update(overrides)
+        start = time.perf_counter()
+        generated = generate_tree(root, counts, seed=args.seed)
+        print(f"Generated {sum(generated.values())} files in "
+              f"{time.perf_counter() - start:.1f}s -> {root}", file=sys.stderr)
+
+    try:
+        report = run_benchmark(root, args.topics or DEFAULT_TOPICS,
+                               runs=args.runs, jobs=args.jobs)
+    finally:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+    report['generated'] = generated
+    report['seed'] = args.seed if generated else None
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+    return 0 if report['ranking_stability']['stable'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
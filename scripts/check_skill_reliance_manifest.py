@@ -15,9 +15,20 @@ Checks (each returns a finding; any ERROR => exit 1):
 Usage:
   python3 scripts/check_skill_reliance_manifest.py            # human-readable
   python3 scripts/check_skill_reliance_manifest.py --json     # machine / wake-up
+
+In-process API (wake_up.py, health_check.py): `attest(repo)` returns validate()'s
+result plus the report line the CLI would print last, memoized in
+.aget/cache/reliance_attestation.json by the mtimes of everything validate()
+reads (manifest, skills dir, archetype-index candidates, this file). Callers
+skip an interpreter start and, while nothing changed, the YAML parse. A
+validator declares that API with ATTEST_API_VERSION; `load_validator(path)`
+loads a validator file (another seat's, say) only when it declares it.
+health_check.py gates in-process use of its own copies the same way
+(load_declared).
 """
 from __future__ import annotations
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -35,6 +46,10 @@ _ARCHETYPE_CANDIDATES = [
 ]
 ARCHETYPE_INDEX = next((p for p in _ARCHETYPE_CANDIDATES if p.exists()),
                        _ARCHETYPE_CANDIDATES[0])
+ATTESTATION_CACHE = Path(".aget") / "cache" / "reliance_attestation.json"
+# The in-process API this file offers: attest(repo, use_cache=True) -> dict
+# with 'ok' and 'summary'. Bump when that contract changes.
+ATTEST_API_VERSION = 1
 
 TIER_KEYS = {"core_S": "S", "optional_O": "O", "domain_D": "D"}
 
@@ -45,21 +60,38 @@ def _load_yaml(path: Path):
         return yaml.safe_load(fh)
 
 
-def validate() -> dict:
+def _archetype_candidates(repo: Path) -> list[Path]:
+    return [
+        repo.parent / "aget" / "specs" / "ARCHETYPE_SKILLS_INDEX.yaml",
+        repo.parent / "aget-framework" / "aget" / "specs" / "ARCHETYPE_SKILLS_INDEX.yaml",
+        _ARCHETYPE_CANDIDATES[2],
+    ]
+
+
+def validate(repo: Path | None = None) -> dict:
+    """Run C1-C5 against `repo` (default: the repo this file lives in)."""
+    if repo is None:
+        manifest_path, skills_dir, archetype_index = MANIFEST, SKILLS_DIR, ARCHETYPE_INDEX
+    else:
+        repo = Path(repo)
+        manifest_path = repo / ".aget" / "skill_reliance_manifest.yaml"
+        skills_dir = repo / ".claude" / "skills"
+        candidates = _archetype_candidates(repo)
+        archetype_index = next((p for p in candidates if p.exists()), candidates[0])
     findings: list[dict] = []
 
     def add(level: str, check: str, msg: str):
         findings.append({"level": level, "check": check, "msg": msg})
 
-    if not MANIFEST.exists():
-        add("ERROR", "load", f"manifest not found: {MANIFEST}")
+    if not manifest_path.exists():
+        add("ERROR", "load", f"manifest not found: {manifest_path}")
         return _result(findings)
 
-    manifest = _load_yaml(MANIFEST) or {}
+    manifest = _load_yaml(manifest_path) or {}
     tiers = {k: list(manifest.get(k) or []) for k in TIER_KEYS}
     declared = {s: TIER_KEYS[k] for k, lst in tiers.items() for s in lst}
 
-    on_disk = {p.name for p in SKILLS_DIR.iterdir() if p.is_dir()} if SKILLS_DIR.exists() else set()
+    on_disk = {p.name for p in skills_dir.iterdir() if p.is_dir()} if skills_dir.exists() else set()
 
     # C1 — declared skills exist on disk
     for skill, tier in sorted(declared.items()):
@@ -75,9 +107,9 @@ def validate() -> dict:
             seen[s] = TIER_KEYS[k]
 
     # C3 — {S} core equals authoritative universal_skills
-    if ARCHETYPE_INDEX.exists():
+    if archetype_index.exists():
         try:
-            idx = _load_yaml(ARCHETYPE_INDEX) or {}
+            idx = _load_yaml(archetype_index) or {}
             universal = set((idx.get("universal_skills") or {}).get("list") or [])
             core = set(tiers["core_S"])
             if universal and core != universal:
@@ -123,18 +155,117 @@ def _result(findings, **extra) -> dict:
     }
 
 
+def report_lines(res: dict) -> list[str]:
+    """The human-readable report, one line per entry."""
+    status = "PASS" if res["ok"] else "FAIL"
+    unreach = f", {res['unreachable']} UNREACHABLE" if res.get('unreachable') else ""
+    lines = [f"Skill Reliance Manifest: {status} "
+             f"({res.get('declared', 0)} declared / {res.get('on_disk', 0)} on disk; "
+             f"{res['errors']} errors, {res['warnings']} warnings{unreach})"]
+    lines += [f"  [{f['level']}] {f['check']}: {f['msg']}" for f in res["findings"]]
+    return lines
+
+
+def _input_stamps(repo: Path) -> list:
+    inputs = [repo / ".aget" / "skill_reliance_manifest.yaml", repo / ".claude" / "skills",
+              *_archetype_candidates(repo), Path(__file__)]
+    stamps = []
+    for path in inputs:
+        try:
+            stamps.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return stamps
+
+
+def attest(repo: Path | None = None, use_cache: bool = True) -> dict:
+    """validate(repo) plus 'summary' (the last report line, as the CLI prints
+    it), reused from the attestation cache while no input's mtime changed.
+
+    Raises what validate() raises (ImportError without PyYAML, YAML errors).
+    """
+    repo = Path(repo) if repo is not None else REPO
+    cache_file = repo / ATTESTATION_CACHE
+    stamps = _input_stamps(repo)
+    if use_cache:
+        try:
+            cached = json.loads(cache_file.read_text())
+            if cached.get("stamps") == stamps:
+                return cached["result"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+    res = validate(repo)
+    res["summary"] = report_lines(res)[-1]
+    if use_cache:
+        try:  # an unwritable cache only costs the next caller a validate() (ADR-004)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"stamps": stamps, "result": res}))
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+    return res
+
+
+def declared_api_version(source: str, name: str = "ATTEST_API_VERSION"):
+    """The int a script's source assigns to `name` at top level, or None.
+    Read from the syntax tree, never by running the file."""
+    import ast
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == name
+                and isinstance(node.value, ast.Constant)
+                and type(node.value.value) is int):
+            return node.value.value
+    return None
+
+
+def load_declared(path: Path, name: str, version: int, module_name: str):
+    """The script at `path` as a module if its source declares `name` =
+    `version`, else None (also when it fails to load). Scripts that do not
+    declare it are never run: their module top level may do work, and
+    callers run them as a subprocess instead.
+
+    The source is compiled and run in a fresh module rather than imported, so
+    no __pycache__/ is written next to it: the file may be another seat's,
+    checked by a read-only fleet sweep.
+    """
+    try:
+        source = Path(path).read_text(encoding="utf-8")
+        if declared_api_version(source, name) != version:
+            return None
+        import types
+        module = types.ModuleType(module_name)
+        module.__file__ = str(path)
+        exec(compile(source, str(path), "exec"), module.__dict__)
+        return module
+    except Exception:
+        return None
+
+
+def load_validator(path: Path):
+    """The validator module at `path` if it declares this ATTEST_API_VERSION,
+    else None (load_declared). This file is returned as is."""
+    try:
+        if Path(path).resolve() == Path(__file__).resolve():
+            return sys.modules[__name__]
+    except OSError:
+        return None
+    return load_declared(path, "ATTEST_API_VERSION", ATTEST_API_VERSION,
+                         "check_skill_reliance_manifest")
+
+
 def main(argv: list[str]) -> int:
     res = validate()
     if "--json" in argv:
         print(json.dumps(res, indent=2))
     else:
-        status = "PASS" if res["ok"] else "FAIL"
-        unreach = f", {res['unreachable']} UNREACHABLE" if res.get('unreachable') else ""
-        print(f"Skill Reliance Manifest: {status} "
-              f"({res.get('declared', 0)} declared / {res.get('on_disk', 0)} on disk; "
-              f"{res['errors']} errors, {res['warnings']} warnings{unreach})")
-        for f in res["findings"]:
-            print(f"  [{f['level']}] {f['check']}: {f['msg']}")
+        print("\n".join(report_lines(res)))
     return 0 if res["ok"] else 1
 
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Extension Hooks - one runner for the instance `*_ext.py` hooks
+
+wake_up.py (post_wake, WU-008), wind_down.py (post_wind_down, WD-008),
+health_check.py (post_health) and study_topic.py (post_study) each let an
+instance augment their output from scripts/<name>_ext.py. Each used to
+exec_module the hook file on every call and run the hook inline with no time
+limit, so one slow instance hook stalled the whole protocol. This runner:
+
+  - caches the loaded hook module by path, mtime and size, so a long-lived
+    process (the study query daemon) loads it once per edit;
+  - runs load + hook in a worker thread under a per-hook deadline
+    (config `extension_hooks.timeout_seconds`, default 10; 0/null: no limit,
+    run inline). The hook gets a deep copy of the data, so a hook still
+    running past its deadline cannot change the output it was dropped from;
+  - records what happened in the output as `extension_hook`:
+    {module, hook, status, duration_ms, cached}, status one of ok, non_dict,
+    no_hook, error, timed_out.
+
+The contract is unchanged: hook absence = no-op (no record either), the hook
+returns an augmented dict (additive-only per L464), failure or timeout =
+warning + continue with the un-hooked data (ADR-004). A thread cannot be
+killed: a timed-out hook keeps running in the background (daemon thread)
+until it returns or the process exits.
+
+Consumers import this module guarded: an instance whose scripts/ predates it
+keeps its in-script hook call.
+
+Related: wake_up.py, wind_down.py, health_check.py, study_topic.py (call_extension_hook)
+"""
+
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_TIMEOUT = 10.0  # seconds per hook
+
+_MODULES: Dict[str, tuple] = {}  # str(ext_path) -> (mtime_ns, size, module)
+
+
+def hook_timeout(agent_path: Path) -> Optional[float]:
+    """Per-hook deadline from .aget/config.json (None: no limit)."""
+    try:
+        config = json.loads((agent_path / '.aget' / 'config.json').read_text())
+        timeout = config.get('extension_hooks', {}).get('timeout_seconds', DEFAULT_TIMEOUT)
+    except (OSError, ValueError, AttributeError):
+        return DEFAULT_TIMEOUT
+    return float(timeout) if timeout else None
+
+
+def load_hook_module(ext_path: Path, module_name: str):
+    """(module, cached): the hook module, loaded afresh only when the file changed."""
+    stat = ext_path.stat()
+    key = str(ext_path)
+    entry = _MODULES.get(key)
+    if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2], True
+    spec = importlib.util.spec_from_file_location(module_name, key)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _MODULES[key] = (stat.st_mtime_ns, stat.st_size, module)
+    return module, False
+
+
+def clear_cache() -> None:
+    """Forget every loaded hook module."""
+    _MODULES.clear()
+
+
+def run_hook(ext_path: Path, module_name: str, hook_name: str, data: Dict[str, Any],
+             timeout: Optional[float] = DEFAULT_TIMEOUT, label: str = 'Extension hook',
+             log: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """Run `hook_name` from the hook file at ext_path on data.
+
+    Returns the hook's dict (or data, if the hook is absent, failed, timed
+    out or returned a non-dict) with the `extension_hook` record added.
+    Returns data untouched when ext_path does not exist.
+    """
+    if not ext_path.exists():
+        return data
+    record = {'module': ext_path.name, 'hook': hook_name, 'status': 'error',
+              'duration_ms': None, 'cached': False}
+    outcome: Dict[str, Any] = {}
+
+    def call(payload):
+        module, outcome['cached'] = load_hook_module(ext_path, module_name)
+        hook = getattr(module, hook_name, None)
+        outcome['found'] = hook is not None
+        outcome['result'] = hook(payload) if hook is not None else None
+        outcome['payload'] = payload
+
+    def guarded(payload):
+        try:
+            call(payload)
+        except Exception as e:
+            outcome['error'] = e
+
+    started = time.perf_counter()
+    if timeout is None:
+        guarded(data)
+        finished = True
+    else:
+        import copy
+        import threading
+        try:
+            payload = copy.deepcopy(data)
+        except Exception:
+            payload = data
+        worker = threading.Thread(target=guarded, args=(payload,), daemon=True,
+                                  name=f'{module_name}.{hook_name}')
+        worker.start()
+        worker.join(timeout)
+        finished = not worker.is_alive()
+    record['duration_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    record['cached'] = bool(outcome.get('cached'))
+
+    result = data
+    if not finished:
+        record['status'] = 'timed_out'
+        print(f"Warning: {label} timed out after {timeout:g}s; continuing without it",
+              file=sys.stderr)
+    elif 'error' in outcome:
+        print(f"Warning: {label} failed: {outcome['error']}", file=sys.stderr)
+    elif not outcome['found']:
+        record['status'] = 'no_hook'
+    elif isinstance(outcome['result'], dict):
+        record['status'] = 'ok'
+        result = outcome['result']
+    else:
+        record['status'] = 'non_dict'
+        result = outcome['payload']    # keeps what the hook did in place, as before
+        if log is not None:
+            log(f"{label} returned non-dict, ignoring")
+    return {**result, 'extension_hook': record}
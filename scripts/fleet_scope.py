@@ -51,11 +51,20 @@ REGISTRY = _find_registry()
 
 
 def load_agents(registry: pathlib.Path):
-    """Return [(name, path)] for every agent with a resolvable location in the registry."""
+    """Return [(name, path)] for every agent with a resolvable location in the registry.
+
+    Parsed through scripts/fleet_state.py (libyaml when available, plus a JSON
+    cache keyed on the registry's content) when this instance has it.
+    """
     try:
-        import yaml
+        import fleet_state
     except ImportError:
-        sys.exit("fleet_scope: PyYAML required (pip install pyyaml)")
+        fleet_state = None
+    if fleet_state is None:
+        try:
+            import yaml
+        except ImportError:
+            sys.exit("fleet_scope: PyYAML required (pip install pyyaml)")
     if not registry.is_file():
         sys.exit(
             f"fleet_scope: registry not found at {registry}\n"
@@ -63,7 +72,15 @@ def load_agents(registry: pathlib.Path):
             "  Do NOT fall back to a path glob — that is the defect this exists to prevent.\n"
             "  Locate the registry and pass --registry, or fix the path here."
         )
-    data = yaml.safe_load(registry.read_text())
+    if fleet_state is None:
+        data = yaml.safe_load(registry.read_text())
+    else:
+        try:
+            data = fleet_state.load_fleet_state(registry)
+        except ImportError:
+            sys.exit("fleet_scope: PyYAML required (pip install pyyaml)")
+        except (OSError, ValueError) as e:
+            sys.exit(f"fleet_scope: cannot read registry {registry}: {e}")
 
     found = []
 
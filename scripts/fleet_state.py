@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Fleet State - load FLEET_STATE.yaml once, not once per call
+
+The fleet registry (FLEET_STATE.yaml) is read by wake_up.py's fleet-state
+helper (gh#1288, called from wake hooks) and by fleet_scope.py on every
+invocation. PyYAML's pure-Python loader is slow on a large fleet, so:
+
+  - YAML is parsed with the libyaml CSafeLoader when PyYAML was built with
+    it, else with SafeLoader (same safe subset either way);
+  - the parsed registry is cached as compact JSON, keyed by the YAML's mtime
+    and size, and by its SHA-256 when those moved (a checkout or `touch`
+    rewrites mtime without changing content). A cache hit needs no PyYAML.
+
+JSON, not pickle: the cache may sit beside another seat's registry, and
+loading a pickle from a shared location executes whatever it contains.
+Dates and datetimes are tagged so they round-trip; a registry JSON cannot
+represent losslessly (non-string keys, say) is simply not cached.
+
+Cache location: `<agent>/.aget/cache/fleet_state.json` for a registry at
+`<agent>/.aget/fleet/FLEET_STATE.yaml` (gitignored with the rest of the
+cache); next to the YAML as `.<name>.cache.json` anywhere else. An
+unwritable location just means no cache (ADR-004).
+
+Usage:
+    python3 fleet_state.py PATH      # Load PATH; report parser and cache use
+
+Related: wake_up.py (compute_active_agents_from_fleet_state), fleet_scope.py (load_agents)
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+CACHE_VERSION = 1
+
+last_load = {}  # how the most recent load_fleet_state() call was served
+
+
+def cache_path(registry: Path) -> Path:
+    registry = Path(registry)
+    if registry.parent.name == 'fleet' and registry.parent.parent.name == '.aget':
+        return registry.parent.parent / 'cache' / f'{registry.stem.lower()}.json'
+    return registry.with_name(f'.{registry.name}.cache.json')
+
+
+def _encode(obj):
+    if isinstance(obj, datetime):
+        return {'__datetime__': obj.isoformat()}
+    if isinstance(obj, date):
+        return {'__date__': obj.isoformat()}
+    raise TypeError(f'not JSON-cacheable: {type(obj).__name__}')
+
+
+def _decode(obj: dict):
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+def parse_yaml(text: str) -> Any:
+    """safe_load, via libyaml when available. ImportError without PyYAML;
+    ValueError for malformed YAML."""
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(f'invalid YAML in fleet registry: {e}') from e
+
+
+def _read_cache(path: Path):
+    try:
+        cached = json.loads(path.read_text(), object_hook=_decode)
+    except (OSError, ValueError):
+        return None
+    if isinstance(cached, dict) and cached.get('version') == CACHE_VERSION:
+        return cached
+    return None
+
+
+def _write_cache(path: Path, stat, digest: str, data: Any) -> bool:
+    try:
+        payload = json.dumps({'version': CACHE_VERSION, 'mtime_ns': stat.st_mtime_ns,
+                              'size': stat.st_size, 'sha256': digest, 'data': data},
+                             default=_encode, separators=(',', ':'))
+        if json.loads(payload, object_hook=_decode)['data'] != data:
+            return False        # lossy in JSON (e.g. integer keys): don't cache
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(payload)
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+def load_fleet_state(registry: Path, use_cache: bool = True) -> Any:
+    """The parsed registry at `registry`.
+
+    Raises OSError if it cannot be read, ImportError if it must be parsed
+    and PyYAML is missing, ValueError if it is not valid YAML.
+    """
+    registry = Path(registry)
+    stat = registry.stat()
+    cache_file = cache_path(registry)
+    cached = _read_cache(cache_file) if use_cache else None
+    if cached and (cached.get('mtime_ns'), cached.get('size')) == (stat.st_mtime_ns, stat.st_size):
+        last_load.update(source='cache', parser=None)
+        return cached['data']
+    raw = registry.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached and cached.get('sha256') == digest:
+        data = cached['data']
+        last_load.update(source='cache (content unchanged)', parser=None)
+    else:
+        data = parse_yaml(raw.decode('utf-8'))
+        import yaml
+        last_load.update(source='yaml', parser='CSafeLoader' if hasattr(yaml, 'CSafeLoader')
+                         else 'SafeLoader')
+    if use_cache:
+        _write_cache(cache_file, stat, digest, data)
+    return data
+
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1].startswith('-'):
+        print(__doc__.split('Usage:')[1].split('Related:')[0].strip())
+        return 2
+    try:
+        data = load_fleet_state(Path(sys.argv[1]))
+    except (OSError, ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    kind = type(data).__name__
+    print(f"Loaded {sys.argv[1]} ({kind}) from {last_load['source']}"
+          + (f" [{last_load['parser']}]" if last_load.get('parser') else '')
+          + f"; cache: {cache_path(Path(sys.argv[1]))}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
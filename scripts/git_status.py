@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Git Status - one `git status` call per repository per process
+
+Shared by the session scripts (wake_up.py, wind_down.py). Each used to fork
+its own `git rev-parse --abbrev-ref HEAD` and `git status --porcelain`; a
+single `git status --porcelain=v2 --branch` carries the branch, the upstream
+with ahead/behind counts, and the change list, and the parsed result is
+cached per process so a second consumer costs nothing.
+
+`changes` is rendered in the classic `--porcelain` (v1) line format
+("XY path", "R  old -> new", "?? path") — the shape both scripts already
+display and emit in JSON. Paths keep git's own C-style quoting (no -z);
+v1's extra quoting of paths that contain a space is re-applied.
+
+Consumers import this module guarded (ADR-004): an instance whose scripts/
+predates it keeps its previous in-script git calls.
+
+Usage:
+    python3 git_status.py                 # Status of the current repository
+    python3 git_status.py --dir /path     # Status of another repository
+
+Related: wake_up.py (get_git_status), wind_down.py (get_uncommitted_changes)
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_CACHE: Dict[str, Optional[Dict[str, Any]]] = {}
+
+
+def _quote_sp(path: str) -> str:
+    """v1 also quotes paths containing a space (a rename's " -> " would be
+    ambiguous otherwise); v2 does not, having fixed fields and a tab."""
+    if ' ' in path and not path.startswith('"'):
+        return f'"{path}"'
+    return path
+
+
+def _v1_line(record: str) -> Optional[str]:
+    """One porcelain v2 entry as its porcelain v1 line (None: not a change)."""
+    kind = record[:1]
+    if kind == '?':
+        return f'?? {_quote_sp(record[2:])}'
+    if kind == '1':
+        # 1 XY sub mH mI mW hH hI path
+        fields = record.split(' ', 8)
+        return f"{fields[1].replace('.', ' ')} {_quote_sp(fields[8])}"
+    if kind == '2':
+        # 2 XY sub mH mI mW hH hI Xscore path<TAB>origPath
+        fields = record.split(' ', 9)
+        path, _, orig = fields[9].partition('\t')
+        return f"{fields[1].replace('.', ' ')} {_quote_sp(orig)} -> {_quote_sp(path)}"
+    if kind == 'u':
+        # u XY sub m1 m2 m3 mW h1 h2 h3 path
+        fields = record.split(' ', 10)
+        return f'{fields[1]} {_quote_sp(fields[10])}'
+    return None     # '!' (ignored) is never requested
+
+
+def parse_porcelain_v2(output: str) -> Dict[str, Any]:
+    """Parse `git status --porcelain=v2 --branch` output."""
+    status: Dict[str, Any] = {
+        'branch': 'unknown',
+        'head': None,
+        'upstream': None,
+        'ahead': None,
+        'behind': None,
+        'changes': [],
+    }
+    changes: List[str] = []
+    for record in output.splitlines():
+        if record.startswith('# branch.oid '):
+            oid = record[len('# branch.oid '):]
+            status['head'] = None if oid == '(initial)' else oid
+        elif record.startswith('# branch.head '):
+            head = record[len('# branch.head '):]
+            # `git rev-parse --abbrev-ref HEAD` spelling, which callers show
+            status['branch'] = 'HEAD' if head == '(detached)' else head
+        elif record.startswith('# branch.upstream '):
+            status['upstream'] = record[len('# branch.upstream '):]
+        elif record.startswith('# branch.ab '):
+            ahead, behind = record[len('# branch.ab '):].split()
+            status['ahead'], status['behind'] = int(ahead), -int(behind)
+        elif record and not record.startswith('#'):
+            line = _v1_line(record)
+            if line is not None:
+                changes.append(line)
+    status['changes'] = changes
+    status['clean'] = not changes
+    return status
+
+
+def get_repo_status(path: Path, timeout: int = 5, refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """Branch, upstream ahead/behind and changes for the repository at path.
+
+    Returns None when git cannot answer (not a repository, git missing,
+    timeout). Cached per process by resolved path; refresh=True re-runs git
+    (e.g. after the caller itself changed the tree). Callers receive a copy.
+    """
+    key = str(Path(path).resolve())
+    if refresh or key not in _CACHE:
+        try:
+            result = subprocess.run(
+                ['git', 'status', '--porcelain=v2', '--branch'],
+                capture_output=True, text=True, timeout=timeout,
+                cwd=key, stdin=subprocess.DEVNULL,
+            )
+            _CACHE[key] = parse_porcelain_v2(result.stdout) if result.returncode == 0 else None
+        except (subprocess.TimeoutExpired, OSError):
+            _CACHE[key] = None
+    status = _CACHE[key]
+    return None if status is None else {**status, 'changes': list(status['changes'])}
+
+
+def clear_cache() -> None:
+    """Forget every cached status (the next call re-runs git)."""
+    _CACHE.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Repository status from one git call')
+    parser.add_argument('--dir', type=Path, default=Path.cwd(),
+                        help='Repository directory (default: current directory)')
+    args = parser.parse_args()
+    status = get_repo_status(args.dir)
+    if status is None:
+        print(f"Error: git status failed in {args.dir}", file=sys.stderr)
+        return 1
+    print(json.dumps(status, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
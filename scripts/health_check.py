@@ -15,6 +15,14 @@ Usage:
     python3 health_check.py --json --pretty    # Pretty-printed JSON
     python3 health_check.py --dir /path/agent  # Run on specific agent
     python3 health_check.py --fix              # Attempt auto-fixes
+    python3 health_check.py --jobs 1           # Run checks one at a time
+    python3 health_check.py --only version_json,config_size   # Selected checks (+ deps)
+    python3 health_check.py --tags skills,permissions         # Checks with these tags
+    python3 health_check.py --changed          # Only checks whose inputs changed
+    python3 health_check.py --no-cache         # Re-run every check (ignore recorded results)
+    python3 health_check.py --list             # Registered checks, tags and inputs
+    python3 health_check.py --fleet            # Every seat in FLEET_STATE.yaml
+    python3 health_check.py --fleet --registry PATH --workers 4 --json
 
 Exit codes:
     0: All checks passed
@@ -36,6 +44,7 @@ Version: 1.0.0 (v3.1.0)
 """
 
 import argparse
+import functools
 import importlib.util
 import json
 import os
@@ -46,12 +55,39 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    import extension_hooks  # scripts/extension_hooks.py: cached hook modules, deadline
+except ImportError:         # older instance scripts/ (ADR-004): in-script hook call
+    extension_hooks = None
+try:
+    import protocol_telemetry  # scripts/protocol_telemetry.py: per-run timing record
+except ImportError:
+    protocol_telemetry = None
+try:
+    import check_skill_reliance_manifest  # load_validator / load_declared: in process
+except ImportError:
+    check_skill_reliance_manifest = None
+
+# The in-process API this file offers (wind_down.py): run_housekeeping(
+# agent_path, verbose=...) and call_extension_hook(agent_path, data,
+# verbose=...). Bump when that contract changes.
+HOUSEKEEPING_API_VERSION = 1
+
 
 # =============================================================================
 # L039: Diagnostic Efficiency - Timing
 # =============================================================================
 
 _start_time = time.time()
+_phases = None  # [(phase, ms)] for the telemetry record while main() runs
+
+
+def profile_phase(name: str, started: float) -> float:
+    """Record a phase that began at `started`; returns now."""
+    now = time.time()
+    if _phases is not None:
+        _phases.append((name, (now - started) * 1000))
+    return now
 
 
 def log_diagnostic(msg: str) -> None:
@@ -74,15 +110,20 @@ class CheckResult:
         self.message = message
         self.severity = severity  # info, warning, error
         self.fixable = fixable
+        self.duration_ms: Optional[float] = None  # set by run_checks
+        self.completed = True  # False: run_checks' stand-in for a timed-out/raising check
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        result = {
             'name': self.name,
             'passed': self.passed,
             'message': self.message,
             'severity': self.severity,
             'fixable': self.fixable,
         }
+        if self.duration_ms is not None:
+            result['duration_ms'] = self.duration_ms
+        return result
 
 
 # =============================================================================
@@ -473,12 +514,13 @@ def check_permission_accumulation(agent_path: Path) -> CheckResult:
     return CheckResult('permission_accumulation', True, 'within L500 thresholds')
 
 
-def check_reliance_manifest(agent_path: Path) -> CheckResult:
+def check_reliance_manifest(agent_path: Path, use_cache: bool = True) -> CheckResult:
     """R-BND-001-03 (v3.25, gh#1787): self-attest reliance-manifest conformance.
 
     Graceful: agents without a manifest (pre-adoption) PASS with an advisory
     message — absence is expected lag, not an error (L601). When both the
     manifest and its validator are present, the validator's verdict is the check.
+    use_cache=False neither reads nor writes the attestation cache.
     """
     manifest = agent_path / '.aget' / 'skill_reliance_manifest.yaml'
     validator = agent_path / 'scripts' / 'check_skill_reliance_manifest.py'
@@ -489,6 +531,18 @@ def check_reliance_manifest(agent_path: Path) -> CheckResult:
         return CheckResult('reliance_manifest', False,
                            'manifest present but validator missing (R-BND-001-03 wiring gap)',
                            severity='warning')
+    module = (check_skill_reliance_manifest.load_validator(validator)
+              if check_skill_reliance_manifest is not None else None)
+    if module is not None:
+        # In process, memoized by input mtimes: no interpreter start, and no
+        # YAML parse while nothing changed.
+        try:
+            res = module.attest(agent_path, use_cache=use_cache)
+            return CheckResult('reliance_manifest', res['ok'], res['summary'],
+                               severity='info' if res['ok'] else 'warning')
+        except Exception as e:
+            return CheckResult('reliance_manifest', False, f'validator error: {e}',
+                               severity='warning')
     import subprocess
     try:
         r = subprocess.run([sys.executable, str(validator)], capture_output=True,
@@ -503,9 +557,258 @@ def check_reliance_manifest(agent_path: Path) -> CheckResult:
                            severity='warning')
 
 
-def run_housekeeping(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
+# =============================================================================
+# Check Registry
+# =============================================================================
+
+class CheckSpec:
+    """A registered check: its result name, tags, and the paths it reads.
+
+    `reads` are agent-relative paths or glob patterns; a check's inputs are
+    unchanged while each one's mtime and size are (a directory's mtime
+    moves when entries are added, removed or renamed — what the counting
+    checks look at). A trailing '/' means only "is a directory" is read: the
+    check does not care what is inside (and .aget/'s mtime moves with every
+    cache write). `depends_on` names checks whose subject this one assumes;
+    selecting a check selects them too. `own_cache` marks a check that keeps
+    a cache of its own in the agent's tree; its fn takes `use_cache`.
+    """
+
+    def __init__(self, fn, name: str, tags: Tuple[str, ...], reads: Tuple[str, ...],
+                 depends_on: Tuple[str, ...] = (), own_cache: bool = False):
+        self.fn = fn
+        self.name = name
+        self.tags = tags
+        self.reads = reads
+        self.depends_on = depends_on
+        self.own_cache = own_cache
+
+    def bound(self, use_cache: bool):
+        """The check function, its own cache disabled unless use_cache."""
+        if use_cache or not self.own_cache:
+            return self.fn
+        return functools.update_wrapper(functools.partial(self.fn, use_cache=False), self.fn)
+
+    def fingerprint(self, agent_path: Path) -> list:
+        """[(input, mtime_ns, size)] — None for inputs that do not exist."""
+        stamps = []
+        for pattern in self.reads:
+            if pattern.endswith('/'):
+                stamps.append([pattern, (agent_path / pattern).is_dir()])
+                continue
+            paths = (sorted(agent_path.glob(pattern)) if any(c in pattern for c in '*?[')
+                     else [agent_path / pattern])
+            for path in paths:
+                try:
+                    st = path.stat()
+                    stamps.append([str(path), st.st_mtime_ns, st.st_size])
+                except OSError:
+                    stamps.append([str(path), None, None])
+        return stamps
+
+
+_ARCHETYPE_INDEX = 'aget/specs/ARCHETYPE_SKILLS_INDEX.yaml'
+
+# Serial order = report order. Tags: structure, governance, permissions, skills.
+CHECKS: List[CheckSpec] = [
+    CheckSpec(check_aget_directory, '.aget_directory', ('structure',), ('.aget/',)),
+    CheckSpec(check_version_json, 'version_json', ('structure',),
+              ('.aget/version.json',), ('.aget_directory',)),
+    CheckSpec(check_identity_json, 'identity_json', ('governance',),
+              ('.aget/identity.json',), ('.aget_directory',)),
+    CheckSpec(check_governance_directory, 'governance_directory', ('governance',),
+              ('governance/', 'governance/CHARTER.md', 'governance/MISSION.md',
+               'governance/SCOPE_BOUNDARIES.md')),
+    CheckSpec(check_evolution_directory, 'evolution_directory', ('structure',),
+              ('.aget/evolution', '.aget/evolution/index.json'), ('.aget_directory',)),
+    CheckSpec(check_5d_structure, '5d_structure', ('structure',),
+              ('.aget/persona/', '.aget/memory/', '.aget/reasoning/', '.aget/skills/',
+               '.aget/context/'), ('.aget_directory',)),
+    CheckSpec(check_sessions_directory, 'sessions_directory', ('structure',), ('sessions',)),
+    CheckSpec(check_planning_directory, 'planning_directory', ('structure',), ('planning',)),
+    CheckSpec(check_duplicate_ldoc_ids, 'duplicate_ldoc_ids', ('governance',),
+              ('.aget/evolution',), ('.aget_directory',)),
+    CheckSpec(check_config_size, 'config_size', ('governance',), ('AGENTS.md',)),
+    CheckSpec(check_structural_skill_frontmatter, 'structural_skill_frontmatter', ('skills',),
+              ('.claude/skills',) + tuple(f'.claude/skills/{skill}/SKILL.md'
+                                          for skill in D71_STRUCTURAL_SKILLS)),
+    CheckSpec(check_reliance_manifest, 'reliance_manifest', ('skills',),
+              ('.aget/skill_reliance_manifest.yaml', 'scripts/check_skill_reliance_manifest.py',
+               '.claude/skills', f'../{_ARCHETYPE_INDEX}', f'../aget-framework/{_ARCHETYPE_INDEX}',
+               str(Path.home() / 'github' / 'aget-framework' / _ARCHETYPE_INDEX)),
+              ('.aget_directory',), own_cache=True),
+    CheckSpec(check_permission_accumulation, 'permission_accumulation', ('permissions',),
+              ('.claude/settings.local.json', '.claude/settings.json')),
+]
+
+CHECK_STATE = Path('.aget') / 'cache' / 'health_check.json'
+CHECK_STATE_VERSION = 1
+
+
+def select_checks(only: Optional[List[str]] = None,
+                  tags: Optional[List[str]] = None) -> List[CheckSpec]:
+    """The registered checks named in `only` (result or function name) and/or
+    carrying any of `tags`, plus what they depend on, in registry order.
+    No filter selects everything. Raises ValueError for an unknown name or tag."""
+    if not only and not tags:
+        return list(CHECKS)
+    by_name = {}
+    for spec in CHECKS:
+        by_name[spec.name] = by_name[spec.fn.__name__] = \
+            by_name[spec.fn.__name__[len('check_'):]] = spec
+    known_tags = {tag for spec in CHECKS for tag in spec.tags}
+    unknown = [n for n in only or [] if n not in by_name] + \
+        [t for t in tags or [] if t not in known_tags]
+    if unknown:
+        raise ValueError(f"unknown check or tag: {', '.join(unknown)} (checks: "
+                         f"{', '.join(spec.name for spec in CHECKS)}; tags: "
+                         f"{', '.join(sorted(known_tags))})")
+    wanted = {by_name[n].name for n in only or []}
+    wanted |= {spec.name for spec in CHECKS if set(spec.tags) & set(tags or [])}
+    pending = list(wanted)
+    while pending:
+        for dep in by_name[pending.pop()].depends_on:
+            if dep not in wanted:
+                wanted.add(dep)
+                pending.append(dep)
+    return [spec for spec in CHECKS if spec.name in wanted]
+
+
+def _script_stamp() -> Optional[int]:
+    try:
+        return Path(__file__).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_check_state(agent_path: Path) -> Dict[str, Any]:
+    """Fingerprints and results of the last run of each check ({} if none or
+    written by another version of this script)."""
+    try:
+        state = json.loads((agent_path / CHECK_STATE).read_text())
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(state, dict) or state.get('version') != CHECK_STATE_VERSION
+            or state.get('script_mtime_ns') != _script_stamp()
+            or not isinstance(state.get('checks'), dict)):
+        return {}
+    return state['checks']
+
+
+def save_check_state(agent_path: Path, checks: Dict[str, Any]) -> None:
+    """Merge this run's entries into the state file; unwritable is fine (ADR-004)."""
+    path = agent_path / CHECK_STATE
+    state = {'version': CHECK_STATE_VERSION, 'script_mtime_ns': _script_stamp(),
+             'checks': {**load_check_state(agent_path), **checks}}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+# =============================================================================
+# Check Runner
+# =============================================================================
+
+CHECK_TIMEOUT = 30.0  # seconds per check; the reliance validator alone may take 15
+DEFAULT_JOBS = 8
+
+
+def run_checks(checks: list, agent_path: Path, jobs: Optional[int] = DEFAULT_JOBS,
+               timeout: Optional[float] = CHECK_TIMEOUT,
+               verbose: bool = False) -> List[CheckResult]:
+    """Run check functions concurrently; results in `checks` order.
+
+    The checks are independent (each reads its own part of the agent), and
+    several wait on I/O (a validator subprocess, globs, JSON parses), so up
+    to `jobs` run at once, started in list order on daemon threads. Each
+    check gets `timeout` seconds from its start (None: no limit); one still
+    running then is reported as a failed warning and its thread abandoned
+    (daemon threads never hold up exit), freeing its slot for the next
+    check. A check that raises is reported the same way, never aborting the
+    run (ADR-004). Each result carries its duration_ms.
     """
-    Run all housekeeping checks.
+    import queue
+    import threading
+    finished: queue.Queue = queue.Queue()
+    outcomes: Dict[int, tuple] = {}
+    jobs = max(1, jobs or len(checks))
+
+    def run(index, check_fn, started):
+        if verbose:
+            log_diagnostic(f"Running {check_fn.__name__}")
+        try:
+            outcome = (check_fn(agent_path), None)
+        except Exception as e:
+            outcome = (None, e)
+        finished.put((index, outcome, time.monotonic() - started))
+
+    def name_of(check_fn):
+        name = check_fn.__name__
+        return name[len('check_'):] if name.startswith('check_') else name
+
+    results: List[Optional[CheckResult]] = [None] * len(checks)
+    running: Dict[int, float] = {}      # index -> deadline (monotonic)
+    next_index = 0
+    while next_index < len(checks) or running:
+        while next_index < len(checks) and len(running) < jobs:
+            started = time.monotonic()
+            running[next_index] = float('inf') if timeout is None else started + timeout
+            threading.Thread(target=run, args=(next_index, checks[next_index], started),
+                             daemon=True, name=f'health-{checks[next_index].__name__}').start()
+            next_index += 1
+        wait = min(running.values()) - time.monotonic()
+        try:
+            index, (result, error), elapsed = finished.get(
+                timeout=None if wait == float('inf') else max(0.0, wait))
+        except queue.Empty:
+            now = time.monotonic()
+            for index in [i for i, deadline in running.items() if deadline <= now]:
+                del running[index]
+                result = CheckResult(name_of(checks[index]), False,
+                                     f'timed out after {timeout:g}s', severity='warning')
+                result.duration_ms = round(timeout * 1000, 1)
+                result.completed = False
+                results[index] = result
+            continue
+        if index not in running:
+            continue                    # a check already reported as timed out
+        del running[index]
+        if error is not None:
+            result = CheckResult(name_of(checks[index]), False, f'check raised: {error}',
+                                 severity='warning')
+            result.completed = False
+        result.duration_ms = round(elapsed * 1000, 1)
+        results[index] = result
+    return results
+
+
+def run_housekeeping(agent_path: Path, verbose: bool = False,
+                     jobs: Optional[int] = DEFAULT_JOBS,
+                     timeout: Optional[float] = CHECK_TIMEOUT,
+                     only: Optional[List[str]] = None, tags: Optional[List[str]] = None,
+                     changed_only: bool = False, use_cache: bool = True,
+                     record: bool = True) -> Dict[str, Any]:
+    """
+    Run all housekeeping checks (or those select_checks picks by `only`/`tags`).
+
+    Checks run concurrently (run_checks: `jobs` at a time, `timeout` seconds
+    each); the output order and summary counts are those of a serial run.
+    Each run records its checks' input fingerprints and results
+    (.aget/cache/health_check.json). With use_cache, a check whose inputs
+    are unchanged since it last ran is not re-run: its recorded result is
+    reported, marked `cached: true` (wind-down, /aget-check-health and hooks
+    re-check a tree that rarely moves between runs). The extension hook is
+    never cached. changed_only runs only the selected checks whose inputs
+    changed, listing the others under data['selection']['unchanged'].
+    record=False leaves the state file untouched (read-only sweeps of
+    another seat's tree). Unless both are set, checks with a cache of their
+    own (CheckSpec.own_cache) neither read nor write it.
+
+    Raises ValueError for an unknown check name or tag.
 
     Returns structured dict suitable for JSON or human output.
     """
@@ -523,40 +826,49 @@ def run_housekeeping(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
         'status': 'unknown',
     }
 
-    # Run all checks
-    checks = [
-        check_aget_directory,
-        check_version_json,
-        check_identity_json,
-        check_governance_directory,
-        check_evolution_directory,
-        check_5d_structure,
-        check_sessions_directory,
-        check_planning_directory,
-        check_duplicate_ldoc_ids,
-        check_config_size,
-        check_structural_skill_frontmatter,
-        check_reliance_manifest,
-        check_permission_accumulation,
-    ]
-
-    for check_fn in checks:
-        if verbose:
-            log_diagnostic(f"Running {check_fn.__name__}")
-
-        result = check_fn(agent_path)
-        data['checks'].append(result.to_dict())
+    specs = select_checks(only, tags)
+    fingerprints = {spec.name: spec.fingerprint(agent_path) for spec in specs}
+    if only or tags or changed_only:
+        data['selection'] = {'only': only or [], 'tags': tags or [],
+                             'changed_only': changed_only, 'unchanged': []}
+    last = load_check_state(agent_path) if use_cache or changed_only else {}
+    current = {spec.name for spec in specs
+               if (last.get(spec.name) or {}).get('fingerprint') == fingerprints[spec.name]}
+    if changed_only:
+        data['selection']['unchanged'] = [spec.name for spec in specs if spec.name in current]
+        specs = [spec for spec in specs if spec.name not in current]
+
+    # Checks whose inputs are unchanged since they last ran are served from
+    # the recorded result; only the rest run.
+    cached = {spec.name for spec in specs if use_cache and spec.name in current}
+    to_run = [spec for spec in specs if spec.name not in cached]
+    ran = dict(zip((spec.name for spec in to_run),
+                   run_checks([spec.bound(use_cache and record) for spec in to_run],
+                              agent_path, jobs=jobs, timeout=timeout, verbose=verbose)))
+    state = {}
+    for spec in specs:
+        if spec.name in cached:
+            check = {**last[spec.name]['result'], 'cached': True}
+        else:
+            result = ran[spec.name]
+            if _phases is not None:
+                _phases.append((f'check {result.name}', result.duration_ms))
+            check = result.to_dict()
+            if result.completed:    # a timed-out check must run again next time
+                state[spec.name] = {'fingerprint': fingerprints[spec.name], 'result': check}
+        data['checks'].append(check)
 
         data['summary']['total'] += 1
-        if result.passed:
+        if check['passed']:
             data['summary']['passed'] += 1
-        elif result.severity == 'warning':
+        elif check['severity'] == 'warning':
             data['summary']['warnings'] += 1
-        elif result.severity == 'error':
+        elif check['severity'] == 'error':
             data['summary']['errors'] += 1
 
-        if result.fixable:
+        if check['fixable']:
             data['summary']['fixable'] += 1
+    data['cache'] = {'enabled': use_cache, 'hits': len(cached), 'runs': len(to_run)}
 
     # Determine status
     if data['summary']['errors'] > 0:
@@ -566,6 +878,99 @@ def run_housekeeping(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
     else:
         data['status'] = 'healthy'
 
+    if record:
+        save_check_state(agent_path, state)
+    return data
+
+
+def load_health_check(path: Path):
+    """The health_check module at `path` if it declares this
+    HOUSEKEEPING_API_VERSION, else None — the policy the reliance validator
+    is loaded by (check_skill_reliance_manifest.load_declared): other copies
+    are never imported, and callers run them as a subprocess. This file is
+    returned as is.
+    """
+    try:
+        if Path(path).resolve() == Path(__file__).resolve():
+            return sys.modules[__name__]
+    except OSError:
+        return None
+    if check_skill_reliance_manifest is None:
+        return None
+    return check_skill_reliance_manifest.load_declared(
+        path, 'HOUSEKEEPING_API_VERSION', HOUSEKEEPING_API_VERSION, 'health_check')
+
+
+# =============================================================================
+# Fleet Sweep
+# =============================================================================
+
+def _sweep_seat(name: str, path: str, jobs: Optional[int],
+                timeout: Optional[float]) -> Dict[str, Any]:
+    """One seat of a fleet sweep (runs in a worker process)."""
+    agent_path = Path(path)
+    seat = {'name': name, 'path': path}
+    if not agent_path.exists():
+        return {**seat, 'status': 'unresolvable', 'reason': 'location does not exist'}
+    if not (agent_path / '.aget').is_dir():
+        return {**seat, 'status': 'unresolvable', 'reason': 'no .aget/ directory'}
+    try:
+        data = run_housekeeping(agent_path, jobs=jobs, timeout=timeout,
+                                use_cache=False, record=False)
+    except Exception as e:  # one broken seat must not sink the sweep
+        return {**seat, 'status': 'error', 'reason': f'health check raised: {e}'}
+    failed = [{'name': c['name'], 'severity': c['severity'], 'message': c['message']}
+              for c in data['checks'] if not c['passed']]
+    return {**seat, 'status': data['status'], 'summary': data['summary'], 'failed': failed}
+
+
+def run_fleet(agents: List[Tuple[str, Path]], workers: Optional[int] = None,
+              jobs: Optional[int] = DEFAULT_JOBS,
+              timeout: Optional[float] = CHECK_TIMEOUT) -> Dict[str, Any]:
+    """
+    Run the housekeeping checks on every seat in `agents` ([(name, path)], as
+    fleet_scope.load_agents returns them), `workers` seats at a time in a
+    process pool, and aggregate per-seat status and per-check failure counts.
+
+    The sweep is read-only: it runs this script's checks against each seat
+    without consulting or writing the seat's recorded results and without
+    the seat's extension hook. Seats whose location is missing or is not an
+    agent are reported as unresolvable, never silently dropped (gh#1813).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    data = {
+        'timestamp': datetime.now().isoformat(),
+        'seats': [],
+        'checks': {},
+        'summary': {'seats': len(agents), 'healthy': 0, 'warning': 0,
+                    'error': 0, 'unresolvable': 0},
+        'status': 'unknown',
+    }
+    if agents:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1,
+                                                 len(agents))) as pool:
+            futures = [pool.submit(_sweep_seat, name, str(path), jobs, timeout)
+                       for name, path in agents]
+            data['seats'] = [future.result() for future in futures]
+
+    for seat in data['seats']:
+        data['summary'][seat['status']] = data['summary'].get(seat['status'], 0) + 1
+        for check in seat.get('failed', []):
+            counts = data['checks'].setdefault(
+                check['name'], {'warnings': 0, 'errors': 0, 'seats': []})
+            counts['warnings' if check['severity'] == 'warning' else 'errors'] += 1
+            counts['seats'].append(seat['name'])
+    data['checks'] = dict(sorted(data['checks'].items(),
+                                 key=lambda item: -len(item[1]['seats'])))
+
+    summary = data['summary']
+    if summary['error']:
+        data['status'] = 'error'
+    elif summary['warning'] or summary['unresolvable']:
+        data['status'] = 'warning'
+    else:
+        data['status'] = 'healthy'
     return data
 
 
@@ -604,6 +1009,50 @@ def format_human_output(data: Dict[str, Any]) -> str:
         else:
             lines.append(f"  [{symbol}] {name}: {message}")
 
+    hits = data.get('cache', {}).get('hits')
+    if hits:
+        lines.append("")
+        lines.append(f"Served from cache (inputs unchanged): {hits} of {summary['total']} "
+                     "checks (--no-cache re-runs all)")
+
+    unchanged = data.get('selection', {}).get('unchanged')
+    if unchanged:
+        lines.append("")
+        lines.append(f"Unchanged since last run (not re-run): {', '.join(unchanged)}")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def format_fleet_output(data: Dict[str, Any]) -> str:
+    """Format a run_fleet result as a per-seat table for humans."""
+    summary = data['summary']
+    lines = ["\n=== AGET Fleet Health Report ===\n"]
+    if data.get('registry'):
+        lines.append(f"Registry: {data['registry']}")
+    lines.append(f"Status: {data['status'].upper()}")
+    lines.append(f"Seats: {summary['seats']} ({summary['healthy']} healthy, "
+                 f"{summary['warning']} warning, {summary['error']} error, "
+                 f"{summary['unresolvable']} unresolvable)")
+    lines.append("")
+    width = max([len(seat['name']) for seat in data['seats']] + [4])
+    lines.append(f"  {'Seat':<{width}}  {'Status':<12}  Checks")
+    for seat in data['seats']:
+        if 'summary' in seat:
+            detail = f"{seat['summary']['passed']}/{seat['summary']['total']} passed"
+            failed = ', '.join(check['name'] for check in seat['failed'])
+            if failed:
+                detail += f" ({failed})"
+        else:
+            detail = f"{seat['reason']}: {seat['path']}"
+        lines.append(f"  {seat['name']:<{width}}  {seat['status']:<12}  {detail}")
+
+    if data['checks']:
+        lines.append("")
+        lines.append("Failing checks across the fleet:")
+        for name, counts in data['checks'].items():
+            lines.append(f"  {name:<30} {len(counts['seats'])} seat(s) "
+                         f"({counts['errors']} error, {counts['warnings']} warning)")
     lines.append("")
     return "\n".join(lines)
 
@@ -622,10 +1071,18 @@ def call_extension_hook(agent_path, data, verbose=False):
     needing agent-specific checks had no hook point and patched the
     Framework_Artifact itself, which the next upgrade clobbered (a downstream fleet
     GATE-0 halt class).
+
+    Run through scripts/extension_hooks.py when present (per-hook deadline,
+    latency recorded as data['extension_hook']).
     """
     ext_path = agent_path / 'scripts' / 'health_check_ext.py'
     if not ext_path.exists():
         return data
+    if extension_hooks is not None:
+        return extension_hooks.run_hook(ext_path, 'health_check_ext', 'post_health', data,
+                                        timeout=extension_hooks.hook_timeout(agent_path),
+                                        label='health_check extension hook',
+                                        log=log_diagnostic if verbose else None)
     try:
         spec = importlib.util.spec_from_file_location('health_check_ext', str(ext_path))
         module = importlib.util.module_from_spec(spec)
@@ -641,7 +1098,41 @@ def call_extension_hook(agent_path, data, verbose=False):
     return data
 
 
+def run_fleet_cli(args) -> int:
+    """`--fleet`: sweep every seat fleet_scope resolves from the registry."""
+    if args.only or args.tags or args.changed:
+        print("Error: --fleet runs every check; --only/--tags/--changed apply to one agent",
+              file=sys.stderr)
+        return 3
+    try:
+        import fleet_scope
+    except ImportError:
+        print("Error: --fleet needs scripts/fleet_scope.py", file=sys.stderr)
+        return 3
+    registry = args.registry or fleet_scope.REGISTRY
+    try:
+        agents = fleet_scope.load_agents(registry)
+    except SystemExit as e:  # load_agents reports an unreadable registry this way
+        print(e.code, file=sys.stderr)
+        return 3
+
+    if args.verbose:
+        log_diagnostic(f"Fleet sweep: {len(agents)} seats from {registry}")
+    data = run_fleet(agents, workers=args.workers, jobs=args.jobs,
+                     timeout=args.check_timeout or None)
+    data['registry'] = str(registry)
+
+    if args.json:
+        print(json.dumps(data, indent=2 if args.pretty else None))
+    else:
+        print(format_fleet_output(data))
+    if args.verbose:
+        log_diagnostic(f"Fleet sweep complete in {(time.time() - _start_time) * 1000:.0f}ms")
+    return {'error': 2, 'warning': 1}.get(data['status'], 0)
+
+
 def main():
+    global _phases
     parser = argparse.ArgumentParser(
         description='AGET Housekeeping Protocol (v3.1 template)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -680,6 +1171,46 @@ Exit codes:
         action='store_true',
         help='Attempt to fix issues (not implemented yet)'
     )
+    parser.add_argument(
+        '--jobs', type=int, default=DEFAULT_JOBS,
+        help=f'Checks run at once (default: {DEFAULT_JOBS}; 1: one at a time)'
+    )
+    parser.add_argument(
+        '--only', type=lambda v: [n.strip() for n in v.split(',') if n.strip()],
+        help='Comma-separated checks to run (plus the checks they depend on)'
+    )
+    parser.add_argument(
+        '--tags', type=lambda v: [t.strip() for t in v.split(',') if t.strip()],
+        help='Comma-separated tags: structure, governance, permissions, skills'
+    )
+    parser.add_argument(
+        '--changed', action='store_true',
+        help='Run only the selected checks whose input paths changed since their last run'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Re-run every check instead of serving unchanged ones from the last run'
+    )
+    parser.add_argument(
+        '--list', action='store_true',
+        help='List registered checks with their tags and input paths, then exit'
+    )
+    parser.add_argument(
+        '--fleet', action='store_true',
+        help='Check every seat in the fleet registry (see fleet_scope.py) and aggregate'
+    )
+    parser.add_argument(
+        '--registry', type=Path,
+        help='FLEET_STATE.yaml for --fleet (default: as fleet_scope.py resolves it)'
+    )
+    parser.add_argument(
+        '--workers', type=int,
+        help='Seats checked at once with --fleet (default: CPU count)'
+    )
+    parser.add_argument(
+        '--check-timeout', type=float, default=CHECK_TIMEOUT,
+        help=f'Seconds a single check may take (default: {CHECK_TIMEOUT:g}; 0: no limit)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -693,6 +1224,21 @@ Exit codes:
 
     args = parser.parse_args()
 
+    if args.list:
+        for spec in CHECKS:
+            deps = f"  (after {', '.join(spec.depends_on)})" if spec.depends_on else ''
+            print(f"{spec.name:<30} [{', '.join(spec.tags)}]{deps}")
+            print(f"{'':<30} reads: {', '.join(spec.reads)}")
+        return 0
+    try:
+        select_checks(args.only, args.tags)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 3
+
+    if args.fleet:
+        return run_fleet_cli(args)
+
     # L039: Diagnostic timing
     if args.verbose:
         log_diagnostic("Starting housekeeping protocol")
@@ -718,11 +1264,21 @@ Exit codes:
     if args.verbose:
         log_diagnostic(f"Found agent at: {agent_path}")
 
+    # L039: keep this run's timings (.aget/telemetry/health_check.jsonl)
+    telemetry_run = (protocol_telemetry.start_run('health_check', agent_path, _start_time)
+                     if protocol_telemetry is not None else None)
+    _phases = []
+
     # Run housekeeping
-    data = run_housekeeping(agent_path, verbose=args.verbose)
+    data = run_housekeeping(agent_path, verbose=args.verbose, jobs=args.jobs,
+                            timeout=args.check_timeout or None, only=args.only,
+                            tags=args.tags, changed_only=args.changed,
+                            use_cache=not args.no_cache)
 
     # Extension hook (v3.26 C-26-05) — instance-specific checks join here
+    started = time.time()
     data = call_extension_hook(agent_path, data, verbose=args.verbose)
+    started = profile_phase('extension hook', started)
 
     if args.verbose:
         log_diagnostic(f"Housekeeping complete, status={data['status']}")
@@ -732,6 +1288,7 @@ Exit codes:
         print(json.dumps(data, indent=2 if args.pretty else None))
     else:
         print(format_human_output(data))
+    profile_phase('output', started)
 
     if args.verbose:
         elapsed = (time.time() - _start_time) * 1000
@@ -739,10 +1296,16 @@ Exit codes:
 
     # Exit code based on status
     if data['status'] == 'error':
-        return 2
+        exit_code = 2
     elif data['status'] == 'warning':
-        return 1
-    return 0
+        exit_code = 1
+    else:
+        exit_code = 0
+    if telemetry_run is not None:
+        for name, ms in _phases:
+            telemetry_run.add_phase(name, ms)
+        telemetry_run.finish(exit_code)
+    return exit_code
 
 
 if __name__ == '__main__':
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Protocol Telemetry - keep the L039 timings instead of printing them away
+
+wake_up.py, wind_down.py and health_check.py time their phases for
+--verbose / --profile-startup, but that goes to stderr and is lost. Each run
+now appends one JSON line to
+
+    .aget/telemetry/<protocol>.jsonl      (gitignored; append-only)
+
+    {"ts", "protocol", "aget_version", "exit_code", "total_ms",
+     "phases": {phase: ms}, "subprocesses", "files_opened", "dirs_listed",
+     "bytes_read"}
+
+Counters come from a process audit hook (sys.addaudithook): subprocess
+launches, file opens and directory listings since the run started. CPython
+raises no audit event for stat(), so stat calls are not counted; file opens
+and listings are the nearest I/O signal available. bytes_read is the
+process's rchar delta from /proc/self/io (None where that does not exist).
+
+Disabled by `"telemetry": {"enabled": false}` in .aget/config.json or by
+AGET_TELEMETRY=0. Writing a record never fails a protocol (ADR-004).
+
+Usage:
+    python3 protocol_telemetry.py --report                  # p50/p95 per phase, per version
+    python3 protocol_telemetry.py --report --protocol wake_up --last 50
+    python3 protocol_telemetry.py --report --json
+    python3 protocol_telemetry.py --report --dir /path/to/agent
+
+The report groups runs by aget_version in the order versions first appear,
+so the phase that slowed down after an upgrade stands out; a phase whose p50
+grew by more than --threshold (default 25%) over the previous version is
+marked REGRESSED.
+
+Related: wake_up.py, wind_down.py, health_check.py (L039 Diagnostic Efficiency)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+TELEMETRY_DIR = Path('.aget') / 'telemetry'
+
+_counts = {'subprocesses': 0, 'files_opened': 0, 'dirs_listed': 0}
+_hook_installed = False
+_AUDITED = {
+    'subprocess.Popen': 'subprocesses',
+    'open': 'files_opened',
+    'os.listdir': 'dirs_listed',
+    'os.scandir': 'dirs_listed',
+}
+
+
+def _audit(event, args):
+    key = _AUDITED.get(event)
+    if key is not None:
+        _counts[key] += 1
+
+
+def _rchar() -> Optional[int]:
+    try:
+        with open('/proc/self/io', 'rb') as f:
+            for line in f:
+                if line.startswith(b'rchar:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def enabled(agent_path: Path) -> bool:
+    if os.environ.get('AGET_TELEMETRY', '').strip().lower() in ('0', 'false', 'no', 'off'):
+        return False
+    try:
+        config = json.loads((agent_path / '.aget' / 'config.json').read_text())
+        return bool(config.get('telemetry', {}).get('enabled', True))
+    except (OSError, ValueError, AttributeError):
+        return True
+
+
+class ProtocolRun:
+    """One protocol run: phase marks plus counter deltas, appended on finish()."""
+
+    def __init__(self, protocol: str, agent_path: Path, started: Optional[float] = None):
+        global _hook_installed
+        if not _hook_installed:
+            sys.addaudithook(_audit)
+            _hook_installed = True
+        self.protocol = protocol
+        self.agent_path = agent_path
+        self.started = started if started is not None else time.time()
+        self.phases: Dict[str, float] = {}
+        self._mark = time.time()
+        self._rchar = _rchar()
+        self._counts = dict(_counts)    # after our own /proc read
+
+    def phase(self, name: str) -> None:
+        """Close the phase that began at the previous mark."""
+        now = time.time()
+        self.add_phase(name, (now - self._mark) * 1000)
+        self._mark = now
+
+    def add_phase(self, name: str, ms: float) -> None:
+        self.phases[name] = round(self.phases.get(name, 0.0) + ms, 1)
+
+    def finish(self, exit_code: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Append the record; returns it, or None if it could not be written."""
+        counts = {key: _counts[key] - self._counts[key] for key in _counts}
+        rchar = _rchar()
+        try:
+            version = json.loads((self.agent_path / '.aget' / 'version.json').read_text())
+            version = version.get('aget_version') if isinstance(version, dict) else None
+        except (OSError, ValueError):
+            version = None
+        record = {
+            'ts': datetime.now().isoformat(timespec='seconds'),
+            'protocol': self.protocol,
+            'aget_version': version,
+            'exit_code': exit_code,
+            'total_ms': round((time.time() - self.started) * 1000, 1),
+            'phases': self.phases,
+            **counts,
+            'bytes_read': (rchar - self._rchar
+                           if rchar is not None and self._rchar is not None else None),
+        }
+        path = self.agent_path / TELEMETRY_DIR / f'{self.protocol}.jsonl'
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a') as f:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+        except OSError:
+            return None
+        return record
+
+
+def start_run(protocol: str, agent_path: Path,
+              started: Optional[float] = None) -> Optional[ProtocolRun]:
+    """A ProtocolRun, or None when telemetry is disabled for this agent."""
+    if not enabled(agent_path):
+        return None
+    return ProtocolRun(protocol, agent_path, started)
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def load_records(agent_path: Path, protocol: Optional[str] = None) -> List[Dict[str, Any]]:
+    records = []
+    directory = agent_path / TELEMETRY_DIR
+    paths = [directory / f'{protocol}.jsonl'] if protocol else sorted(directory.glob('*.jsonl'))
+    for path in paths:
+        try:
+            lines = path.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue            # a torn last line from an interrupted run
+            if isinstance(record, dict) and isinstance(record.get('phases'), dict):
+                records.append(record)
+    return records
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(records: List[Dict[str, Any]], last: Optional[int] = None,
+              threshold: float = 25.0) -> Dict[str, Any]:
+    """{protocol: [{version, runs, phases: {phase: {n, p50, p95, regressed}}}]}."""
+    by_protocol: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        by_protocol.setdefault(record.get('protocol') or 'unknown', []).append(record)
+    summary: Dict[str, Any] = {}
+    for protocol, runs in sorted(by_protocol.items()):
+        runs.sort(key=lambda r: r.get('ts') or '')
+        if last:
+            runs = runs[-last:]
+        segments: Dict[str, List[Dict[str, Any]]] = {}
+        for run in runs:
+            segments.setdefault(run.get('aget_version') or 'unknown', []).append(run)
+        rows = []
+        previous = None
+        for version, group in segments.items():
+            samples: Dict[str, List[float]] = {}
+            for run in group:
+                samples.setdefault('total', []).append(run.get('total_ms') or 0.0)
+                for phase, ms in run['phases'].items():
+                    samples.setdefault(phase, []).append(ms)
+                for key in ('subprocesses', 'files_opened', 'dirs_listed'):
+                    if isinstance(run.get(key), int):
+                        samples.setdefault(f'#{key}', []).append(run[key])
+            phases = {}
+            for phase, values in samples.items():
+                stats = {'n': len(values), 'p50': percentile(values, 50),
+                         'p95': percentile(values, 95), 'regressed': False}
+                before = previous['phases'].get(phase) if previous else None
+                if before and not phase.startswith('#') and before['p50'] > 0:
+                    stats['regressed'] = stats['p50'] > before['p50'] * (1 + threshold / 100)
+                phases[phase] = stats
+            previous = {'version': version, 'runs': len(group), 'phases': phases}
+            rows.append(previous)
+        summary[protocol] = rows
+    return summary
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    if not summary:
+        return "No telemetry recorded yet (.aget/telemetry/ is empty)."
+    lines = []
+    for protocol, rows in summary.items():
+        lines.append(f"\n=== {protocol} ===")
+        for row in rows:
+            lines.append(f"\n  aget {row['version']} ({row['runs']} runs)")
+            lines.append(f"    {'phase':<36} {'n':>4} {'p50':>10} {'p95':>10}")
+            for phase, stats in row['phases'].items():
+                unit = '' if phase.startswith('#') else 'ms'
+                flag = '  REGRESSED' if stats['regressed'] else ''
+                lines.append(f"    {phase:<36} {stats['n']:>4} "
+                             f"{stats['p50']:>8g}{unit:<2} {stats['p95']:>8g}{unit:<2}{flag}".rstrip())
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Protocol timing telemetry report')
+    parser.add_argument('--report', action='store_true', help='Show p50/p95 per phase')
+    parser.add_argument('--dir', type=Path, default=Path.cwd(),
+                        help='Agent directory (default: current directory)')
+    parser.add_argument('--protocol', help='Only this protocol (wake_up, wind_down, health_check)')
+    parser.add_argument('--last', type=int, help='Only the most recent N runs per protocol')
+    parser.add_argument('--threshold', type=float, default=25.0,
+                        help='p50 growth (%%) over the previous version flagged REGRESSED')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+    args = parser.parse_args()
+    if not args.report:
+        parser.print_help()
+        return 2
+    summary = summarize(load_records(args.dir.resolve(), args.protocol), args.last,
+                        args.threshold)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_report(summary))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
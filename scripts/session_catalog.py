@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Session Catalog - the latest session note's Pending Work without listing sessions/
+
+wake_up.get_pending_work (gh#1285) surfaces the newest session note's
+`## Pending Work` section. Finding "newest" meant globbing sessions/*.md and
+stat-ing every note; with thousands of notes that dominated wake time. The
+catalog records each note's date, mtime and extracted Pending Work items, and
+which note is newest, so wake answers with two stats and one small JSON read.
+
+    .aget/cache/session_catalog.json      (gitignored with the rest of the cache)
+
+Kept outside sessions/ on purpose: writing it there would change the very
+directory mtime that validates it, and would show up as an untracked file in
+every agent's sessions/.
+
+Maintenance:
+  - wind_down.create_session_file calls record_note() after writing a note;
+    that reconciles the whole catalog with sessions/ (wind-down can afford
+    a listing) and extracts the new note's items.
+  - wake uses the catalog while sessions/'s mtime and the newest note's mtime
+    both match; otherwise (notes added, removed or renamed by anything else)
+    it rebuilds: one listing, extracting only the newest note.
+  - Limit: an older note edited IN PLACE (which changes neither mtime) is
+    not seen as newest until the next rebuild or wind-down.
+
+Usage:
+    python3 session_catalog.py                 # Rebuild for the current agent
+    python3 session_catalog.py --dir /path     # Rebuild for another agent
+    python3 session_catalog.py --show          # Print the latest note's entry
+
+Related: wake_up.py (get_pending_work), wind_down.py (create_session_file)
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CATALOG_RELPATH = Path('.aget') / 'cache' / 'session_catalog.json'
+CATALOG_VERSION = 1
+
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+
+def is_session_note(name: str) -> bool:
+    """sessions/*.md whose name starts with session_, any case (gh#1837 defect 1)."""
+    return name.endswith('.md') and name.lower().startswith('session_')
+
+
+def parse_pending_work(text: str) -> List[str]:
+    """Items under a note's `## Pending Work` header (bullets, or the first
+    plain line when there are none). Untruncated; callers apply their cap."""
+    in_section = False
+    items: List[str] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('## '):
+            if in_section:
+                break
+            if 'Pending Work' in stripped:
+                in_section = True
+            continue
+        if in_section:
+            if stripped.startswith(('- ', '* ', '+ ')):
+                items.append(stripped[2:].strip())
+            elif stripped and not stripped.startswith('#') and not items:
+                items.append(stripped)
+    return items
+
+
+def _note_entry(path: Path, mtime_ns: int, extract: bool) -> Dict[str, Any]:
+    m = _DATE_RE.search(path.name)
+    entry: Dict[str, Any] = {
+        'date': m.group(1) if m else datetime.fromtimestamp(mtime_ns / 1e9).strftime('%Y-%m-%d'),
+        'mtime_ns': mtime_ns,
+        'pending_work': None,       # None: not extracted (only the newest note must be)
+    }
+    if extract:
+        try:
+            entry['pending_work'] = parse_pending_work(path.read_text(encoding='utf-8'))
+        except (OSError, UnicodeDecodeError):
+            entry['pending_work'] = []
+    return entry
+
+
+def load_catalog(agent_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        catalog = json.loads((agent_path / CATALOG_RELPATH).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(catalog, dict) or catalog.get('version') != CATALOG_VERSION:
+        return None
+    return catalog
+
+
+def save_catalog(agent_path: Path, catalog: Dict[str, Any]) -> bool:
+    """Write atomically; an unwritable cache is not an error (ADR-004)."""
+    path = agent_path / CATALOG_RELPATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(catalog, indent=1))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        return False
+
+
+def rebuild_catalog(agent_path: Path, previous: Optional[Dict[str, Any]] = None,
+                    extract: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Reconcile the catalog with sessions/ (one listing plus a stat per note).
+
+    Entries whose mtime is unchanged keep their extracted items; the newest
+    note, and `extract` (a note name) if given, are (re-)extracted. Returns
+    None when there is no sessions/ directory.
+    """
+    sessions_dir = agent_path / 'sessions'
+    try:
+        dir_mtime_ns = sessions_dir.stat().st_mtime_ns
+        scanned = [(e.name, e.stat().st_mtime_ns) for e in os.scandir(sessions_dir)
+                   if is_session_note(e.name) and e.is_file()]
+    except OSError:
+        return None
+    known = (previous or {}).get('notes', {})
+    notes: Dict[str, Dict[str, Any]] = {}
+    latest = None
+    for name, mtime_ns in scanned:
+        entry = known.get(name)
+        if not entry or entry.get('mtime_ns') != mtime_ns or name == extract:
+            entry = _note_entry(sessions_dir / name, mtime_ns, extract=name == extract)
+        notes[name] = entry
+        if latest is None or mtime_ns > notes[latest]['mtime_ns']:
+            latest = name
+    if latest is not None and notes[latest]['pending_work'] is None:
+        notes[latest] = _note_entry(sessions_dir / latest, notes[latest]['mtime_ns'], True)
+    return {
+        'version': CATALOG_VERSION,
+        'dir_mtime_ns': dir_mtime_ns,
+        'latest': latest,
+        'notes': notes,
+    }
+
+
+def record_note(agent_path: Path, note_path: Path) -> Optional[Dict[str, Any]]:
+    """Catalog a note just written under sessions/ (called by wind-down)."""
+    catalog = rebuild_catalog(agent_path, load_catalog(agent_path), extract=Path(note_path).name)
+    if catalog is not None:
+        save_catalog(agent_path, catalog)
+    return catalog
+
+
+def latest_note(agent_path: Path) -> Optional[Dict[str, Any]]:
+    """The newest session note's entry plus its 'name', or None if there is none.
+
+    O(1) while the catalog is current: a stat of sessions/ and of the newest
+    note. Anything else rebuilds (and saves) the catalog first.
+    """
+    sessions_dir = agent_path / 'sessions'
+    catalog = load_catalog(agent_path)
+    if catalog is not None and catalog.get('latest'):
+        entry = catalog['notes'].get(catalog['latest'])
+        try:
+            current = (entry is not None and entry.get('pending_work') is not None
+                       and sessions_dir.stat().st_mtime_ns == catalog['dir_mtime_ns']
+                       and (sessions_dir / catalog['latest']).stat().st_mtime_ns
+                       == entry['mtime_ns'])
+        except OSError:
+            current = False
+        if current:
+            return {'name': catalog['latest'], **entry}
+    catalog = rebuild_catalog(agent_path, catalog)
+    if catalog is None:
+        return None
+    save_catalog(agent_path, catalog)
+    if catalog['latest'] is None:
+        return None
+    return {'name': catalog['latest'], **catalog['notes'][catalog['latest']]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild or show the session-notes catalog')
+    parser.add_argument('--dir', type=Path, default=Path.cwd(),
+                        help='Agent directory (default: current directory)')
+    parser.add_argument('--show', action='store_true', help="Print the latest note's entry")
+    args = parser.parse_args()
+    agent_path = args.dir.resolve()
+    if args.show:
+        print(json.dumps(latest_note(agent_path), indent=2))
+        return 0
+    catalog = rebuild_catalog(agent_path, load_catalog(agent_path))
+    if catalog is None:
+        print(f"Error: no sessions/ directory under {agent_path}", file=sys.stderr)
+        return 1
+    save_catalog(agent_path, catalog)
+    print(f"Cataloged {len(catalog['notes'])} session notes -> {CATALOG_RELPATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -25,17 +25,31 @@ Related: L187 (Silent execution), L335 (Memory Architecture), L761, L762
 Usage:
     python3 study_topic.py --topic "wind down"       # Research wind down
     python3 study_topic.py --topic "release" --json  # JSON output
+    python3 study_topic.py --topic "spec" --jobs 8   # Parallel surface search
+    python3 study_topic.py --build-index             # (Re)build the search index
+    python3 study_topic.py --topic "wake" --index    # Pre-filter through the index
+    python3 study_topic.py --daemon &                # Keep the corpus warm
     python3 study_topic.py --verify                  # Migration verification
 """
 
 import argparse
+import contextlib
+import functools
 import importlib.util
+import io
 import json
+import os
 import re
 import sys
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import extension_hooks  # scripts/extension_hooks.py: cached hook modules, deadline
+except ImportError:         # older instance scripts/ (ADR-004): in-script hook call
+    extension_hooks = None
+
 
 def get_agent_root():
     """Get the agent root directory."""
@@ -103,16 +117,19 @@ def compute_purpose_boost(file_path_str, purpose_globs):
     return 1.0
 
 
-def compute_domain_boost(content, domain_keywords):
+def compute_domain_boost(content, domain_keywords, lowered=None):
     """Compute domain relevance boost based on keyword presence.
 
-    Returns 1.0 + 0.25 per matching keyword (max 2.0).
+    Returns 1.0 + 0.25 per matching keyword (max 2.0). `lowered` is
+    content.lower() when the caller already has it (content cache).
 
     Implements: CAP-SESSION-007-07 (domain relevance weighting)
     """
     if not domain_keywords:
         return 1.0
-    matches = sum(1 for kw in domain_keywords if kw.lower() in content.lower())
+    if lowered is None:
+        lowered = content.lower()
+    matches = sum(1 for kw in domain_keywords if kw.lower() in lowered)
     return min(2.0, 1.0 + matches * 0.25)
 
 
@@ -206,6 +223,279 @@ def composite_score(item: dict) -> float:
             * (1 + math.log2(count)))
 
 
+_NEWLINE_RE = re.compile('\n')
+_SHORT_SUFFIXES = ('', 's', 'es', 'ed', 'ing')     # mirrors _token_pattern
+# re.IGNORECASE equates four non-ASCII code points with ASCII letters that
+# str.lower() alone does not fold onto them (\u0130 \u0131 \u017f \u212a).
+# Fold them explicitly, so that for ASCII keywords a case-sensitive match over
+# _fold(text) is exactly an IGNORECASE match over text (length-preserving, and
+# \w/\b classification is unchanged by the fold).
+_IGNORECASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i',
+                                   '\u017f': 's', '\u212a': 'k'})
+
+
+def _fold(text: str) -> str:
+    """Case-fold with re.IGNORECASE semantics for ASCII keywords."""
+    return text.translate(_IGNORECASE_FOLDS).lower()
+
+
+def _match_forms(kw: str) -> list:
+    """Every literal a _token_pattern(kw) match can span, case-folded."""
+    folded = kw.lower()
+    if len(kw) <= SHORT_TOKEN_LEN:
+        return [folded + suffix for suffix in _SHORT_SUFFIXES]
+    return [folded]
+
+
+def _literals_overlap(a: str, b: str) -> bool:
+    """True if an occurrence of a and one of b can share a character."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k])
+               for k in range(1, min(len(a), len(b))))
+
+
+@functools.lru_cache(maxsize=128)
+def _combined_matcher(keywords: tuple):
+    """One alternation regex that finds every keyword in a single pass.
+
+    The alternation is guarded by a lookahead on the keywords' first
+    characters, so the engine only tries the alternatives at plausible
+    offsets (a bare alternation of boundary-anchored branches is slower than the
+    separate scans it replaces). Returns None when two keywords' matches could
+    overlap ("lesson" and "lessons", or a repeated raw token): an alternation
+    consumes the first alternative at a position, while independent scans
+    count both, so per-keyword scans are the only way to keep match_count
+    identical.
+    """
+    if len(keywords) < 2:
+        return None
+    forms = [_match_forms(kw) for kw in keywords]
+    for i in range(len(keywords)):
+        for j in range(i + 1, len(keywords)):
+            if any(_literals_overlap(a, b) for a in forms[i] for b in forms[j]):
+                return None
+    firsts = ''.join(sorted({re.escape(kw[0]) for kw in keywords}))
+    alternation = '|'.join(f'({_token_pattern(kw)})' for kw in keywords)
+    return re.compile(f'(?=[{firsts}])(?:{alternation})')
+
+
+def _match_starts(keywords: tuple, record, case_insensitive: bool) -> list:
+    """Per keyword, the start offsets _token_pattern(kw) matches in the
+    record's haystack (leftmost, non-overlapping — exactly what re.finditer
+    per keyword gives).
+
+    ASCII keywords are matched case-sensitively against one _fold() of the
+    haystack instead of with re.IGNORECASE; non-ASCII keywords keep the
+    IGNORECASE scans, whose case-equivalence classes str.lower() cannot vouch
+    for.
+    """
+    flags = 0
+    haystack = record.haystack
+    if case_insensitive:
+        if all(kw.isascii() for kw in keywords):
+            haystack = record.folded_haystack
+            keywords = tuple(kw.lower() for kw in keywords)
+        else:
+            flags = re.IGNORECASE
+    matcher = _combined_matcher(keywords) if not flags and all(keywords) else None
+    if matcher is None:
+        return [[m.start() for m in re.finditer(_token_pattern(kw), haystack, flags)]
+                for kw in keywords]
+    starts = [[] for _ in keywords]
+    for m in matcher.finditer(haystack):
+        starts[m.lastindex - 1].append(m.start())
+    return starts
+
+
+class _LineTable:
+    """Offset -> line number via bisect over newline offsets.
+
+    The table is filled lazily, only as far as the largest offset asked about:
+    contexts need the first three distinct lines, so a large spec YAML is
+    neither split nor scanned past them.
+    """
+
+    def __init__(self, content: str):
+        import threading
+        self.content = content
+        self.newlines = []
+        self._scan = _NEWLINE_RE.finditer(content)
+        self._scanned = 0           # every newline before this offset is known
+        self._lock = threading.Lock()   # shared via the content cache (--jobs)
+
+    def line_of(self, offset: int) -> int:
+        with self._lock:
+            while self._scanned <= offset:
+                m = next(self._scan, None)
+                if m is None:
+                    self._scanned = len(self.content) + 1
+                    break
+                self.newlines.append(m.start())
+                self._scanned = m.start() + 1
+        return bisect_left(self.newlines, offset)
+
+    def text(self, line: int) -> str:
+        """Text of a line already reached by line_of()."""
+        begin = self.newlines[line - 1] + 1 if line else 0
+        end = self.newlines[line] if line < len(self.newlines) else len(self.content)
+        return self.content[begin:end]
+
+
+def _filename_text(file_path: Path) -> str:
+    """Filename-index (instance fix 2026-06-26, canonicalized v3.26 C-26-11):
+    filename tokens (raw stem + slug-normalized) join the searchable text, so a
+    topic equal to an artifact's name surfaces that artifact even when the body
+    never echoes the slug. Recall-half of audit R2/#1757; the rank-half is
+    FILENAME_BOOST in search_file_for_topic."""
+    return file_path.stem + ' ' + re.sub(r'[_\-.]+', ' ', file_path.stem)
+
+
+_UNSET = object()
+
+
+class FileContent:
+    """One file's text plus the fields finders derive from it.
+
+    Each derived field is computed on first use and kept, so within a run a
+    file is read, folded, lowercased and heading-probed at most once however
+    many finders, keywords or domain keywords touch it.
+    """
+
+    def __init__(self, file_path: Path, text: str):
+        self.path = file_path
+        self.text = text
+        self._haystack = None
+        self._folded = None
+        self._lower = None
+        self._lines = None
+        self._title = _UNSET
+        self._plan_is_active = None
+
+    @property
+    def haystack(self) -> str:
+        """Body plus filename tokens — what keywords are matched against."""
+        if self._haystack is None:
+            self._haystack = self.text + '\n' + _filename_text(self.path)
+        return self._haystack
+
+    @property
+    def folded_haystack(self) -> str:
+        if self._folded is None:
+            self._folded = _fold(self.haystack)
+        return self._folded
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def lines(self) -> _LineTable:
+        if self._lines is None:
+            self._lines = _LineTable(self.text)
+        return self._lines
+
+    @property
+    def title(self):
+        """First `# ` heading, or None."""
+        if self._title is _UNSET:
+            m = _HEADING_RE.search(self.text)
+            self._title = m.group(1) if m else None
+        return self._title
+
+    @property
+    def plan_is_active(self) -> bool:
+        if self._plan_is_active is None:
+            self._plan_is_active = self._probe_plan_status()
+        return self._plan_is_active
+
+    def _probe_plan_status(self) -> bool:
+        # v3.25 C-25-14 (gh#1809 + gh#1791): case-insensitive, Plan_Status-first.
+        # Plans write "In Progress" (title case) — the old upper-case-only probe
+        # rendered every live plan [inactive]. Prefer the disambiguated
+        # Plan_Status header (CAP-PP-003); fall back to legacy header Status,
+        # then to whole-content scan for pre-template-2.1 plans.
+        m = (re.search(r'\*\*Plan_Status\*\*:\s*([^\n]*)', self.text)
+             or re.search(r'\*\*Status\*\*:\s*([^\n]*)', self.text))
+        probe = m.group(1) if m else self.text
+        return 'IN PROGRESS' in probe.upper()
+
+
+class ContentCache:
+    """Per-run content cache: path -> FileContent, shared by all finders and
+    by the index refresh. Unreadable files are not cached (each caller keeps
+    its own fail-soft handling of the read error).
+
+    validate=True is for a cache that outlives one run (the query daemon):
+    every hit is checked against the file's current size and mtime, and a
+    changed file is re-read.
+    """
+
+    def __init__(self, validate: bool = False):
+        self.validate = validate
+        self._records = {}
+        self._stamps = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def get(self, file_path: Path) -> FileContent:
+        key = str(file_path)
+        record = self._records.get(key)
+        if self.validate:
+            st = file_path.stat()
+            stamp = (st.st_size, st.st_mtime_ns)
+            if self._stamps.get(key) != stamp:
+                record = None
+        if record is None:
+            record = FileContent(file_path, file_path.read_text())
+            self._records[key] = record
+            if self.validate:
+                self._stamps[key] = stamp
+        return record
+
+    def prune(self, keep) -> None:
+        """Drop every record whose path is not in keep."""
+        for key in [k for k in self._records if k not in keep]:
+            del self._records[key]
+            self._stamps.pop(key, None)
+
+
+_CONTENT_CACHE = None
+
+
+def activate_content_cache(cache):
+    """Share cache across this run's reads (None: every read hits the disk)."""
+    global _CONTENT_CACHE
+    _CONTENT_CACHE = cache
+
+
+def read_content(file_path: Path) -> FileContent:
+    """File content through the active cache. Raises like Path.read_text."""
+    if _CONTENT_CACHE is not None:
+        return _CONTENT_CACHE.get(file_path)
+    return FileContent(file_path, file_path.read_text())
+
+
+def _display_path(file_path: Path) -> str:
+    """Path as reported in findings: agent-root-relative, else absolute.
+
+    `relative_to` RAISES for any path outside the agent root, and that is very
+    likely why the spec tier was never wired despite being advertised in
+    SURFACES_SEARCHED since gh#1580: the canonical contract tier lives at
+    `../aget/specs/` (AGENTS.md §Canonical Path Resolution), one level ABOVE the
+    agent root, so the first attempt to search it would have crashed the whole
+    run. A helper that cannot express a path outside the repo silently bounds
+    every surface to the repo.
+    """
+    try:
+        return str(file_path.relative_to(get_agent_root()))
+    except ValueError:
+        return str(file_path)          # cross-repo (canonical tier) — keep absolute
+
+
 def search_file_for_topic(file_path: Path, topic: str, case_insensitive: bool = True,
                           domain_keywords: list = None) -> dict:
     """Search a file for topic matches.
@@ -219,77 +509,59 @@ def search_file_for_topic(file_path: Path, topic: str, case_insensitive: bool =
     Returns:
         Dict with match info or None if no match
     """
+    # Index pre-filter: a fresh index entry that provably cannot satisfy the
+    # keyword/coverage contract skips the read entirely. Anything the index
+    # cannot vouch for falls through to the full scan below.
+    if _ACTIVE_INDEX is not None and not _ACTIVE_INDEX.may_match(file_path, topic):
+        return None
     try:
-        content = file_path.read_text()
-        flags = re.IGNORECASE if case_insensitive else 0
-
-        # Filename-index (instance fix 2026-06-26, canonicalized v3.26 C-26-11):
-        # filename tokens (raw stem + slug-normalized) join the searchable text,
-        # so a topic equal to an artifact's name surfaces that artifact even
-        # when the body never echoes the slug. Recall-half of audit R2/#1757;
-        # the rank-half is FILENAME_BOOST below.
-        fname_text = file_path.stem + ' ' + re.sub(r'[_\-.]+', ' ', file_path.stem)
-        haystack = content + '\n' + fname_text
+        record = read_content(file_path)
+        content = record.text
 
         # Token hygiene (v3.26 C-26-11): stopwords/dupes dropped, possessive folded
         keywords = prepare_keywords(topic)
         if len(keywords) <= 1:
             single = keywords[0] if keywords else topic
-            matches = list(re.finditer(_token_pattern(single), haystack, flags))
+            starts = _match_starts((single,), record, case_insensitive)[0]
         else:
-            # Multi-keyword: search each independently, require majority coverage
-            keyword_matches = {}
-            all_matches = []
-            for kw in keywords:
-                kw_matches = list(re.finditer(_token_pattern(kw), haystack, flags))
-                if kw_matches:
-                    keyword_matches[kw] = len(kw_matches)
-                    all_matches.extend(kw_matches)
+            # Multi-keyword: count each independently, require majority coverage
+            starts_by_kw = _match_starts(tuple(keywords), record, case_insensitive)
+            keyword_matches = {kw: len(kw_starts)
+                               for kw, kw_starts in zip(keywords, starts_by_kw) if kw_starts}
             # Require at least 50% of (hygiened) keywords present
             min_required = max(1, (len(keywords) + 1) // 2) if len(keywords) >= 2 else 1
             if len(keyword_matches) < min(min_required, len(keywords)):
                 return None
-            matches = all_matches
+            starts = [pos for kw_starts in starts_by_kw for pos in kw_starts]
 
-        if not matches:
+        if not starts:
             return None
 
-        # Extract context lines for first few matches
-        lines = content.split('\n')
+        # Extract context lines for first few matches (keyword order, then
+        # position — the order the per-keyword scans always produced)
+        line_table = record.lines
         contexts = []
         seen_lines = set()
-        for match in matches:
-            if match.start() >= len(content):
+        for start in starts:
+            if start >= len(content):
                 continue  # filename-derived match; no body context to show
-            line_start = content.count('\n', 0, match.start())
+            line_start = line_table.line_of(start)
             if line_start in seen_lines:
                 continue
             seen_lines.add(line_start)
-            if line_start < len(lines):
-                context_line = lines[line_start].strip()
-                if len(context_line) > 100:
-                    context_line = context_line[:100] + '...'
-                contexts.append({
-                    'line': line_start + 1,
-                    'context': context_line
-                })
+            context_line = line_table.text(line_start).strip()
+            if len(context_line) > 100:
+                context_line = context_line[:100] + '...'
+            contexts.append({
+                'line': line_start + 1,
+                'context': context_line
+            })
             if len(contexts) >= 3:
                 break
 
-        # `relative_to` RAISES for any path outside the agent root, and that is
-        # very likely why the spec tier was never wired despite being advertised
-        # in SURFACES_SEARCHED since gh#1580: the canonical contract tier lives at
-        # `../aget/specs/` (AGENTS.md §Canonical Path Resolution), one level ABOVE
-        # the agent root, so the first attempt to search it would have crashed the
-        # whole run. A helper that cannot express a path outside the repo silently
-        # bounds every surface to the repo.
-        try:
-            rel = str(file_path.relative_to(get_agent_root()))
-        except ValueError:
-            rel = str(file_path)          # cross-repo (canonical tier) — keep absolute
         result = {
-            'file': rel,
-            'match_count': len(matches),
+            'file': _display_path(file_path),
+            'match_count': len(starts),
             'contexts': contexts
         }
         # Add keyword coverage for multi-word ranking
@@ -297,20 +569,714 @@ def search_file_for_topic(file_path: Path, topic: str, case_insensitive: bool =
             result['keyword_coverage'] = len(keyword_matches) / len(keywords)
         # Add domain boost if keywords provided (CAP-SESSION-007-07)
         if domain_keywords:
-            result['domain_boost'] = compute_domain_boost(content, domain_keywords)
+            result['domain_boost'] = compute_domain_boost(content, domain_keywords,
+                                                          lowered=record.lower)
         # Filename boost (audit R2, #1757): a token in the file's own name is
         # the strongest single relevance feature in the corpus.
         stem = file_path.stem.lower()
         if any(kw.lower() in stem for kw in keywords):
             result['filename_boost'] = FILENAME_BOOST
-        result['score'] = composite_score(result)
+        result['score'] = _ACTIVE_RANKER(result)
         return result
     except (OSError, UnicodeDecodeError):
         return None
 
 
+STREAM_BLOCK_CHARS = 1 << 20      # sessions are read in ~1M-char, line-aligned blocks
+STREAM_CONTEXT_LINES = 6          # distinct lines kept per keyword (see below)
+_PRUNED = object()                # search_file_streaming: abandoned, never scored
+
+
+class _TextBlock:
+    """A slice of text with the attributes _match_starts reads."""
+
+    def __init__(self, text: str):
+        self.haystack = text
+        self._folded = None
+
+    @property
+    def folded_haystack(self) -> str:
+        if self._folded is None:
+            self._folded = _fold(self.haystack)
+        return self._folded
+
+
+def search_file_streaming(file_path: Path, topic: str, domain_keywords: list = None,
+                          stop_at_or_below: float = None,
+                          block_chars: int = STREAM_BLOCK_CHARS) -> dict:
+    """search_file_for_topic in bounded memory: same result, field for field.
+
+    The file is read in line-aligned blocks (no match spans a newline, and a
+    block edge is a newline, so \\b and counts are unchanged) and never enters
+    the content cache. Per keyword only the count and the first
+    STREAM_CONTEXT_LINES distinct lines are kept: contexts take at most three
+    lines, walking keywords in order and skipping lines already taken, so no
+    keyword can need a line beyond its sixth distinct one.
+
+    stop_at_or_below: under the composite ranker, abandon the file (_PRUNED) as
+    soon as its best still-reachable score cannot exceed this threshold —
+    the top-k cutoff of a caller that would discard it anyway.
+    """
+    if _ACTIVE_INDEX is not None and not _ACTIVE_INDEX.may_match(file_path, topic):
+        return None
+    keywords = prepare_keywords(topic)
+    terms = tuple(keywords) if len(keywords) > 1 else ((keywords[0] if keywords else topic),)
+    counts = [0] * len(terms)
+    first_lines = [{} for _ in terms]            # line index -> stripped text
+    pending_domain = {kw.lower() for kw in domain_keywords or ()}
+    found_domain = set()
+    stem = file_path.stem.lower()
+    filename_boost = FILENAME_BOOST if any(kw.lower() in stem for kw in keywords) else 1.0
+    can_stop = stop_at_or_below is not None and _ACTIVE_RANKER is composite_score
+    best_domain = min(2.0, 1.0 + 0.25 * len(domain_keywords)) if domain_keywords else 1.0
+
+    def cannot_beat(match_count_bound):
+        # Best case for the file: every keyword and domain keyword present.
+        return composite_score({'match_count': match_count_bound, 'domain_boost': best_domain,
+                                'filename_boost': filename_boost}) <= stop_at_or_below
+
+    # A fresh index entry bounds the match count before any byte is read.
+    if can_stop and _ACTIVE_INDEX is not None:
+        bound = _ACTIVE_INDEX.match_bound(file_path, terms)
+        if bound is not None and cannot_beat(bound):
+            return _PRUNED
+
+    # Filename tokens first: their count is known before any body byte is read.
+    for i, starts in enumerate(_match_starts(terms, _TextBlock(_filename_text(file_path)), True)):
+        counts[i] += len(starts)
+
+    try:
+        remaining = file_path.stat().st_size          # bytes >= chars: a safe bound
+        with open(file_path) as f:                    # same decoding as read_text
+            line_base, carry = 0, ''
+            while True:
+                chunk = f.read(block_chars)
+                text = carry + chunk
+                if chunk:
+                    cut = text.rfind('\n') + 1
+                    text, carry = text[:cut], text[cut:]
+                    if not text:
+                        continue                      # one very long line: keep reading
+                else:
+                    carry = ''
+                block = _TextBlock(text)
+                table = _LineTable(text)
+                for i, starts in enumerate(_match_starts(terms, block, True)):
+                    counts[i] += len(starts)
+                    kept = first_lines[i]
+                    for start in starts:
+                        if len(kept) >= STREAM_CONTEXT_LINES:
+                            break
+                        n = table.line_of(start)
+                        if line_base + n not in kept:
+                            kept[line_base + n] = table.text(n).strip()
+                if pending_domain:
+                    lowered = text.lower()
+                    found_domain |= {kw for kw in pending_domain if kw in lowered}
+                    pending_domain -= found_domain
+                line_base += text.count('\n')
+                remaining -= len(chunk)        # chars <= bytes: stays an upper bound
+                if not chunk:
+                    break
+                # Without an index bound: the rest of the file, all matches.
+                # `carry` has been read but not scanned yet, so it counts too.
+                unscanned = max(0, remaining) + len(carry)
+                if can_stop and cannot_beat(
+                        sum(counts) + sum(unscanned // max(1, len(t)) for t in terms)):
+                    return _PRUNED
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    keyword_matches = {kw: n for kw, n in zip(terms, counts) if n}
+    if len(keywords) > 1:
+        min_required = max(1, (len(keywords) + 1) // 2)
+        if len(keyword_matches) < min(min_required, len(keywords)):
+            return None
+    if not any(counts):
+        return None
+
+    contexts = []
+    seen_lines = set()
+    for kept in first_lines:
+        for n, line in kept.items():
+            if n in seen_lines:
+                continue
+            seen_lines.add(n)
+            contexts.append({'line': n + 1,
+                             'context': line[:100] + '...' if len(line) > 100 else line})
+            if len(contexts) >= 3:
+                break
+        if len(contexts) >= 3:
+            break
+
+    result = {
+        'file': _display_path(file_path),
+        'match_count': sum(counts),
+        'contexts': contexts
+    }
+    if len(keywords) > 1:
+        result['keyword_coverage'] = len(keyword_matches) / len(keywords)
+    if domain_keywords:
+        result['domain_boost'] = min(2.0, 1.0 + 0.25 * sum(
+            1 for kw in domain_keywords if kw.lower() in found_domain))
+    if filename_boost != 1.0:
+        result['filename_boost'] = filename_boost
+    result['score'] = _ACTIVE_RANKER(result)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Persistent inverted index
+#
+# Every study used to re-read and re-regex the whole KB. The index records, per
+# file, which word tokens occur and on which lines, so a study can rule out the
+# files that cannot satisfy the keyword/coverage contract without opening them.
+# It is a conservative PRE-FILTER, never a second scorer: every candidate still
+# goes through search_file_for_topic unchanged, which is what keeps the ranking
+# contract (composite_score) bit-for-bit. A file the index cannot vouch for —
+# unindexed, stat changed since indexing, or a keyword the token model cannot
+# express — is simply scanned.
+# ---------------------------------------------------------------------------
+
+INDEX_SCHEMA_VERSION = 3     # 3: per-posting field counts instead of line lists
+INDEX_RELPATH = Path('.aget') / 'cache' / 'study_topic_index.json'
+
+# Structured twin of SURFACES_SEARCHED (plus the opt-in sessions/ surface):
+# (root relative to the agent root, globs). Indexing a superset of what the
+# finders open is harmless; indexing a subset would only cost a scan.
+INDEXED_SURFACES = [
+    ('.aget/evolution', ('**/*.md',)),
+    ('docs/patterns', ('**/*.md',)),
+    ('patterns', ('**/*.md',)),
+    ('planning', ('PROJECT_PLAN*.md',)),
+    ('sops', ('SOP_*.md',)),
+    ('governance', ('*.md',)),
+    ('knowledge', ('**/*.md', '**/*.yaml')),
+    ('ontology', ('**/*.md', '**/*.yaml')),
+    ('specs', ('**/*.md', '**/*.yaml')),
+    ('.aget/specs', ('**/*.md', '**/*.yaml')),
+    ('../aget/specs', ('**/*.md', '**/*.yaml')),
+    ('inbox', ('**/*.md',)),
+    ('sessions', ('*.md',)),
+]
+# Indexed only for --include-sessions studies: a default study never searches
+# them. Their entries outlive a default refresh (it does not walk them).
+SESSION_SURFACES = ('sessions',)
+# Surfaces find_sessions streams: never held whole, so the index reads them
+# around the per-run content cache instead of filling it.
+STREAMED_SURFACES = ('sessions/',)
+
+
+def _read_for_index(file_path: Path) -> str:
+    if _display_path(file_path).startswith(STREAMED_SURFACES):
+        return file_path.read_text()
+    return read_content(file_path).text
+
+
+_WORD_RE = re.compile(r'\w+')
+_INDEXABLE_KEYWORD_RE = re.compile(r'[A-Za-z0-9_]+')
+
+
+def _content_hash(content: str) -> str:
+    import hashlib
+    return hashlib.sha1(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+_HEADING_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)     # FileContent.title's probe
+
+
+def _first_heading_line(content: str) -> int:
+    """1-based line of the first `# ` heading, 0 if there is none."""
+    m = _HEADING_RE.search(content)
+    return content.count('\n', 0, m.start()) + 1 if m else 0
+
+
+def _tokenize_for_index(content: str, file_path: Path) -> dict:
+    """Folded token -> [stem, heading, body] occurrence counts, the three
+    BM25F fields (stem: filename-derived text; heading: the first `# ` line).
+
+    Tokens are maximal \\w runs over the same haystack search_file_for_topic
+    builds, so a keyword made of word characters can only ever match inside
+    one token: whole-token for short keywords (\\b-anchored), substring for
+    long ones. Where in the body a token occurs is not kept: the scan that
+    follows the pre-filter finds the lines again.
+    """
+    heading = _first_heading_line(content)
+    terms = {}
+    for lineno, line in enumerate(content.split('\n'), 1):
+        field = 1 if lineno == heading else 2
+        for tok in _WORD_RE.findall(line):
+            terms.setdefault(_fold(tok), [0, 0, 0])[field] += 1
+    for tok in _WORD_RE.findall(_filename_text(file_path)):
+        terms.setdefault(_fold(tok), [0, 0, 0])[0] += 1
+    return terms
+
+
+def _pack_posting(counts: list):
+    """Posting value as stored: the body count alone when the token occurs
+    only in the body (most postings), else the [stem, heading, body] list."""
+    return counts[2] if not counts[0] and not counts[1] else counts
+
+
+def _field_counts(posting) -> tuple:
+    """(stem, heading, body) counts of a stored (or unpacked) posting."""
+    return (0, 0, posting) if isinstance(posting, int) else tuple(posting)
+
+
+def _field_lengths(terms: dict) -> list:
+    lengths = [0, 0, 0]
+    for counts in terms.values():
+        for i, n in enumerate(counts):
+            lengths[i] += n
+    return lengths
+
+
+class StudyIndex:
+    """On-disk inverted index over the study surfaces (.aget/cache/).
+
+    Layout (JSON): files maps a display path (the same string findings
+    report) to {'id', 'size', 'mtime_ns', 'sha1', 'tokens', 'lengths'} —
+    lengths are the (stem, heading, body) token counts BM25F normalizes by;
+    postings maps a folded token to {file id: occurrences}, a body count or
+    a [stem, heading, body] list (_pack_posting).
+    """
+
+    def __init__(self, path: Path, data: dict = None):
+        self.path = path
+        data = data or {}
+        self.files = data.get('files', {})
+        self.postings = data.get('postings', {})
+        self.next_id = data.get('next_id', 0)
+        self.built = data.get('built')
+        self._candidates = {}
+        self._long_tokens = {}
+        self._tokens_by_id = None    # fid -> [token], built on first removal
+
+    @classmethod
+    def load(cls, path: Path):
+        """Load the index, or None if absent, unreadable, or another schema."""
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get('schema') != INDEX_SCHEMA_VERSION:
+            return None
+        return cls(path, data)
+
+    def save(self):
+        """Write atomically (tmp + replace) so a concurrent study never reads
+        a half-written index."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        tmp.write_text(json.dumps({
+            'schema': INDEX_SCHEMA_VERSION,
+            'built': self.built,
+            'next_id': self.next_id,
+            'files': self.files,
+            'postings': self.postings,
+        }, separators=(',', ':')))
+        os.replace(tmp, self.path)
+
+    def add_file(self, file_path: Path, st=None, content: str = None) -> bool:
+        """Tokenize one file into the index. Returns False if it could not be
+        read — such files stay unindexed and are therefore always scanned."""
+        try:
+            st = st or file_path.stat()
+            if content is None:
+                content = _read_for_index(file_path)
+        except (OSError, UnicodeDecodeError):
+            return False
+        fid = str(self.next_id)
+        self.next_id += 1
+        terms = _tokenize_for_index(content, file_path)
+        for tok, counts in terms.items():
+            self.postings.setdefault(tok, {})[fid] = _pack_posting(counts)
+        if self._tokens_by_id is not None:
+            self._tokens_by_id[fid] = list(terms)
+        lengths = _field_lengths(terms)
+        self.files[_display_path(file_path)] = {
+            'id': fid, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+            'sha1': _content_hash(content),
+            'tokens': sum(lengths),
+            'lengths': lengths,
+        }
+        self._candidates.clear()
+        self._long_tokens.clear()
+        return True
+
+    def remove_files(self, keys):
+        """Drop entries (and their postings) for the given display paths.
+
+        The first removal inverts postings into fid -> tokens once; each file
+        then costs its own tokens, not a pass over the vocabulary (a branch
+        checkout can move hundreds of files).
+        """
+        ids = [self.files.pop(k)['id'] for k in keys if k in self.files]
+        if not ids:
+            return
+        if self._tokens_by_id is None:
+            self._tokens_by_id = {}
+            for tok, post in self.postings.items():
+                for fid in post:
+                    self._tokens_by_id.setdefault(fid, []).append(tok)
+        for fid in ids:
+            for tok in self._tokens_by_id.pop(fid, ()):
+                post = self.postings[tok]
+                del post[fid]
+                if not post:
+                    del self.postings[tok]
+        self._candidates.clear()
+        self._long_tokens.clear()
+
+    def keyword_tokens(self, kw: str):
+        """Indexed tokens a _token_pattern(kw) match can lie in, or None if
+        the token model cannot tell (kw is not all word characters)."""
+        if not _INDEXABLE_KEYWORD_RE.fullmatch(kw):
+            return None
+        folded = _fold(kw)
+        if len(kw) <= SHORT_TOKEN_LEN:
+            return [folded + suffix for suffix in _SHORT_SUFFIXES
+                    if folded + suffix in self.postings]
+        if folded not in self._long_tokens:
+            self._long_tokens[folded] = [tok for tok in self.postings if folded in tok]
+        return self._long_tokens[folded]
+
+    def _fresh_entry(self, file_path: Path):
+        entry = self.files.get(_display_path(file_path))
+        if entry is None:
+            return None
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        if st.st_size != entry['size'] or st.st_mtime_ns != entry['mtime_ns']:
+            return None
+        return entry
+
+    def match_bound(self, file_path: Path, terms) -> int:
+        """Upper bound on the matches search_file_for_topic can count for
+        terms in file_path, or None if the index cannot vouch for the file.
+        A short keyword matches at most once per token occurrence; a long
+        one at most len(token) // len(kw) times."""
+        entry = self._fresh_entry(file_path)
+        if entry is None:
+            return None
+        fid = entry['id']
+        bound = 0
+        for kw in terms:
+            tokens = self.keyword_tokens(kw)
+            if tokens is None:
+                return None
+            per_token = len(kw) > SHORT_TOKEN_LEN
+            for tok in tokens:
+                posting = self.postings[tok].get(fid)
+                if posting:
+                    bound += (sum(_field_counts(posting))
+                              * (len(tok) // len(kw) if per_token else 1))
+        return bound
+
+    def _keyword_candidates(self, kw: str):
+        """File ids that can match kw, or None if the token model cannot tell."""
+        tokens = self.keyword_tokens(kw)
+        if tokens is None:
+            return None
+        ids = set()
+        for tok in tokens:
+            ids.update(self.postings[tok])
+        return ids
+
+    def candidates(self, topic: str):
+        """File ids that may satisfy topic under search_file_for_topic's
+        coverage rule, or None when every file must be scanned."""
+        if topic in self._candidates:
+            return self._candidates[topic]
+        keywords = prepare_keywords(topic)
+        result = None
+        if keywords:
+            if len(keywords) <= 1:
+                required = 1
+            else:
+                required = min(max(1, (len(keywords) + 1) // 2), len(keywords))
+            per_kw = [self._keyword_candidates(kw) for kw in keywords]
+            unknown = sum(1 for c in per_kw if c is None)
+            if unknown < required:
+                hits = {}
+                for c in per_kw:
+                    for fid in c or ():
+                        hits[fid] = hits.get(fid, 0) + 1
+                result = {fid for fid, n in hits.items() if n + unknown >= required}
+        self._candidates[topic] = result
+        return result
+
+    def may_match(self, file_path: Path, topic: str) -> bool:
+        """False only when a fresh entry rules the file out for topic."""
+        entry = self._fresh_entry(file_path)
+        if entry is None:
+            return True
+        cands = self.candidates(topic)
+        return cands is None or entry['id'] in cands
+
+
+_ACTIVE_INDEX = None
+
+
+def iter_indexed_files(agent_root: Path, include_sessions: bool = False):
+    """Yield (file, stat) for every regular file on INDEXED_SURFACES, each
+    once, in a stable order. SESSION_SURFACES only with include_sessions."""
+    import stat as stat_module
+    seen = set()
+    for root_rel, globs in INDEXED_SURFACES:
+        if root_rel in SESSION_SURFACES and not include_sessions:
+            continue
+        # normpath, not resolve(): '../aget/specs' must key exactly as
+        # find_specs reports it, without following symlinks.
+        root = Path(os.path.normpath(agent_root / root_rel))
+        if not root.is_dir():
+            continue
+        for pattern in globs:
+            for file in sorted(root.glob(pattern)):
+                # One stat per file: it types the file, dedupes a file
+                # reachable twice (by inode, the way resolve() would) and is
+                # the stamp the refresh compares.
+                try:
+                    st = file.stat()
+                except OSError:
+                    continue
+                if not stat_module.S_ISREG(st.st_mode) or (st.st_dev, st.st_ino) in seen:
+                    continue
+                seen.add((st.st_dev, st.st_ino))
+                yield file, st
+
+
+def build_index(agent_root: Path, include_sessions: bool = False) -> StudyIndex:
+    """Full (re)build of the study index from INDEXED_SURFACES."""
+    index = StudyIndex(agent_root / INDEX_RELPATH)
+    for file, st in iter_indexed_files(agent_root, include_sessions):
+        index.add_file(file, st=st)
+    index.built = datetime.now().isoformat()
+    return index
+
+
+def refresh_index(index: StudyIndex, agent_root: Path,
+                  include_sessions: bool = False) -> dict:
+    """Incrementally bring index up to date with INDEXED_SURFACES.
+
+    Stats every file on the surface roots; only files whose (size, mtime)
+    moved are re-read, and only those whose content hash also moved are
+    re-tokenized (a checkout or `touch` rewrites mtime without changing a
+    byte). Entries for files no longer on any walked surface are dropped;
+    without include_sessions, SESSION_SURFACES are neither walked nor
+    dropped. Returns counts per outcome; 'changed' says whether the index
+    needs saving.
+    """
+    stats = {'unchanged': 0, 'touched': 0, 'retokenized': 0, 'added': 0,
+             'removed': 0, 'unreadable': 0}
+    present = set()
+    for file, st in iter_indexed_files(agent_root, include_sessions):
+        key = _display_path(file)
+        present.add(key)
+        entry = index.files.get(key)
+        if entry and st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime_ns']:
+            stats['unchanged'] += 1
+            continue
+        try:
+            content = _read_for_index(file)
+        except (OSError, UnicodeDecodeError):
+            index.remove_files([key])
+            stats['unreadable'] += 1
+            continue
+        if entry and entry.get('sha1') == _content_hash(content):
+            entry['size'], entry['mtime_ns'] = st.st_size, st.st_mtime_ns
+            stats['touched'] += 1
+            continue
+        if entry:
+            index.remove_files([key])
+            stats['retokenized'] += 1
+        else:
+            stats['added'] += 1
+        index.add_file(file, st=st, content=content)
+    gone = [k for k in index.files if k not in present
+            and (include_sessions or k.split('/', 1)[0] not in SESSION_SURFACES)]
+    index.remove_files(gone)
+    stats['removed'] = len(gone)
+    stats['changed'] = any(stats[k] for k in
+                           ('touched', 'retokenized', 'added', 'removed', 'unreadable'))
+    if stats['changed']:
+        index.built = datetime.now().isoformat()
+    return stats
+
+
+def activate_index(index):
+    """Route search_file_for_topic through index (None disables)."""
+    global _ACTIVE_INDEX
+    _ACTIVE_INDEX = index
+
+
+# ---------------------------------------------------------------------------
+# Rankers
+#
+# The ranker turns a match dict into its 'score'. `composite` is the ranking
+# contract (composite_score, audit R1/R2) and stays the default. `bm25` is
+# BM25F over the index statistics: IDF and per-field length normalization,
+# which composite_score has neither of, so long spec YAMLs and common tokens
+# stop dominating. Which files match is unchanged — only scores/order move.
+# ---------------------------------------------------------------------------
+
+RANKERS = ('composite', 'bm25')
+BM25_K1 = 1.2
+# (field, weight, length-normalization b) — stem mirrors FILENAME_BOOST (R2).
+BM25F_FIELDS = (('stem', FILENAME_BOOST, 0.3), ('heading', 2.0, 0.3), ('body', 1.0, 0.75))
+
+
+class BM25FRanker:
+    """BM25F score for one topic over an index's corpus statistics.
+
+    Per keyword, field term frequencies are summed over every indexed token
+    the keyword can match (the same suffix/substring model as the matcher),
+    combined across fields with per-field length normalization, and
+    saturated once:  sum_kw idf(kw) * tf~ / (k1 + tf~). Keywords that are
+    not plain word runs ("v3.26") score as their word runs. The epistemic
+    boosts (purpose, domain) still multiply the result.
+    """
+
+    def __init__(self, index, topic: str):
+        import math
+        self.index = index
+        self.agent_root = get_agent_root()
+        keywords = prepare_keywords(topic) or [topic]
+        terms = []
+        for kw in keywords:
+            terms.extend([kw] if _INDEXABLE_KEYWORD_RE.fullmatch(kw)
+                         else _WORD_RE.findall(kw))
+        entries = list(index.files.values())
+        self.n_docs = max(1, len(entries))
+        self.avg_lengths = [max(1e-9, sum(e['lengths'][i] for e in entries) / self.n_docs)
+                            for i in range(len(BM25F_FIELDS))]
+        # term -> [tokens], and term -> idf (df: files containing any token)
+        self.term_tokens = {t: index.keyword_tokens(t) or [] for t in terms}
+        self.idf = {}
+        for t, tokens in self.term_tokens.items():
+            df = len(set().union(*(index.postings[tok] for tok in tokens))) if tokens else 0
+            self.idf[t] = math.log(1 + (self.n_docs - df + 0.5) / (df + 0.5))
+
+    def _doc_fields(self, item: dict):
+        """(field lengths, token -> posting lookup) for a match."""
+        entry = self.index.files.get(item['file'])
+        if entry is not None:
+            fid = entry['id']
+            return entry['lengths'], (
+                lambda tok: self.index.postings.get(tok, {}).get(fid))
+        # Not in the index (unreadable at refresh, or outside its surfaces):
+        # tokenize on the fly so the file is still scored on the same model.
+        path = Path(item['file'])
+        if not path.is_absolute():
+            path = self.agent_root / path
+        content = read_content(path).text
+        terms = _tokenize_for_index(content, path)
+        return _field_lengths(terms), terms.get
+
+    def __call__(self, item: dict) -> float:
+        try:
+            lengths, posting_of = self._doc_fields(item)
+        except (OSError, UnicodeDecodeError):
+            return 0.0
+        norms = [1 - b + b * lengths[i] / self.avg_lengths[i]
+                 for i, (_, _, b) in enumerate(BM25F_FIELDS)]
+        score = 0.0
+        for t, tokens in self.term_tokens.items():
+            tf = 0.0
+            for tok in tokens:
+                posting = posting_of(tok)
+                if posting:
+                    for i, n in enumerate(_field_counts(posting)):
+                        if n:
+                            tf += BM25F_FIELDS[i][1] * n / norms[i]
+            if tf:
+                score += self.idf[t] * tf / (BM25_K1 + tf)
+        return (score
+                * item.get('purpose_boost', 1.0)
+                * item.get('domain_boost', 1.0))
+
+
+_ACTIVE_RANKER = composite_score
+
+
+def activate_ranker(ranker):
+    """Score matches with ranker (None restores composite_score)."""
+    global _ACTIVE_RANKER
+    _ACTIVE_RANKER = ranker or composite_score
+
+
+_SCAN_POOL = None    # per-file executor while collect_findings(jobs > 1) runs
+
+
+def _scan_files(files: list, topic: str, domain_keywords: list = None) -> list:
+    """(file, match) for every file, in input order.
+
+    Finders pick their candidate files first and post-process the matches
+    after, so the per-file scans are the one step that can fan out over
+    _SCAN_POOL without changing what any finder returns.
+    """
+    def scan(file):
+        return search_file_for_topic(file, topic, domain_keywords=domain_keywords)
+    if _SCAN_POOL is None:
+        return [(file, scan(file)) for file in files]
+    return list(zip(files, _SCAN_POOL.map(scan, files)))
+
+
+class ResultCollector:
+    """One surface's findings, floor-filtered and bounded as they arrive.
+
+    An item scoring below `floor` is counted in `suppressed` and dropped on
+    the spot; with `top_k`, only the k best are held (a min-heap) and the
+    rest counted in `truncated`. ranked() is exactly "stable sort by score
+    (desc), drop below-floor, keep the first k" over everything added — the
+    order finders and the floor always produced — without materializing or
+    sorting the hits that would be thrown away. `pruned` counts files a
+    finder abandoned unscored because they provably could not make the top k
+    (whether they would have matched at all is unknown).
+    """
+
+    def __init__(self, top_k: int = None, floor: float = None):
+        self.top_k = top_k
+        self.floor = floor
+        self.suppressed = 0
+        self.truncated = 0
+        self.pruned = 0
+        self._entries = []          # (score, -seq, item); a heap when top_k is set
+        self._seq = 0
+
+    def threshold(self):
+        """Score a new item must exceed to be kept, or None while there is room."""
+        if self.top_k and len(self._entries) >= self.top_k:
+            return self._entries[0][0]
+        return None
+
+    def add(self, item: dict) -> None:
+        import heapq
+        score = item.get('score')
+        if self.floor is not None and score is not None and score < self.floor:
+            self.suppressed += 1
+            return
+        # Later items lose ties (-seq), as in a stable sort of the full list.
+        entry = (item.get('score', 0.0), -self._seq, item)
+        self._seq += 1
+        if not self.top_k:
+            self._entries.append(entry)
+        elif len(self._entries) < self.top_k:
+            heapq.heappush(self._entries, entry)
+        else:
+            if entry > self._entries[0]:
+                heapq.heapreplace(self._entries, entry)
+            self.truncated += 1
+
+    def ranked(self) -> list:
+        return [item for _, _, item in sorted(self._entries, key=lambda e: (-e[0], -e[1]))]
+
+
 def search_directory(path: Path, topic: str, extensions: list = None,
-                     purpose_globs: list = None, domain_keywords: list = None) -> list:
+                     purpose_globs: list = None, domain_keywords: list = None,
+                     collector: ResultCollector = None) -> list:
     """Search a directory for topic-related files.
 
     Args:
@@ -319,6 +1285,7 @@ def search_directory(path: Path, topic: str, extensions: list = None,
         extensions: File extensions to include (default: .md, .yaml, .json)
         purpose_globs: Glob patterns for purpose-based boosting (CAP-SESSION-007-06)
         domain_keywords: Domain keywords for relevance boosting (CAP-SESSION-007-07)
+        collector: Optional ResultCollector (top-k / floor); default keeps all
 
     Returns:
         List of dicts with file match info, sorted by composite score
@@ -326,29 +1293,26 @@ def search_directory(path: Path, topic: str, extensions: list = None,
     if extensions is None:
         extensions = ['.md', '.yaml', '.json', '.py']
 
-    results = []
+    results = ResultCollector() if collector is None else collector
     if not path.exists():
-        return results
+        return results.ranked()
 
     # Recursive search
-    for file in path.rglob('*'):
-        if file.is_file() and file.suffix in extensions:
-            match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-            if match:
-                # Add purpose boost (CAP-SESSION-007-06)
-                if purpose_globs:
-                    match['purpose_boost'] = compute_purpose_boost(match['file'], purpose_globs)
-                results.append(match)
-
-    # Composite ranking (v3.26 C-26-11): recompute score once purpose_boost is
-    # attached; log-damped count per the ranking contract (audit R1).
-    for x in results:
-        x['score'] = composite_score(x)
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
-
-
-def find_ldocs(topic: str, domain_keywords: list = None) -> list:
+    files = [f for f in path.rglob('*') if f.is_file() and f.suffix in extensions]
+    for file, match in _scan_files(files, topic, domain_keywords):
+        if match:
+            # Add purpose boost (CAP-SESSION-007-06)
+            if purpose_globs:
+                match['purpose_boost'] = compute_purpose_boost(match['file'], purpose_globs)
+            # Composite ranking (v3.26 C-26-11): recompute score once purpose_boost
+            # is attached; log-damped count per the ranking contract (audit R1).
+            match['score'] = _ACTIVE_RANKER(match)
+            results.add(match)
+    return results.ranked()
+
+
+def find_ldocs(topic: str, domain_keywords: list = None,
+               collector: ResultCollector = None) -> list:
     """Find L-docs related to topic.
 
     Args:
@@ -361,9 +1325,9 @@ def find_ldocs(topic: str, domain_keywords: list = None) -> list:
     agent_root = get_agent_root()
     evolution_path = agent_root / '.aget' / 'evolution'
 
-    results = []
+    results = ResultCollector() if collector is None else collector
     if not evolution_path.exists():
-        return results
+        return results.ranked()
 
     # rglob, not glob: `.aget/evolution/discoveries/` (and any other
     # sub-directory a seat uses) held real, citable KB and was invisible to a
@@ -379,20 +1343,17 @@ def find_ldocs(topic: str, domain_keywords: list = None) -> list:
     # their own conventions — `discoveries/north_star_revelation.md` carries no
     # `L` prefix, so a recursive walk that still demanded one re-excluded the
     # exact artifact the recursion was added to reach.
-    for file in sorted(evolution_path.rglob('*.md')):
-        if file.parent == evolution_path and not file.name.startswith('L'):
-            continue
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
+    files = [f for f in sorted(evolution_path.rglob('*.md'))
+             if f.parent != evolution_path or f.name.startswith('L')]
+    for file, match in _scan_files(files, topic, domain_keywords):
         if match:
             # Extract L-doc title from first heading
             try:
-                content = file.read_text()
-                title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-                title = title_match.group(1) if title_match else file.stem
+                title = read_content(file).title or file.stem
             except Exception:
                 title = file.stem
 
-            results.append({
+            results.add({
                 'ldoc': file.stem,
                 'title': title,
                 'file': match['file'],
@@ -402,11 +1363,11 @@ def find_ldocs(topic: str, domain_keywords: list = None) -> list:
                 'score': match.get('score', 0.0)
             })
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_patterns(topic: str, domain_keywords: list = None) -> list:
+def find_patterns(topic: str, domain_keywords: list = None,
+                  collector: ResultCollector = None) -> list:
     """Find pattern documents related to topic.
 
     Args:
@@ -427,7 +1388,8 @@ def find_patterns(topic: str, domain_keywords: list = None) -> list:
     # document existed. Recurse both roots and drop the prefix requirement.
     pattern_roots = [agent_root / 'docs' / 'patterns', agent_root / 'patterns']
 
-    results = []
+    results = ResultCollector() if collector is None else collector
+    files = []
     seen = set()
     for patterns_path in pattern_roots:
         if not patterns_path.exists():
@@ -437,20 +1399,21 @@ def find_patterns(topic: str, domain_keywords: list = None) -> list:
             if resolved in seen:
                 continue
             seen.add(resolved)
-            match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-            if match:
-                results.append({
-                    'pattern': file.stem,
-                    'file': match['file'],
-                    'match_count': match['match_count'],
-                    'score': match.get('score', 0.0)
-                })
+            files.append(file)
+    for file, match in _scan_files(files, topic, domain_keywords):
+        if match:
+            results.add({
+                'pattern': file.stem,
+                'file': match['file'],
+                'match_count': match['match_count'],
+                'score': match.get('score', 0.0)
+            })
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_project_plans(topic: str, domain_keywords: list = None) -> list:
+def find_project_plans(topic: str, domain_keywords: list = None,
+                       collector: ResultCollector = None) -> list:
     """Find PROJECT_PLANs related to topic.
 
     Args:
@@ -463,29 +1426,20 @@ def find_project_plans(topic: str, domain_keywords: list = None) -> list:
     agent_root = get_agent_root()
     planning_path = agent_root / 'planning'
 
-    results = []
+    results = ResultCollector() if collector is None else collector
     if not planning_path.exists():
-        return results
+        return results.ranked()
 
-    for file in planning_path.glob('PROJECT_PLAN*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
+    files = list(planning_path.glob('PROJECT_PLAN*.md'))
+    for file, match in _scan_files(files, topic, domain_keywords):
         if match:
-            # Check if active
+            # Check if active (probe: FileContent.plan_is_active)
             try:
-                content = file.read_text()
-                # v3.25 C-25-14 (gh#1809 + gh#1791): case-insensitive, Plan_Status-first.
-                # Plans write "In Progress" (title case) — the old upper-case-only probe
-                # rendered every live plan [inactive]. Prefer the disambiguated
-                # Plan_Status header (CAP-PP-003); fall back to legacy header Status,
-                # then to whole-content scan for pre-template-2.1 plans.
-                m = (re.search(r'\*\*Plan_Status\*\*:\s*([^\n]*)', content)
-                     or re.search(r'\*\*Status\*\*:\s*([^\n]*)', content))
-                probe = m.group(1) if m else content
-                is_active = 'IN PROGRESS' in probe.upper()
+                is_active = read_content(file).plan_is_active
             except Exception:
                 is_active = False
 
-            results.append({
+            results.add({
                 'plan': file.name,
                 'file': match['file'],
                 'match_count': match['match_count'],
@@ -493,11 +1447,11 @@ def find_project_plans(topic: str, domain_keywords: list = None) -> list:
                 'score': match.get('score', 0.0)
             })
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_sops(topic: str, domain_keywords: list = None) -> list:
+def find_sops(topic: str, domain_keywords: list = None,
+              collector: ResultCollector = None) -> list:
     """Find SOPs related to topic.
 
     Args:
@@ -510,25 +1464,25 @@ def find_sops(topic: str, domain_keywords: list = None) -> list:
     agent_root = get_agent_root()
     sops_path = agent_root / 'sops'
 
-    results = []
+    results = ResultCollector() if collector is None else collector
     if not sops_path.exists():
-        return results
+        return results.ranked()
 
-    for file in sops_path.glob('SOP_*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
+    files = list(sops_path.glob('SOP_*.md'))
+    for file, match in _scan_files(files, topic, domain_keywords):
         if match:
-            results.append({
+            results.add({
                 'sop': file.name,
                 'file': match['file'],
                 'match_count': match['match_count'],
                 'score': match.get('score', 0.0)
             })
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_knowledge(topic: str, domain_keywords: list = None) -> list:
+def find_knowledge(topic: str, domain_keywords: list = None,
+                   collector: ResultCollector = None) -> list:
     """Find knowledge-base notes related to topic (v3.25 C-25-14, gh#1809).
 
     Scope decision (framework requirements-level, 2026-07-04): knowledge/ and
@@ -537,7 +1491,7 @@ def find_knowledge(topic: str, domain_keywords: list = None) -> list:
     or bulk surfaces whose hits are noise at study-time (revisit on evidence).
     """
     agent_root = get_agent_root()
-    results = []
+    results = ResultCollector() if collector is None else collector
     for area in ('knowledge', 'ontology'):
         base = agent_root / area
         if not base.exists():
@@ -548,20 +1502,20 @@ def find_knowledge(topic: str, domain_keywords: list = None) -> list:
         # vocabulary lives in ONTOLOGY_*.yaml, so the tier never opened the file
         # it exists to expose -- emitting a zero that reads as evidence of
         # absence. find_specs() below has globbed both since gh#1580.
-        for file in sorted(base.rglob('*.md')) + sorted(base.rglob('*.yaml')):
-            match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
+        files = sorted(base.rglob('*.md')) + sorted(base.rglob('*.yaml'))
+        for file, match in _scan_files(files, topic, domain_keywords):
             if match:
-                results.append({
+                results.add({
                     'doc': str(file.relative_to(agent_root)),
                     'file': match['file'],
                     'match_count': match['match_count'],
                     'score': match.get('score', 0.0)
                 })
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_sessions(topic: str, domain_keywords: list = None, days: int = 90) -> list:
+def find_sessions(topic: str, domain_keywords: list = None, days: int = 90,
+                  top_k: int = None, collector: ResultCollector = None) -> list:
     """Find session records related to topic — OPT-IN only (--include-sessions).
 
     Scope revisit (2026-07-26), on the evidence the 2026-07-04 decision asked for.
@@ -585,14 +1539,20 @@ def find_sessions(topic: str, domain_keywords: list = None, days: int = 90) -> l
       - filename date, not mtime — a git checkout rewrites mtime for the whole
         tree, which would put every session "in window" (this exact artifact was
         observed in the parallel 2026-07-26 corpus study)
+
+    Bounded in memory too (the 4,935-file case): files are scanned by
+    search_file_streaming, never held whole, and with top_k (or a bounded
+    collector) only the k best matches are kept — files that provably cannot
+    enter them are abandoned mid-scan. top_k=None keeps every match.
     """
     import datetime as _dt
     agent_root = get_agent_root()
     base = agent_root / 'sessions'
     if not base.exists():
-        return []
+        return (collector or ResultCollector()).ranked()
     cutoff = (_dt.date.today() - _dt.timedelta(days=days)).isoformat()
-    results = []
+    results = ResultCollector(top_k=top_k) if collector is None else collector
+    files = []
     for file in base.glob('*.md'):
         m = re.search(r'(\d{4})-(\d{2})-(\d{2})', file.name)
         if m:
@@ -602,19 +1562,33 @@ def find_sessions(topic: str, domain_keywords: list = None, days: int = 90) -> l
             # Undated filename: include rather than silently drop. An absence of
             # a date is not evidence of age (L1220 §Absence).
             pass
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-        if match:
-            results.append({
+        files.append(file)
+
+    def scan(file, stop=None):
+        return search_file_streaming(file, topic, domain_keywords=domain_keywords,
+                                     stop_at_or_below=stop)
+
+    # Under --jobs the scans run in parallel, with no running threshold to
+    # stop on; sequentially each scan may stop at the current k-th score.
+    if _SCAN_POOL is not None:
+        matches = zip(files, _SCAN_POOL.map(scan, files))
+    else:
+        matches = ((file, scan(file, results.threshold())) for file in files)
+    for file, match in matches:
+        if match is _PRUNED:
+            results.pruned += 1
+        elif match:
+            results.add({
                 'doc': file.stem,
                 'file': match['file'],
                 'match_count': match['match_count'],
                 'score': match.get('score', 0.0)
             })
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_specs(topic: str, domain_keywords: list = None) -> list:
+def find_specs(topic: str, domain_keywords: list = None,
+               collector: ResultCollector = None) -> list:
     """Find specifications related to topic — the spec tier (gh#1580).
 
     THE DEFECT THIS CLOSES, stated precisely because it is subtle:
@@ -640,7 +1614,7 @@ def find_specs(topic: str, domain_keywords: list = None) -> list:
         List of matching spec info
     """
     agent_root = get_agent_root()
-    results = []
+    results = ResultCollector() if collector is None else collector
     seen = set()
 
     # Instance-local tiers, then the canonical contract tier one level up.
@@ -655,13 +1629,16 @@ def find_specs(topic: str, domain_keywords: list = None) -> list:
     for root in roots:
         if not root.exists():
             continue
-        for file in sorted(root.rglob('*.md')) + sorted(root.rglob('*.yaml')):
+        files = sorted(root.rglob('*.md')) + sorted(root.rglob('*.yaml'))
+        # Pre-filter names an earlier root already matched; the in-loop check
+        # keeps first-match-wins for same-named files within this root.
+        files = [f for f in files if f.name not in seen]
+        for file, match in _scan_files(files, topic, domain_keywords):
             if file.name in seen:
                 continue
-            match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
             if match:
                 seen.add(file.name)
-                results.append({
+                results.add({
                     'spec': file.stem,
                     'doc': file.name,
                     'file': (str(file.relative_to(agent_root))
@@ -671,11 +1648,11 @@ def find_specs(topic: str, domain_keywords: list = None) -> list:
                     'score': match.get('score', 0.0),
                 })
 
-    results.sort(key=lambda r: r.get('score', 0.0), reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_governance(topic: str, domain_keywords: list = None) -> list:
+def find_governance(topic: str, domain_keywords: list = None,
+                    collector: ResultCollector = None) -> list:
     """Find governance docs related to topic.
 
     Args:
@@ -688,14 +1665,14 @@ def find_governance(topic: str, domain_keywords: list = None) -> list:
     agent_root = get_agent_root()
     governance_path = agent_root / 'governance'
 
-    results = []
+    results = ResultCollector() if collector is None else collector
     if not governance_path.exists():
-        return results
+        return results.ranked()
 
-    for file in governance_path.glob('*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
+    files = list(governance_path.glob('*.md'))
+    for file, match in _scan_files(files, topic, domain_keywords):
         if match:
-            results.append({
+            results.add({
                 'doc': file.name,
                 'file': match['file'],
                 'match_count': match['match_count'],
@@ -703,11 +1680,11 @@ def find_governance(topic: str, domain_keywords: list = None) -> list:
                 'score': match.get('score', 0.0)
             })
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def find_inbox(topic: str, domain_keywords: list = None, window_days: int = 14) -> list:
+def find_inbox(topic: str, domain_keywords: list = None, window_days: int = 14,
+               collector: ResultCollector = None) -> list:
     """Find recent inbox items related to topic (v3.26 C-26-11, gh#1850).
 
     Scope ruling (audit S2 revisit, enacted with the search-contract change):
@@ -721,30 +1698,32 @@ def find_inbox(topic: str, domain_keywords: list = None, window_days: int = 14)
     agent_root = get_agent_root()
     inbox_path = agent_root / 'inbox'
 
-    results = []
+    results = ResultCollector() if collector is None else collector
     if not inbox_path.exists():
-        return results
+        return results.ranked()
 
     cutoff = time.time() - window_days * 86400
+    files = []
     for file in inbox_path.rglob('*.md'):
         try:
             if file.stat().st_mtime < cutoff:
                 continue
         except OSError:
             continue
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
+        files.append(file)
+    for file, match in _scan_files(files, topic, domain_keywords):
         if match:
-            results.append({
+            results.add({
                 'doc': str(file.relative_to(agent_root)),
                 'file': match['file'],
                 'match_count': match['match_count'],
                 'score': match.get('score', 0.0)
             })
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return results.ranked()
 
 
-def generate_report(topic: str, findings: dict, floor_info: dict = None) -> str:
+def generate_report(topic: str, findings: dict, floor_info: dict = None,
+                    surfaces: tuple = None, limit_info: dict = None) -> str:
     """Generate human-readable study report.
 
     Args:
@@ -752,6 +1731,10 @@ def generate_report(topic: str, findings: dict, floor_info: dict = None) -> str:
         findings: Dict of findings from search
         floor_info: Optional {'floor': float, 'suppressed': int} from relevance
             filtering (v3.26 C-26-11; audit R3/C1)
+        surfaces: Optional (searched, excluded) manifest for this run
+            (default: SURFACES_SEARCHED / SURFACES_EXCLUDED)
+        limit_info: Optional {'truncated': int} from --top-k / --session-top-k:
+            matches scored and dropped beyond k
 
     Returns:
         Formatted markdown report
@@ -766,8 +1749,9 @@ def generate_report(topic: str, findings: dict, floor_info: dict = None) -> str:
     lines.append(f"**Keywords (after hygiene)**: {', '.join(prepare_keywords(topic))}")
     lines.append("")
     # Declared surface manifest (audit S1/C1): absence is now interpretable.
-    lines.append("**Surfaces searched**: " + " ; ".join(SURFACES_SEARCHED))
-    lines.append("**NOT searched**: " + " ; ".join(SURFACES_EXCLUDED))
+    searched, excluded = surfaces or (SURFACES_SEARCHED, SURFACES_EXCLUDED)
+    lines.append("**Surfaces searched**: " + " ; ".join(searched))
+    lines.append("**NOT searched**: " + " ; ".join(excluded))
     lines.append("")
 
     # Summary
@@ -847,6 +1831,11 @@ def generate_report(topic: str, findings: dict, floor_info: dict = None) -> str:
     floor_val = (floor_info or {}).get('floor')
     floor_note = (f"; {suppressed} below score floor {floor_val}, suppressed — "
                   f"use --no-floor to see all" if floor_val is not None and suppressed else "")
+    # Only scored matches: files skipped unscored by the top-k bound (most of
+    # which would not match at all) are in the JSON contract, not here.
+    beyond = (limit_info or {}).get('truncated', 0)
+    if beyond:
+        floor_note += f"; {beyond} more beyond --top-k not shown"
     # Relevance split (#1560 instance semantics, canonicalized): bucket on
     # keyword coverage >= 0.5, so token-noise raw hits never read as coverage.
     all_items = [x for v in findings.values() if isinstance(v, list) for x in v]
@@ -874,6 +1863,71 @@ def generate_report(topic: str, findings: dict, floor_info: dict = None) -> str:
     return '\n'.join(lines)
 
 
+FINDING_KEYS = ('ldocs', 'patterns', 'project_plans', 'sops', 'governance', 'specs',
+                'knowledge', 'inbox', 'sessions')
+
+
+def collect_findings(topic: str, domain_keywords: list = None, include_sessions: bool = False,
+                     session_days: int = 90, jobs: int = 1, session_top_k: int = None,
+                     collectors: dict = None) -> dict:
+    """Run every surface finder; findings keyed in the declared surface order.
+
+    jobs > 1 fans the surfaces out over a thread pool and each finder's
+    per-file scans over a second pool of `jobs` workers (two pools, so a
+    surface waiting on its scans can never starve them). Results are merged
+    by surface key, and within a surface the scans come back in walk order,
+    so the output is identical to jobs=1. Threads, not processes: the
+    finders share the active index and the agent root, and the win is
+    overlapping reads on the cross-repo tier (../aget/specs/**).
+
+    collectors maps a FINDING_KEYS key to the ResultCollector that surface
+    fills (top-k / floor applied during collection); surfaces without one
+    keep every match.
+    """
+    finders = [
+        ('ldocs', find_ldocs, {}),
+        ('patterns', find_patterns, {}),
+        ('project_plans', find_project_plans, {}),
+        ('sops', find_sops, {}),
+        ('governance', find_governance, {}),
+        ('specs', find_specs, {}),
+        ('knowledge', find_knowledge, {}),
+        ('inbox', find_inbox, {}),
+    ]
+    if include_sessions:
+        finders.append(('sessions', find_sessions,
+                        {'days': session_days, 'top_k': session_top_k}))
+    for key, _, kwargs in finders:
+        if collectors and key in collectors:
+            kwargs['collector'] = collectors[key]
+
+    # One content cache per run unless the caller already shares one (main()
+    # activates it before the index refresh, so refresh reads are reused).
+    owns_cache = _CONTENT_CACHE is None
+    if owns_cache:
+        activate_content_cache(ContentCache())
+    try:
+        if jobs <= 1:
+            return {key: finder(topic, domain_keywords=domain_keywords, **kwargs)
+                    for key, finder, kwargs in finders}
+
+        global _SCAN_POOL
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=jobs) as scan_pool, \
+                ThreadPoolExecutor(max_workers=min(jobs, len(finders))) as surface_pool:
+            _SCAN_POOL = scan_pool
+            try:
+                futures = {key: surface_pool.submit(finder, topic,
+                                                    domain_keywords=domain_keywords, **kwargs)
+                           for key, finder, kwargs in finders}
+                return {key: future.result() for key, future in futures.items()}
+            finally:
+                _SCAN_POOL = None
+    finally:
+        if owns_cache:
+            activate_content_cache(None)
+
+
 def call_extension_hook(payload):
     """Study extension hook (v3.26 C-26-05, gh#1836/#1848): call
     scripts/study_topic_ext.py:post_study(payload) if present.
@@ -882,10 +1936,18 @@ def call_extension_hook(payload):
     'findings', 'floor_info'}; hook returns augmented dict (additive-only,
     L464 — e.g. instance-specific search surfaces or annotations); absence =
     no-op; failure = warning + continue (ADR-004).
+
+    Run through scripts/extension_hooks.py when present: the loaded module is
+    reused across daemon queries until the file changes, the hook runs under
+    a deadline, and its latency comes back as payload['extension_hook'].
     """
     ext_path = get_agent_root() / 'scripts' / 'study_topic_ext.py'
     if not ext_path.exists():
         return payload
+    if extension_hooks is not None:
+        return extension_hooks.run_hook(ext_path, 'study_topic_ext', 'post_study', payload,
+                                        timeout=extension_hooks.hook_timeout(get_agent_root()),
+                                        label='study_topic extension hook')
     try:
         spec = importlib.util.spec_from_file_location('study_topic_ext', str(ext_path))
         module = importlib.util.module_from_spec(spec)
@@ -899,7 +1961,30 @@ def call_extension_hook(payload):
     return payload
 
 
-def main():
+def surface_manifest(include_sessions: bool = False, session_days: int = 90,
+                     session_top_k: int = None) -> tuple:
+    """(searched, excluded) surface lists for one run.
+
+    Built per run rather than by appending to the module lists, so a
+    long-lived process (the query daemon) never accumulates opt-in entries.
+    """
+    searched = list(SURFACES_SEARCHED)
+    excluded = list(SURFACES_EXCLUDED)
+    # Opt-in surface (2026-07-26 scope revisit). Added only when asked for, so the
+    # default surface list and its rationale are unchanged.
+    if include_sessions:
+        bound = f', best {session_top_k} only' if session_top_k else ''
+        searched.append(
+            f'sessions/*.md, last {session_days}d{bound} (OPT-IN via --include-sessions)')
+        for i, s in enumerate(excluded):
+            if s.startswith('sessions/'):
+                excluded[i] = (
+                    'workspace/, data/ (deliberate — 2026-07-04 scope decision, noise at '
+                    'study-time). sessions/ is INCLUDED this run via --include-sessions')
+    return searched, excluded
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description='Study Topic Protocol - Focused Topic Research',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -908,6 +1993,11 @@ Examples:
   python3 study_topic.py --topic "wind down"       # Research wind down protocol
   python3 study_topic.py --topic "release" --json  # JSON output
   python3 study_topic.py --topic "L477"            # Find L477 references
+  python3 study_topic.py --topic "spec" --jobs 8   # Parallel surface search
+  python3 study_topic.py --topic "wake" --top-k 5  # Best 5 per surface
+  python3 study_topic.py --build-index             # (Re)build the search index
+  python3 study_topic.py --topic "wake" --index    # Pre-filter through the index
+  python3 study_topic.py --daemon &                # Keep the corpus warm
   python3 study_topic.py --verify                  # Migration verification
         '''
     )
@@ -926,7 +2016,340 @@ Examples:
                              'decision). Use when sessions are the SUBJECT of the study.')
     parser.add_argument('--session-days', type=int, default=90, metavar='N',
                         help='Recency window for --include-sessions (default 90)')
+    parser.add_argument('--top-k', type=int, metavar='K',
+                        help='Keep only the K best matches per surface (bounded heap; '
+                             'the count of the rest is reported; default: all)')
+    parser.add_argument('--session-top-k', type=int, metavar='K',
+                        help='Keep only the K best session matches (bounded heap; '
+                             'default: all)')
+    parser.add_argument('--build-index', action='store_true',
+                        help='Rebuild the inverted index at .aget/cache/study_topic_index.json '
+                             'from scratch (normally it is refreshed incrementally)')
+    parser.add_argument('--index', action='store_true',
+                        help='Pre-filter files through the inverted index (default: config '
+                             'study_topic.use_index, else off; results are identical)')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Scan every file even if config enables the index')
+    parser.add_argument('--ranker', choices=RANKERS,
+                        help='Ranking engine (default: config study_topic.ranker, else '
+                             'composite). bm25 = BM25F over the index statistics')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Search surfaces and files with N worker threads '
+                             '(default 1; results are identical)')
+
+    parser.add_argument('--daemon', action='store_true',
+                        help=f'Serve queries on {DAEMON_SOCKET_RELPATH} with config, index '
+                             'and file contents kept warm (foreground; the CLI uses it '
+                             'whenever it is running)')
+    parser.add_argument('--stop-daemon', action='store_true', help='Stop a running daemon')
+    parser.add_argument('--no-daemon', action='store_true',
+                        help='Search in-process even if a daemon is running')
+    return parser
+
+
+def index_enabled(args, config: dict) -> bool:
+    """Whether a study uses the index pre-filter: --index or config
+    study_topic.use_index, unless --no-index."""
+    if args.no_index:
+        return False
+    return bool(args.index or config.get('use_index', False))
+
+
+def run_study(args, config: dict = None, index=None) -> dict:
+    """One study, as the --json output dict (also the daemon's reply).
+
+    config and index let a long-lived caller pass warm state; by default
+    both are loaded from disk, and a study that uses the index
+    (index_enabled, or the bm25 ranker) refreshes and saves it. The
+    dict carries one private key, '_floor_info' (floor_info as the extension
+    hook left it), which the report needs and the JSON output drops.
+    """
+    # Load config and resolve epistemic parameters (CAP-SESSION-007-06/07)
+    if config is None:
+        config = load_study_topic_config()
+    purpose = resolve_purpose(args.purpose, config)
+    purpose_globs = get_purpose_globs(purpose, config)
+
+    # Domain keywords: explicit flag > config > none
+    domain_keywords = args.domain_keywords or config.get('domain_keywords')
+    # Ranker: explicit flag > config > composite (the ranking contract)
+    ranker = args.ranker or config.get('ranker', 'composite')
+    if ranker not in RANKERS:
+        print(f"Warning: unknown study_topic.ranker {ranker!r}; using composite",
+              file=sys.stderr)
+        ranker = 'composite'
+
+    # Per-run content cache: every file is read and normalized once, whether
+    # by the index refresh or by the finders. An already-active cache (the
+    # daemon's) is used as-is.
+    owns_cache = _CONTENT_CACHE is None
+    if owns_cache:
+        activate_content_cache(ContentCache())
+    try:
+        # Index pre-filter, opt-in (--index or config study_topic.use_index):
+        # loading it and stat-walking the surfaces costs more than the scans
+        # it saves on the bench corpus (bench_study_topic.py: main() vs
+        # main() --index). An opted-in study builds a missing index; later
+        # ones re-tokenize only what changed. bm25 needs the index's corpus
+        # statistics even without the pre-filter.
+        use_index = index_enabled(args, config)
+        if use_index or ranker == 'bm25':
+            agent_root = get_agent_root()
+            if index is None:
+                index = (StudyIndex.load(agent_root / INDEX_RELPATH)
+                         or StudyIndex(agent_root / INDEX_RELPATH))
+            try:
+                if refresh_index(index, agent_root, args.include_sessions)['changed']:
+                    index.save()
+            except OSError as e:
+                # Read-only checkout: the refreshed index still serves this run.
+                print(f"Warning: study index not saved: {e}", file=sys.stderr)
+            if use_index:
+                activate_index(index)
+            if ranker == 'bm25':
+                activate_ranker(BM25FRanker(index, args.topic))
+
+        # Relevance floor (v3.26 C-26-11; audit R3, gh#1560): suppress items whose
+        # composite score sits below the floor. Configurable; --no-floor escapes.
+        # BM25 scores live on another scale: its floor is bm25_relevance_floor,
+        # off unless configured. Applied as results arrive, together with
+        # --top-k, so below-floor and beyond-k hits are never kept or sorted.
+        if args.no_floor:
+            floor = None
+        elif ranker == 'bm25':
+            floor = config.get('bm25_relevance_floor')
+        else:
+            floor = config.get('relevance_floor', RELEVANCE_FLOOR_DEFAULT)
+        collectors = {}
+        for key in FINDING_KEYS:
+            limits = [k for k in (args.top_k, args.session_top_k if key == 'sessions' else None)
+                      if k]
+            collectors[key] = ResultCollector(top_k=min(limits) if limits else None, floor=floor)
+
+        # Perform focused research with epistemic parameters
+        findings = collect_findings(args.topic, domain_keywords=domain_keywords,
+                                    include_sessions=args.include_sessions,
+                                    session_days=args.session_days, jobs=args.jobs,
+                                    session_top_k=args.session_top_k, collectors=collectors)
+    finally:
+        activate_index(None)
+        activate_ranker(None)
+        if owns_cache:
+            activate_content_cache(None)
+    surfaces_searched, surfaces_excluded = surface_manifest(
+        args.include_sessions, args.session_days, args.session_top_k)
+
+    used = [collectors[key] for key in findings]
+    suppressed = sum(c.suppressed for c in used)
+    floor_info = {'floor': floor, 'suppressed': suppressed} if floor is not None else None
+
+    # Extension hook (v3.26 C-26-05) — instance surfaces/annotations join here
+    payload = call_extension_hook({'topic': args.topic, 'purpose': purpose,
+                                   'findings': findings, 'floor_info': floor_info})
+    findings = payload.get('findings', findings)
+    floor_info = payload.get('floor_info', floor_info)
+
+    contract = {
+        'keywords': prepare_keywords(args.topic),
+        'ranker': ranker,
+        'surfaces_searched': surfaces_searched,
+        'surfaces_excluded': surfaces_excluded,
+        'relevance_floor': floor,
+        'suppressed_below_floor': suppressed if floor is not None else None
+    }
+    if args.top_k or args.session_top_k:
+        contract['top_k'] = args.top_k
+        contract['session_top_k'] = args.session_top_k
+        contract['truncated_beyond_top_k'] = sum(c.truncated for c in used)
+        contract['skipped_without_scoring'] = sum(c.pruned for c in used)
+    result = {
+        'timestamp': datetime.now().isoformat(),
+        'agent_path': str(get_agent_root()),
+        'topic': args.topic,
+        'purpose': purpose,
+        'domain_keywords': domain_keywords,
+        'findings': findings,
+        'total_artifacts': sum(len(v) for v in findings.values() if isinstance(v, list)),
+        'search_contract': contract,
+        '_floor_info': floor_info,
+    }
+    if 'extension_hook' in payload:
+        result['extension_hook'] = payload['extension_hook']
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Query daemon
+#
+# Every /aget-study-topic call used to pay interpreter startup, config load and
+# a cold corpus walk. `--daemon` keeps config, the index and a validated content
+# cache warm and answers the same queries over a Unix socket; the CLI tries the
+# socket first and falls back to the in-process path on ANY failure (no socket,
+# AF_UNIX unavailable, stale daemon, protocol mismatch) — ADR-004 fail-soft.
+# "Watching" the surface roots is the index refresh every query already does:
+# one stat per file, re-reading only what changed.
+# ---------------------------------------------------------------------------
+
+DAEMON_SOCKET_RELPATH = Path('.aget') / 'cache' / 'study_topic.sock'
+DAEMON_PROTOCOL_VERSION = 1
+DAEMON_CLIENT_TIMEOUT = 30.0   # seconds; a hung daemon degrades to in-process
+
+
+def _daemon_socket_path() -> Path:
+    return get_agent_root() / DAEMON_SOCKET_RELPATH
+
+
+def _send_daemon_request(request: dict, timeout: float = DAEMON_CLIENT_TIMEOUT):
+    """One JSON-line round trip to the daemon. Returns the reply dict, or None
+    if there is no usable daemon."""
+    import socket
+    path = _daemon_socket_path()
+    if not hasattr(socket, 'AF_UNIX') or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as reply:
+                line = reply.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+
+
+def query_daemon(argv: list):
+    """The daemon's output dict for argv, or None (caller runs in-process).
+
+    Warnings the query raised in the daemon (extension hook, index save,
+    config) come back with the reply and are printed to this stderr, as an
+    in-process run would have."""
+    reply = _send_daemon_request({'version': DAEMON_PROTOCOL_VERSION, 'op': 'study',
+                                  'argv': argv})
+    if not reply or not reply.get('ok'):
+        return None
+    for line in reply.get('warnings') or []:
+        print(line, file=sys.stderr)
+    return reply.get('output')
+
+
+class StudyDaemon:
+    """Warm state behind the daemon socket: config (reloaded when
+    .aget/config.json changes), the in-memory index, and a content cache
+    validated by stat on every hit."""
+
+    def __init__(self):
+        self.agent_root = get_agent_root()
+        self.source_stamp = self._source_stamp()
+        self.config_stamp = None
+        self.config = {}
+        self.index = (StudyIndex.load(self.agent_root / INDEX_RELPATH)
+                      or StudyIndex(self.agent_root / INDEX_RELPATH))
+        self.content = ContentCache(validate=True)
+        self.queries = 0
+
+    @staticmethod
+    def _source_stamp():
+        try:
+            return Path(__file__).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _warm_config(self) -> dict:
+        try:
+            stamp = (self.agent_root / '.aget' / 'config.json').stat().st_mtime_ns
+        except OSError:
+            stamp = None
+        if stamp != self.config_stamp:
+            self.config = load_study_topic_config()
+            self.config_stamp = stamp
+        return self.config
+
+    def handle(self, request: dict) -> dict:
+        if request.get('version') != DAEMON_PROTOCOL_VERSION:
+            return {'ok': False, 'error': 'protocol version mismatch'}
+        op = request.get('op')
+        if op == 'ping':
+            return {'ok': True, 'queries': self.queries, 'cached_files': len(self.content)}
+        if op == 'shutdown':
+            return {'ok': True, 'shutdown': True}
+        if op != 'study':
+            return {'ok': False, 'error': f'unknown op {op!r}'}
+        # This script changed under a running daemon: decline and exit, so the
+        # CLI runs the new code in-process instead of answering with the old.
+        if self._source_stamp() != self.source_stamp:
+            return {'ok': False, 'error': 'daemon source changed', 'shutdown': True}
+        try:
+            args = build_parser().parse_args(request.get('argv') or [])
+        except SystemExit:
+            return {'ok': False, 'error': 'bad arguments'}
+        if not args.topic:
+            return {'ok': False, 'error': 'topic required'}
+        # Queries are served one at a time, so the daemon's stderr can be
+        # borrowed for one: what the study warns about goes back to the client.
+        warnings = io.StringIO()
+        activate_content_cache(self.content)
+        try:
+            with contextlib.redirect_stderr(warnings):
+                output = run_study(args, config=self._warm_config(), index=self.index)
+        finally:
+            activate_content_cache(None)
+        self.content.prune({str(p) for p, _ in iter_indexed_files(self.agent_root)})
+        self.queries += 1
+        return {'ok': True, 'output': output, 'warnings': warnings.getvalue().splitlines()}
+
+
+def serve_daemon() -> int:
+    """Run the query daemon in the foreground until --stop-daemon."""
+    import socket
+    import socketserver
+    import threading
+    if not hasattr(socket, 'AF_UNIX'):
+        print("Error: --daemon needs Unix domain sockets (AF_UNIX)", file=sys.stderr)
+        return 1
+    path = _daemon_socket_path()
+    if _send_daemon_request({'version': DAEMON_PROTOCOL_VERSION, 'op': 'ping'}, timeout=2.0):
+        print(f"Error: a study_topic daemon is already serving {path}", file=sys.stderr)
+        return 1
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.unlink()              # stale socket left by a daemon that died
+    except FileNotFoundError:
+        pass
+
+    daemon = StudyDaemon()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                reply = daemon.handle(json.loads(self.rfile.readline()))
+            except Exception as e:     # one bad query must not take the daemon down
+                reply = {'ok': False, 'error': str(e)}
+            self.wfile.write(json.dumps(reply, default=str).encode('utf-8') + b'\n')
+            if reply.get('shutdown'):
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    old_umask = os.umask(0o177)    # owner-only socket
+    try:
+        server = socketserver.UnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(old_umask)
+    print(f"study_topic daemon serving {path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    return 0
 
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
     # Verification mode for migration testing
@@ -934,6 +2357,21 @@ Examples:
         print("VERIFY: study_topic protocol (study_topic.py)")
         return 0
 
+    if args.daemon:
+        return serve_daemon()
+    if args.stop_daemon:
+        reply = _send_daemon_request({'version': DAEMON_PROTOCOL_VERSION, 'op': 'shutdown'})
+        print("study_topic daemon stopped" if reply else "No study_topic daemon running")
+        return 0
+
+    if args.build_index:
+        index = build_index(get_agent_root(), args.include_sessions)
+        index.save()
+        if not args.topic:
+            print(f"Indexed {len(index.files)} files, {len(index.postings)} tokens "
+                  f"-> {INDEX_RELPATH}")
+            return 0
+
     # Topic is required for actual research
     if not args.topic:
         print("Error: --topic is required for research")
@@ -941,78 +2379,25 @@ Examples:
         parser.print_help()
         return 1
 
-    # Load config and resolve epistemic parameters (CAP-SESSION-007-06/07)
-    config = load_study_topic_config()
-    purpose = resolve_purpose(args.purpose, config)
-    purpose_globs = get_purpose_globs(purpose, config)
-
-    # Domain keywords: explicit flag > config > none
-    domain_keywords = args.domain_keywords or config.get('domain_keywords')
-
-    # Perform focused research with epistemic parameters
-    findings = {
-        'ldocs': find_ldocs(args.topic, domain_keywords=domain_keywords),
-        'patterns': find_patterns(args.topic, domain_keywords=domain_keywords),
-        'project_plans': find_project_plans(args.topic, domain_keywords=domain_keywords),
-        'sops': find_sops(args.topic, domain_keywords=domain_keywords),
-        'governance': find_governance(args.topic, domain_keywords=domain_keywords),
-        'specs': find_specs(args.topic, domain_keywords=domain_keywords),
-        'knowledge': find_knowledge(args.topic, domain_keywords=domain_keywords),
-        'inbox': find_inbox(args.topic, domain_keywords=domain_keywords)
-    }
-    # Opt-in surface (2026-07-26 scope revisit). Added only when asked for, so the
-    # default surface list and its rationale are unchanged.
-    if args.include_sessions:
-        findings['sessions'] = find_sessions(
-            args.topic, domain_keywords=domain_keywords, days=args.session_days)
-        SURFACES_SEARCHED.append(
-            f'sessions/*.md, last {args.session_days}d (OPT-IN via --include-sessions)')
-        for i, s in enumerate(SURFACES_EXCLUDED):
-            if s.startswith('sessions/'):
-                SURFACES_EXCLUDED[i] = (
-                    'workspace/, data/ (deliberate — 2026-07-04 scope decision, noise at '
-                    'study-time). sessions/ is INCLUDED this run via --include-sessions')
-
-    # Relevance floor (v3.26 C-26-11; audit R3, gh#1560): suppress items whose
-    # composite score sits below the floor. Configurable; --no-floor escapes.
-    floor = None if args.no_floor else config.get('relevance_floor', RELEVANCE_FLOOR_DEFAULT)
-    suppressed = 0
-    if floor is not None:
-        for key in findings:
-            kept = [x for x in findings[key] if x.get('score', floor) >= floor]
-            suppressed += len(findings[key]) - len(kept)
-            findings[key] = kept
-    floor_info = {'floor': floor, 'suppressed': suppressed} if floor is not None else None
-
-    # Extension hook (v3.26 C-26-05) — instance surfaces/annotations join here
-    payload = call_extension_hook({'topic': args.topic, 'purpose': purpose,
-                                   'findings': findings, 'floor_info': floor_info})
-    findings = payload.get('findings', findings)
-    floor_info = payload.get('floor_info', floor_info)
+    # Daemon first (same argv, same output dict); in-process on any failure.
+    output = None if args.no_daemon else query_daemon(sys.argv[1:])
+    if output is None:
+        output = run_study(args)
+    floor_info = output.pop('_floor_info', None)
 
     # JSON output
     if args.json:
-        output = {
-            'timestamp': datetime.now().isoformat(),
-            'agent_path': str(get_agent_root()),
-            'topic': args.topic,
-            'purpose': purpose,
-            'domain_keywords': domain_keywords,
-            'findings': findings,
-            'total_artifacts': sum(len(v) for v in findings.values() if isinstance(v, list)),
-            'search_contract': {
-                'keywords': prepare_keywords(args.topic),
-                'surfaces_searched': SURFACES_SEARCHED,
-                'surfaces_excluded': SURFACES_EXCLUDED,
-                'relevance_floor': floor,
-                'suppressed_below_floor': suppressed if floor is not None else None
-            }
-        }
         print(json.dumps(output, indent=2, default=str))
         return 0
 
     # Human-readable output
-    report = generate_report(args.topic, findings, floor_info=floor_info)
+    contract = output['search_contract']
+    limit_info = ({'truncated': contract['truncated_beyond_top_k']}
+                  if 'truncated_beyond_top_k' in contract else None)
+    report = generate_report(args.topic, output['findings'], floor_info=floor_info,
+                             surfaces=(contract['surfaces_searched'],
+                                       contract['surfaces_excluded']),
+                             limit_info=limit_info)
     print(report)
 
     return 0
@@ -18,6 +18,8 @@ Usage:
     python3 wake_up.py --json --pretty    # Pretty-printed JSON
     python3 wake_up.py --dir /path/agent  # Run on specific agent
     python3 wake_up.py --verify           # Migration verification (L491)
+    python3 wake_up.py --profile-startup  # Per-phase timing vs startup_budget_ms
+    python3 wake_up.py --no-snapshot      # Recompute every section
 
 Exit codes:
     0: Success
@@ -36,23 +38,58 @@ Author: aget-framework (canonical template)
 Version: 2.0.0 (v3.6.0)
 """
 
-import argparse
-import importlib.util
-import json
-import os
-import subprocess
-import sys
 import time
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, Any, Optional
+
+_start_time = time.time()  # L039 clock; starts before the imports it measures
+
+import _thread  # noqa: E402  (built in and already loaded; threading is not)
+import argparse  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+from datetime import datetime  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Dict, Any, Optional  # noqa: E402
+
+# Startup budget: wake is on the critical path of every session, so anything
+# only some sections need is imported by those sections — subprocess (git,
+# gh, the validator), threading (concurrent probes), importlib.util (the
+# extension hook), yaml (fleet state) and the shared scripts/ modules below.
+_UNLOADED = object()
+git_status = _UNLOADED       # scripts/git_status.py: one git call, cached per process
+session_catalog = _UNLOADED  # scripts/session_catalog.py: newest note without a listing
+fleet_state = _UNLOADED      # scripts/fleet_state.py: FLEET_STATE.yaml via a JSON cache
+extension_hooks = _UNLOADED  # scripts/extension_hooks.py: cached hook modules, deadline
+protocol_telemetry = _UNLOADED  # scripts/protocol_telemetry.py: per-run timing record
+check_skill_reliance_manifest = _UNLOADED  # its load_validator: in-process attestation
+
+
+def _shared_module(name: str):
+    """Import a shared scripts/ module on first use; None if this instance's
+    scripts/ predates it (ADR-004: callers keep their in-script fallback)."""
+    module = globals()[name]
+    if module is _UNLOADED:
+        try:
+            module = __import__(name)
+        except ImportError:
+            module = None
+        globals()[name] = module
+    return module
 
 
 # =============================================================================
 # L039: Diagnostic Efficiency - Timing
 # =============================================================================
 
-_start_time = time.time()
+_phases = None  # [(phase, ms)] for --profile-startup and the telemetry record
+
+
+def profile_phase(name: str, started: float) -> float:
+    """Record a phase that began at `started`; returns now."""
+    now = time.time()
+    if _phases is not None:
+        _phases.append((name, (now - started) * 1000))
+    return now
 
 
 def log_diagnostic(msg: str) -> None:
@@ -76,6 +113,11 @@ DEFAULT_CONFIG = {
     'show_pending_work': True,  # gh#1285: surface prior session-note Pending Work
     'show_release_currency': True,  # gh#1833: release-currency signal (v3.26, C-26-01)
     'release_currency_timeout': 5,  # seconds; fail-soft budget for the network check
+    'release_currency_ttl': 86400,  # seconds a cached latest tag is served before refresh (0: no cache)
+    'wake_deadline': 8,  # seconds; overall budget for the concurrent probes (None: no limit)
+    'show_reliance_attestation': True,  # R-BND-001-03 validator run (gh#1787)
+    'startup_budget_ms': 100,  # --profile-startup flags wakes slower than this
+    'wake_snapshot': True,  # reuse sections whose inputs are unchanged since the last wake
 }
 
 
@@ -119,18 +161,34 @@ def get_git_status(agent_path: Path) -> Dict[str, Any]:
     than glossing "(dirty)" and later asserting "nothing changed" without
     having established a baseline. (Reconcile-dirty-tree-at-boot; promotes a
     one-off session critique into the script per L467 single-channel gap.)
+
+    With scripts/git_status.py present this is one `git status --porcelain=v2
+    --branch` call, which also yields the upstream and ahead/behind counts
+    (added when the branch tracks one).
     """
+    git_status = _shared_module('git_status')
+    if git_status is not None:
+        status = git_status.get_repo_status(agent_path, timeout=probe_timeout(5))
+        if status is None:
+            return {'branch': 'unknown', 'clean': None, 'changes': []}
+        result = {'branch': status['branch'], 'clean': status['clean'],
+                  'changes': status['changes']}
+        if status['upstream']:
+            result.update(upstream=status['upstream'], ahead=status['ahead'],
+                          behind=status['behind'])
+        return result
+    import subprocess
     try:
         result = subprocess.run(
             ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            capture_output=True, text=True, timeout=5,
+            capture_output=True, text=True, timeout=probe_timeout(5),
             cwd=str(agent_path),
         )
         branch = result.stdout.strip() if result.returncode == 0 else 'unknown'
 
         result2 = subprocess.run(
             ['git', 'status', '--porcelain'],
-            capture_output=True, text=True, timeout=5,
+            capture_output=True, text=True, timeout=probe_timeout(5),
             cwd=str(agent_path),
         )
         if result2.returncode == 0:
@@ -176,19 +234,13 @@ def get_calendar_context(config: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def get_release_currency(own_version: str, timeout: int = 5) -> Dict[str, Any]:
-    """Release-currency signal (gh#1833, v3.26 C-26-01; L467 Channel-5).
+RELEASE_CURRENCY_CACHE = Path('.aget') / 'cache' / 'release_currency.json'
+RELEASE_CURRENCY_LOCK = Path('.aget') / 'cache' / 'release_currency.refresh'
 
-    Compares local aget_version against the latest public framework release
-    tag so target-misresolution (agent plans against N-1 because no currency
-    signal reached its field of view) is caught at session start.
 
-    Fail-soft (ADR-004): any failure — no gh, offline, timeout, auth — returns
-    status 'unknown' and MUST NOT block or slow wake-up beyond the timeout.
-    Reference implementation: main-supervisor _release_banner (accepted at
-    source, natural A/B evidence per #1833 p1 grant).
-    """
-    result: Dict[str, Any] = {'status': 'unknown', 'latest': None}
+def fetch_latest_release(timeout: int = 5) -> str:
+    """Latest public framework release tag (without 'v'), or '' on any failure."""
+    import subprocess
     try:
         # gh api (plain REST) — NOT `gh release view`: the latter blocks
         # indefinitely under a non-tty python subprocess in field testing
@@ -196,24 +248,114 @@ def get_release_currency(own_version: str, timeout: int = 5) -> Dict[str, Any]:
         # behind the fail-soft timeout. `gh api` returns in <1s.
         cmd = ["gh", "api", "repos/aget-framework/aget/releases/latest",
                "-q", ".tag_name"]
-        latest = ""
         for _attempt in range(2):  # single bounded retry — transient blips
             proc = subprocess.run(cmd, capture_output=True, text=True,
-                                  timeout=timeout, stdin=subprocess.DEVNULL)
+                                  timeout=probe_timeout(timeout), stdin=subprocess.DEVNULL)
             if proc.returncode == 0:
                 latest = proc.stdout.strip().lstrip("v")
                 if latest:
-                    break
-        if latest:
-            result['latest'] = latest
-            result['status'] = ('current' if latest == own_version
-                                else 'behind')
+                    return latest
     except Exception:
         pass
+    return ""
+
+
+def refresh_release_currency_cache(agent_path: Path, timeout: int = 5) -> Optional[str]:
+    """Fetch the latest tag and record it in RELEASE_CURRENCY_CACHE.
+
+    A failed fetch leaves the previous entry in place (stale beats absent),
+    and an unwritable cache is not an error. Returns the tag fetched, or None.
+    """
+    latest = fetch_latest_release(timeout)
+    if not latest:
+        return None
+    cache_file = agent_path / RELEASE_CURRENCY_CACHE
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'latest': latest, 'fetched_at': time.time()}))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+    return latest
+
+
+def _spawn_release_currency_refresh(agent_path: Path, timeout: int) -> bool:
+    """Start a detached `wake_up.py --refresh-release-currency` unless one is
+    already running. The lock file is created exclusively and removed by the
+    refresher; a lock older than the refresher's worst case is stale."""
+    import subprocess
+    lock = agent_path / RELEASE_CURRENCY_LOCK
+    try:
+        if lock.exists() and time.time() - lock.stat().st_mtime < 2 * timeout + 10:
+            return False
+        lock.unlink(missing_ok=True)
+        lock.parent.mkdir(parents=True, exist_ok=True)
+        os.close(os.open(str(lock), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), '--dir', str(agent_path),
+             '--refresh-release-currency', '--release-currency-timeout', str(timeout)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, start_new_session=True)
+        return True
+    except OSError:
+        return False
+
+
+def get_release_currency(own_version: str, timeout: int = 5,
+                         agent_path: Optional[Path] = None,
+                         ttl: Optional[int] = None) -> Dict[str, Any]:
+    """Release-currency signal (gh#1833, v3.26 C-26-01; L467 Channel-5).
+
+    Compares local aget_version against the latest public framework release
+    tag so target-misresolution (agent plans against N-1 because no currency
+    signal reached its field of view) is caught at session start.
+
+    Releases change at most weekly, so with agent_path and a ttl the last
+    known tag is served from RELEASE_CURRENCY_CACHE without touching the
+    network; past the ttl it is still served, and a detached refresher
+    updates the cache for the next wake. Only a cold cache fetches inline.
+    The result carries cache_age_seconds (0 for a fresh fetch).
+
+    Fail-soft (ADR-004): any failure — no gh, offline, timeout, auth — returns
+    status 'unknown' and MUST NOT block or slow wake-up beyond the timeout.
+    Reference implementation: main-supervisor _release_banner (accepted at
+    source, natural A/B evidence per #1833 p1 grant).
+    """
+    result: Dict[str, Any] = {'status': 'unknown', 'latest': None}
+    if agent_path is not None and ttl:
+        cached = load_json_file(agent_path / RELEASE_CURRENCY_CACHE, {})
+        if isinstance(cached, dict) and cached.get('latest'):
+            latest = str(cached['latest'])
+            age = max(0, int(time.time() - float(cached.get('fetched_at') or 0)))
+            result['cache_age_seconds'] = age
+            if age > ttl:
+                result['refreshing'] = _spawn_release_currency_refresh(agent_path, timeout)
+        else:
+            latest = refresh_release_currency_cache(agent_path, timeout) or ''
+            if latest:
+                result['cache_age_seconds'] = 0
+    else:
+        latest = fetch_latest_release(timeout)
+    if latest:
+        result['latest'] = latest
+        result['status'] = ('current' if latest == own_version
+                            else 'behind')
     return result
 
 
 def compute_active_agents_from_fleet_state(agent_path: Path) -> Optional[Dict[str, Any]]:
+    """Fleet-state counts (see _read_fleet_state), reused from the wake
+    snapshot while FLEET_STATE.yaml is unchanged."""
+    return snapshot_section(agent_path, 'fleet_state', [FLEET_STATE_RELPATH],
+                            lambda: _read_fleet_state(agent_path),
+                            keep=lambda value: value is not None)
+
+
+FLEET_STATE_RELPATH = Path('.aget') / 'fleet' / 'FLEET_STATE.yaml'
+
+
+def _read_fleet_state(agent_path: Path) -> Optional[Dict[str, Any]]:
     """Read `.aget/fleet/FLEET_STATE.yaml` and return live filesystem-based active count per gh#1288.
 
     Closes structural-not-discipline gap (L644 substrate; L648 cross-instance state coherence):
@@ -231,19 +373,29 @@ def compute_active_agents_from_fleet_state(agent_path: Path) -> Optional[Dict[st
 
     Designed to be called from extension hooks (`scripts/wake_up_ext.py`) that surface
     fleet counts; framework-canonical helper, instance artifact opt-in. PyYAML dependency
-    fails gracefully (returns None) if not installed.
+    fails gracefully (returns None) if not installed. With scripts/fleet_state.py present
+    the registry is parsed once and served from its JSON cache until it changes.
     """
-    fleet_state_path = agent_path / '.aget' / 'fleet' / 'FLEET_STATE.yaml'
+    fleet_state_path = agent_path / FLEET_STATE_RELPATH
     if not fleet_state_path.exists():
         return None
-    try:
-        import yaml  # type: ignore[import-untyped]
-    except ImportError:
-        return None
-    try:
-        with open(fleet_state_path) as f:
-            data = yaml.safe_load(f) or {}
-    except (yaml.YAMLError, IOError):
+    fleet_state = _shared_module('fleet_state')
+    if fleet_state is not None:
+        try:
+            data = fleet_state.load_fleet_state(fleet_state_path) or {}
+        except (ImportError, OSError, ValueError):
+            return None
+    else:
+        try:
+            import yaml  # type: ignore[import-untyped]
+        except ImportError:
+            return None
+        try:
+            with open(fleet_state_path) as f:
+                data = yaml.safe_load(f) or {}
+        except (yaml.YAMLError, IOError):
+            return None
+    if not isinstance(data, dict):
         return None
 
     fleet = data.get('fleet') or {}
@@ -288,11 +440,25 @@ def get_pending_work(agent_path: Path, max_items: int = 10) -> Dict[str, Any]:
         - source: relative path of session file (or None if not found)
         - items: list of bullet lines under `## Pending Work` header
         - truncated: bool — True if more items existed than max_items
+
+    With scripts/session_catalog.py present the newest note and its items
+    come from the session catalog (two stats while it is current) instead of
+    a listing of sessions/.
     """
     result = {'source': None, 'items': [], 'truncated': False}
     sessions_dir = agent_path / 'sessions'
     if not sessions_dir.is_dir():
         return result
+    session_catalog = _shared_module('session_catalog')
+    if session_catalog is not None:
+        note = session_catalog.latest_note(agent_path)
+        if note is None:
+            return result
+        result['source'] = str(Path('sessions') / note['name'])
+        items = note['pending_work'] or []
+        result['truncated'] = len(items) > max_items
+        result['items'] = items[:max_items]
+        return result
     # gh#1837 defect 1 (v3.26 C-26-06): pathlib.glob is case-sensitive on POSIX,
     # but SESSION_LOG_SPEC names notes SESSION_*.md (uppercase) — a lowercase-only
     # glob pins pending-work to a stale note while newer SESSION_* files are
@@ -338,20 +504,220 @@ def get_pending_work(agent_path: Path, max_items: int = 10) -> Dict[str, Any]:
     return result
 
 
-def get_wake_data(agent_path: Path) -> Dict[str, Any]:
-    """Gather all data needed for wake output."""
-    data = {
-        'timestamp': datetime.now().isoformat(),
-        'agent_path': str(agent_path),
-        'valid': True,
-        'errors': [],
-    }
+def get_reliance_attestation(agent_path: Path) -> Optional[Dict[str, Any]]:
+    """R-BND-001-03 self-attestation (v3.25, gh#1787).
+
+    When the reliance manifest and its validator are both present, attest
+    conformance at wake-up. Absence is silent — returns None (pre-adoption
+    agents; L601 expected lag, not an error).
+    """
+    manifest = agent_path / '.aget' / 'skill_reliance_manifest.yaml'
+    validator = agent_path / 'scripts' / 'check_skill_reliance_manifest.py'
+    if not (manifest.exists() and validator.exists()):
+        return None
+    reliance = _shared_module('check_skill_reliance_manifest')
+    module = reliance.load_validator(validator) if reliance is not None else None
+    if module is not None:
+        # In process, memoized by input mtimes (the validator's attest()).
+        try:
+            res = module.attest(agent_path)
+            return {'ok': res['ok'], 'summary': res['summary']}
+        except Exception as e:
+            return {'ok': False, 'summary': f'validator error: {e}'}
+    import subprocess
+    try:
+        r = subprocess.run([sys.executable, str(validator)], capture_output=True,
+                           text=True, timeout=probe_timeout(15), cwd=str(agent_path))
+        tail = (r.stdout or r.stderr).strip().splitlines()
+        return {
+            'ok': r.returncode == 0,
+            'summary': tail[-1] if tail else f'exit {r.returncode}',
+        }
+    except Exception as e:
+        return {'ok': False, 'summary': f'validator error: {e}'}
+
+
+# =============================================================================
+# Wake snapshot — instant re-wake after a context reset
+# =============================================================================
+
+# Agents re-wake several times an hour; most sections' inputs have not moved.
+# Each snapshotted section stores the mtimes of the files it was computed from
+# and is reused while they are unchanged. git status, the calendar and the
+# release-currency signal are always recomputed: the working tree changes
+# without touching any cheap-to-stat input, the calendar is a function of the
+# clock, and the release signal is already a cache read whose age must be live.
+WAKE_SNAPSHOT = Path('.aget') / 'cache' / 'wake_snapshot.json'
+WAKE_SNAPSHOT_VERSION = 1
+
+# What check_skill_reliance_manifest.py reads (its C3 candidates included):
+# an attestation is reusable only while none of these changed.
+RELIANCE_INPUTS = [
+    Path('.aget') / 'skill_reliance_manifest.yaml',
+    Path('scripts') / 'check_skill_reliance_manifest.py',
+    Path('.claude') / 'skills',
+    Path('..') / 'aget' / 'specs' / 'ARCHETYPE_SKILLS_INDEX.yaml',
+    Path('..') / 'aget-framework' / 'aget' / 'specs' / 'ARCHETYPE_SKILLS_INDEX.yaml',
+    Path.home() / 'github' / 'aget-framework' / 'aget' / 'specs' / 'ARCHETYPE_SKILLS_INDEX.yaml',
+]
+
+_wake_snapshot = None  # the loaded snapshot while a snapshotted wake runs
+
+
+def _input_stamps(agent_path: Path, inputs: list) -> list:
+    stamps = []
+    for rel in inputs:
+        try:
+            stamps.append((agent_path / rel).stat().st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return stamps
+
+
+def load_wake_snapshot(agent_path: Path) -> Dict[str, Any]:
+    """The agent's wake snapshot, or an empty one if absent, unreadable, or
+    written for another path or by another version of this script."""
+    try:
+        script_stamp = Path(__file__).stat().st_mtime_ns
+    except OSError:
+        script_stamp = None
+    snapshot = load_json_file(agent_path / WAKE_SNAPSHOT, None)
+    if (not isinstance(snapshot, dict)
+            or snapshot.get('version') != WAKE_SNAPSHOT_VERSION
+            or snapshot.get('agent_path') != str(agent_path)
+            or snapshot.get('script_mtime_ns') != script_stamp
+            or not isinstance(snapshot.get('sections'), dict)):
+        snapshot = {'version': WAKE_SNAPSHOT_VERSION, 'agent_path': str(agent_path),
+                    'script_mtime_ns': script_stamp, 'sections': {}}
+    # This run only; not saved. Probe threads write sections under the lock,
+    # and one abandoned at the wake deadline may still do so while it saves.
+    snapshot['reused'], snapshot['recomputed'] = [], []
+    snapshot['lock'] = _thread.allocate_lock()
+    return snapshot
+
+
+def save_wake_snapshot(agent_path: Path, snapshot: Dict[str, Any]) -> None:
+    """Write the snapshot if any section was recomputed (fail-soft, ADR-004)."""
+    if not snapshot.get('recomputed'):
+        return
+    path = agent_path / WAKE_SNAPSHOT
+    with snapshot['lock']:
+        stored = {k: v for k, v in snapshot.items()
+                  if k not in ('reused', 'recomputed', 'lock')}
+        text = json.dumps(stored, default=str)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def snapshot_section(agent_path: Path, name: str, inputs: list, compute,
+                     more_inputs=None, keep=None):
+    """compute(), unless the active wake snapshot holds `name` computed from
+    inputs whose mtimes are all unchanged.
+
+    more_inputs(value) names inputs only known after computing (e.g. the
+    session note a result came from); keep(value) False leaves a result out
+    of the snapshot. Stamps are taken before compute(), so an input changed
+    mid-computation invalidates the entry instead of hiding behind it.
+    Without an active snapshot this is just compute().
+    """
+    snapshot = _wake_snapshot
+    if snapshot is None:
+        return compute()
+    entry = snapshot['sections'].get(name)
+    if (isinstance(entry, dict) and 'value' in entry
+            and _input_stamps(agent_path, entry.get('inputs', [])) == entry.get('stamps')):
+        snapshot['reused'].append(name)
+        return json.loads(json.dumps(entry['value']))
+    inputs = [str(p) for p in inputs]
+    stamps = _input_stamps(agent_path, inputs)
+    value = compute()
+    if keep is None or keep(value):
+        extra = [str(p) for p in (more_inputs(value) if more_inputs else [])]
+        entry = {
+            'inputs': inputs + extra,
+            'stamps': stamps + _input_stamps(agent_path, extra),
+            'value': json.loads(json.dumps(value, default=str)),
+        }
+        with snapshot['lock']:
+            snapshot['sections'][name] = entry
+    snapshot['recomputed'].append(name)
+    return value
+
+
+_probe = _thread._local()   # .deadline: the wake deadline (monotonic) in a probe thread
+
+
+def probe_timeout(limit: float) -> float:
+    """A child process's timeout: `limit`, cut to what is left of the wake
+    deadline when called from a probe thread. A probe abandoned at the
+    deadline then has its git/gh/validator child killed with it (by
+    subprocess.run's timeout) instead of outliving the wake."""
+    end = getattr(_probe, 'deadline', None)
+    if end is None:
+        return limit
+    return max(0.01, min(limit, end - time.monotonic()))
+
+
+def run_with_deadline(collectors: list, deadline: Optional[float]) -> Dict[str, Any]:
+    """Run (key, fn, fallback) collectors concurrently under one deadline.
+
+    Each collector runs in its own daemon thread; the caller waits at most
+    `deadline` seconds in total (None: no limit). A collector still running
+    at the deadline yields its fallback with `timed_out: True` — the same
+    fail-soft shape the collector itself returns on failure (ADR-004). Its
+    thread is abandoned, not joined: daemon threads never hold up exit, so
+    wake latency is bounded by the deadline, not by the slowest subprocess
+    timeout. An exception raised by a collector propagates, as it would
+    have sequentially. Collectors size their subprocess timeouts with
+    probe_timeout, so no child outlives the deadline either.
+    """
+    import threading
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    end = None if deadline is None else time.monotonic() + max(0.0, deadline)
+
+    def run(key, fn):
+        started = time.time()
+        _probe.deadline = end
+        try:
+            results[key] = fn()
+        except BaseException as e:  # re-raised in the caller's thread
+            errors[key] = e
+        profile_phase(f'{key} (concurrent)', started)
+
+    threads = []
+    for key, fn, _ in collectors:
+        thread = threading.Thread(target=run, args=(key, fn), daemon=True,
+                                  name=f'wake-{key}')
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join(None if end is None else max(0.0, end - time.monotonic()))
+
+    gathered: Dict[str, Any] = {}
+    for (key, _, fallback), thread in zip(collectors, threads):
+        if thread.is_alive():
+            gathered[key] = {**fallback, 'timed_out': True}
+        elif key in errors:
+            raise errors[key]
+        else:
+            gathered[key] = results[key]
+    return gathered
 
+
+def read_identity(agent_path: Path) -> Dict[str, Any]:
+    """L021 Checks 1-2: the version and identity blocks."""
     # L021 Check 1: version.json
     version_file = agent_path / '.aget' / 'version.json'
     version_data = load_json_file(version_file, {})
 
-    data['version'] = {
+    version = {
         'aget_version': version_data.get('aget_version', 'unknown'),
         'updated': version_data.get('updated', ''),
         'agent_name': version_data.get('agent_name', agent_path.name),
@@ -367,74 +733,146 @@ def get_wake_data(agent_path: Path) -> Dict[str, Any]:
     if isinstance(north_star, dict):
         north_star = north_star.get('statement', '')
 
-    data['identity'] = {
-        'name': identity_data.get('name', data['version']['agent_name']),
-        'north_star': north_star,
+    return {
+        'version': version,
+        'identity': {
+            'name': identity_data.get('name', version['agent_name']),
+            'north_star': north_star,
+        },
     }
 
-    # L021 Check 3: Structure validation
+
+def check_structure(agent_path: Path) -> Dict[str, Any]:
+    """L021 Check 3: required/optional directories, and errors for missing ones."""
     required_dirs = ['.aget']
     optional_dirs = ['governance', 'sessions', 'planning']
 
-    data['structure'] = {
+    structure = {
         'required': {},
         'optional': {},
     }
+    errors = []
 
     for d in required_dirs:
         exists = (agent_path / d).is_dir()
-        data['structure']['required'][d] = exists
+        structure['required'][d] = exists
         if not exists:
-            data['valid'] = False
-            data['errors'].append(f"Missing required directory: {d}")
+            errors.append(f"Missing required directory: {d}")
 
     for d in optional_dirs:
-        data['structure']['optional'][d] = (agent_path / d).is_dir()
+        structure['optional'][d] = (agent_path / d).is_dir()
+
+    return {'structure': structure, 'errors': errors}
+
+
+def get_wake_data(agent_path: Path, use_snapshot: bool = False) -> Dict[str, Any]:
+    """Gather all data needed for wake output.
+
+    The probes that can block — git, the pending-work scan, the network
+    release-currency check and the reliance validator — run concurrently
+    under one `wake_deadline` (config, seconds), so a cold or offline wake
+    costs the slowest probe, not the sum. A probe that misses the deadline
+    reports its fail-soft default marked `timed_out: true`.
+
+    Config is read first and gates everything after it: a section switched
+    off costs neither its probe nor its imports.
 
+    use_snapshot (and config `wake_snapshot`) reuses sections whose input
+    mtimes are unchanged since the last wake — identity, structure, pending
+    work, the reliance attestation and fleet state. The caller saves the
+    snapshot (save_wake_snapshot) once extension hooks have run.
+    """
+    global _wake_snapshot
+    started = time.time()
     # L021 Check 4: Config (C3 — config-driven display)
     config_file = agent_path / '.aget' / 'config.json'
     config_data = load_json_file(config_file, {})
     wake_config = config_data.get('wake_up', {})
+    config = {**DEFAULT_CONFIG, **wake_config}
+    _wake_snapshot = (load_wake_snapshot(agent_path)
+                      if use_snapshot and config.get('wake_snapshot', True) else None)
+    started = profile_phase('config', started)
 
-    # Merge with defaults
-    data['config'] = {**DEFAULT_CONFIG, **wake_config}
+    data = {
+        'timestamp': datetime.now().isoformat(),
+        'agent_path': str(agent_path),
+        'valid': True,
+        'errors': [],
+    }
 
-    # Git status (conditional on config toggle)
-    if data['config'].get('show_git_status', True):
-        data['git'] = get_git_status(agent_path)
+    # L021 Checks 1-2: version.json, identity.json
+    data.update(snapshot_section(
+        agent_path, 'identity',
+        [Path('.aget') / 'version.json', Path('.aget') / 'identity.json'],
+        lambda: read_identity(agent_path)))
 
-    # Calendar awareness (CAP-SESSION-011)
-    if data['config'].get('show_calendar', True):
-        data['calendar'] = get_calendar_context(wake_config)
+    # L021 Check 3: Structure validation (the agent root's mtime moves
+    # whenever a top-level directory is created or removed)
+    checked = snapshot_section(agent_path, 'structure', [Path('.')],
+                               lambda: check_structure(agent_path))
+    data['structure'] = checked['structure']
+    if checked['errors']:
+        data['valid'] = False
+        data['errors'].extend(checked['errors'])
+
+    # Config merged with defaults (loaded above; keeps its place in the JSON)
+    data['config'] = config
+    started = profile_phase('version, identity, structure', started)
+
+    collectors = []
+
+    # Git status (conditional on config toggle)
+    if config.get('show_git_status', True):
+        collectors.append(('git', lambda: get_git_status(agent_path),
+                           {'branch': 'unknown', 'clean': None, 'changes': []}))
 
     # Pending Work surfacing (gh#1285 — structural-not-discipline)
-    if data['config'].get('show_pending_work', True):
-        data['pending_work'] = get_pending_work(agent_path)
+    if config.get('show_pending_work', True):
+        collectors.append(('pending_work', lambda: snapshot_section(
+            agent_path, 'pending_work', [Path('sessions')],
+            lambda: get_pending_work(agent_path),
+            more_inputs=lambda pw: [pw['source']] if pw.get('source') else []),
+            {'source': None, 'items': [], 'truncated': False}))
 
     # Release-currency signal (gh#1833, v3.26 C-26-01) — fail-soft, config-gated
-    if data['config'].get('show_release_currency', True):
-        data['release_currency'] = get_release_currency(
+    if config.get('show_release_currency', True):
+        collectors.append(('release_currency', lambda: get_release_currency(
             data['version']['aget_version'],
-            timeout=data['config'].get('release_currency_timeout', 5))
+            timeout=config.get('release_currency_timeout', 5),
+            agent_path=agent_path, ttl=config.get('release_currency_ttl')),
+            {'status': 'unknown', 'latest': None}))
 
-    # R-BND-001-03 self-attestation (v3.25, gh#1787): when the reliance manifest
-    # and its validator are both present, attest conformance at wake-up. Absence
-    # is silent (pre-adoption agents; L601 expected lag, not an error).
-    manifest = agent_path / '.aget' / 'skill_reliance_manifest.yaml'
-    validator = agent_path / 'scripts' / 'check_skill_reliance_manifest.py'
-    if manifest.exists() and validator.exists():
-        import subprocess as _sp
-        try:
-            r = _sp.run([sys.executable, str(validator)], capture_output=True,
-                        text=True, timeout=15, cwd=str(agent_path))
-            tail = (r.stdout or r.stderr).strip().splitlines()
-            data['reliance_attestation'] = {
-                'ok': r.returncode == 0,
-                'summary': tail[-1] if tail else f'exit {r.returncode}',
-            }
-        except Exception as e:
-            data['reliance_attestation'] = {'ok': False, 'summary': f'validator error: {e}'}
+    # R-BND-001-03 self-attestation (v3.25, gh#1787)
+    if config.get('show_reliance_attestation', True):
+        collectors.append(('reliance_attestation', lambda: snapshot_section(
+            agent_path, 'reliance_attestation', RELIANCE_INPUTS,
+            lambda: get_reliance_attestation(agent_path)),
+            {'ok': False, 'summary': 'not attested: wake deadline reached'}))
+
+    gathered = run_with_deadline(collectors, config.get('wake_deadline')) if collectors else {}
+    started = profile_phase('probes (wall)', started)
 
+    # Sections land in their historical order (git, calendar, pending work,
+    # release currency, attestation); the calendar is local and never waits.
+    if 'git' in gathered:
+        data['git'] = gathered['git']
+
+    # Calendar awareness (CAP-SESSION-011)
+    if config.get('show_calendar', True):
+        data['calendar'] = get_calendar_context(wake_config)
+        profile_phase('calendar', started)
+
+    for key in ('pending_work', 'release_currency'):
+        if key in gathered:
+            data[key] = gathered[key]
+    # Absence of manifest or validator is silent: no section at all.
+    if gathered.get('reliance_attestation') is not None:
+        data['reliance_attestation'] = gathered['reliance_attestation']
+
+    if _wake_snapshot is not None:
+        # Live lists: sections an extension hook recomputes show up too.
+        data['wake_snapshot'] = {'reused': _wake_snapshot['reused'],
+                                 'recomputed': _wake_snapshot['recomputed']}
     return data
 
 
@@ -447,11 +885,20 @@ def call_extension_hook(agent_path: Path, data: Dict[str, Any],
     - Hook returns augmented data dict (additive-only per L464)
     - Hook absence = no-op
     - Hook failure = warning + continue
+
+    Run through scripts/extension_hooks.py when present (per-hook deadline,
+    latency recorded as data['extension_hook']).
     """
     ext_path = agent_path / 'scripts' / 'wake_up_ext.py'
     if not ext_path.exists():
         return data
+    extension_hooks = _shared_module('extension_hooks')
+    if extension_hooks is not None:
+        return extension_hooks.run_hook(ext_path, 'wake_up_ext', 'post_wake', data,
+                                        timeout=extension_hooks.hook_timeout(agent_path),
+                                        log=log_diagnostic if verbose else None)
 
+    import importlib.util
     try:
         spec = importlib.util.spec_from_file_location('wake_up_ext', str(ext_path))
         module = importlib.util.module_from_spec(spec)
@@ -512,6 +959,11 @@ def format_human_output(data: Dict[str, Any]) -> str:
     if config.get('show_git_status', True) and 'git' in data:
         git = data['git']
         status = 'clean' if git.get('clean') else 'dirty' if git.get('clean') is False else ''
+        if git.get('timed_out'):
+            status = 'timed out'
+        drift = ', '.join(f"{git[k]} {k}" for k in ('ahead', 'behind') if git.get(k))
+        if drift:
+            status = f"{status}; {drift} of {git['upstream']}" if status else drift
         if status:
             lines.append(f"Git: {git['branch']} ({status})")
         else:
@@ -594,6 +1046,8 @@ def format_human_output(data: Dict[str, Any]) -> str:
 # =============================================================================
 
 def main():
+    global _phases
+    main_started = time.time()
     parser = argparse.ArgumentParser(
         description='Wake up protocol for AGET agents (v2.0.0)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -630,12 +1084,28 @@ Exit codes:
         '--verify', action='store_true',
         help='Migration verification: confirm script is at canonical path (L491)',
     )
+    parser.add_argument(
+        '--no-snapshot', action='store_true',
+        help='Recompute every section (ignore and keep the wake snapshot)',
+    )
+    parser.add_argument(
+        '--profile-startup', action='store_true',
+        help='Per-phase timing to stderr against startup_budget_ms '
+             '(clock starts at module load; interpreter startup not included)',
+    )
+    # Internal: the detached release-currency refresher (see get_release_currency)
+    parser.add_argument('--refresh-release-currency', action='store_true',
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--release-currency-timeout', type=int, default=5,
+                        help=argparse.SUPPRESS)
     parser.add_argument(
         '--version', action='version',
         version='wake_up.py 2.0.0 (AGET v3.6.0)',
     )
 
     args = parser.parse_args()
+    _phases = [('imports', (main_started - _start_time) * 1000)]
+    main_started = profile_phase('arguments', main_started)
 
     # L491: --verify mode
     if args.verify:
@@ -672,14 +1142,31 @@ Exit codes:
     if args.verbose:
         log_diagnostic(f"Found agent at: {agent_path}")
 
+    if args.refresh_release_currency:
+        try:
+            refresh_release_currency_cache(agent_path, args.release_currency_timeout)
+        finally:
+            (agent_path / RELEASE_CURRENCY_LOCK).unlink(missing_ok=True)
+        return 0
+
+    # L039: keep this run's timings (.aget/telemetry/wake_up.jsonl)
+    protocol_telemetry = _shared_module('protocol_telemetry')
+    telemetry_run = (protocol_telemetry.start_run('wake_up', agent_path, _start_time)
+                     if protocol_telemetry is not None else None)
+
     # Gather data
-    data = get_wake_data(agent_path)
+    main_started = profile_phase('find agent root', main_started)
+    data = get_wake_data(agent_path, use_snapshot=not args.no_snapshot)
+    main_started = time.time()
 
     if args.verbose:
         log_diagnostic(f"Data gathered, valid={data['valid']}")
 
     # C1 Extension Hook (WU-008)
     data = call_extension_hook(agent_path, data, verbose=args.verbose)
+    main_started = profile_phase('extension hook', main_started)
+    if _wake_snapshot is not None:
+        save_wake_snapshot(agent_path, _wake_snapshot)
 
     if args.verbose:
         log_diagnostic("Extension hook complete")
@@ -689,12 +1176,26 @@ Exit codes:
         print(json.dumps(data, indent=2 if args.pretty else None, default=str))
     else:
         print(format_human_output(data))
+    profile_phase('output', main_started)
+    exit_code = 0 if data['valid'] else 1
+    if telemetry_run is not None:
+        for name, ms in _phases:
+            telemetry_run.add_phase(name, ms)
+        telemetry_run.finish(exit_code)
+
+    if args.profile_startup:
+        for name, ms in _phases:
+            log_diagnostic(f"startup: {name:<32} {ms:7.1f}ms")
+        total = (time.time() - _start_time) * 1000
+        budget = data['config'].get('startup_budget_ms', DEFAULT_CONFIG['startup_budget_ms'])
+        verdict = 'OVER BUDGET' if budget and total > budget else 'within budget'
+        log_diagnostic(f"startup: total {total:.0f}ms ({verdict}, {budget}ms)")
 
     if args.verbose:
         elapsed = (time.time() - _start_time) * 1000
         log_diagnostic(f"Complete in {elapsed:.0f}ms")
 
-    return 0 if data['valid'] else 1
+    return exit_code
 
 
 if __name__ == '__main__':
@@ -53,12 +53,44 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+try:
+    import git_status  # scripts/git_status.py: one git call, cached per process
+except ImportError:    # older instance scripts/ (ADR-004): in-script git call
+    git_status = None
+try:
+    import session_catalog  # scripts/session_catalog.py: wake's newest-note index
+except ImportError:
+    session_catalog = None
+try:
+    import extension_hooks  # scripts/extension_hooks.py: cached hook modules, deadline
+except ImportError:
+    extension_hooks = None
+try:
+    import protocol_telemetry  # scripts/protocol_telemetry.py: per-run timing record
+except ImportError:
+    protocol_telemetry = None
+try:
+    import health_check  # scripts/health_check.py: load_health_check, in-process checks
+except ImportError:
+    health_check = None
+
+HEALTH_CHECK_TIMEOUT = 30  # seconds for the whole health check, in process or not
+
 
 # =============================================================================
 # L039: Diagnostic Efficiency - Timing
 # =============================================================================
 
 _start_time = time.time()
+_phases = None  # [(phase, ms)] for the telemetry record while main() runs
+
+
+def profile_phase(name: str, started: float) -> float:
+    """Record a phase that began at `started`; returns now."""
+    now = time.time()
+    if _phases is not None:
+        _phases.append((name, (now - started) * 1000))
+    return now
 
 
 def log_diagnostic(msg: str) -> None:
@@ -172,8 +204,66 @@ def load_json_file(path: Path, default: Any = None) -> Any:
         return default
 
 
+def _health_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The wind-down summary of a health_check --json document."""
+    return {
+        'status': data.get('status', 'unknown'),
+        'checks_passed': data.get('summary', {}).get('passed', 0),
+        'checks_total': data.get('summary', {}).get('total', 0),
+        'warnings': data.get('summary', {}).get('warnings', 0),
+        'errors': data.get('summary', {}).get('errors', 0),
+        'message': '',
+    }
+
+
+def _run_health_check_in_process(script_path: Path, agent_path: Path,
+                                 verbose: bool = False) -> Optional[Dict[str, Any]]:
+    """health_check.run_housekeeping + its extension hook, as `health_check.py
+    --json` would report them, without a second interpreter.
+
+    None when the script at script_path cannot be used this way (a copy that
+    does not declare health_check's HOUSEKEEPING_API_VERSION — never
+    imported, as for the reliance validator — or one that fails to load or
+    run): the caller then runs it as a subprocess. Loading, the checks and
+    the extension hook together get HEALTH_CHECK_TIMEOUT, the bound the
+    subprocess has; past it the summary reports the timeout.
+    """
+    if health_check is None or not hasattr(health_check, 'load_health_check'):
+        return None
+    import threading
+    outcome: Dict[str, Any] = {}
+
+    def run():
+        try:
+            module = health_check.load_health_check(script_path)
+            if module is None:
+                return
+            data = module.run_housekeeping(agent_path, verbose=verbose)
+            outcome['data'] = module.call_extension_hook(agent_path, data, verbose=verbose)
+        except Exception as e:
+            outcome['error'] = e
+
+    worker = threading.Thread(target=run, daemon=True, name='wind-down-health')
+    worker.start()
+    worker.join(HEALTH_CHECK_TIMEOUT)
+    if worker.is_alive():   # abandoned: a daemon thread never holds up exit
+        return {**_health_summary({'status': 'error', 'summary': {'errors': 1}}),
+                'message': f'Sanity check timed out after {HEALTH_CHECK_TIMEOUT}s'}
+    if 'error' in outcome and verbose:
+        log_diagnostic(f"In-process health check unavailable ({outcome['error']}); "
+                       "using subprocess")
+    data = outcome.get('data')
+    if not isinstance(data, dict) or not isinstance(data.get('summary'), dict):
+        return None
+    return _health_summary(data)
+
+
 def run_health_check(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
-    """CAP-SESSION-012: Run housekeeping health check before wind-down."""
+    """CAP-SESSION-012: Run housekeeping health check before wind-down.
+
+    In process when the located health_check.py offers a compatible
+    run_housekeeping; otherwise `health_check.py --json` as a subprocess.
+    """
     script_locations = [
         agent_path / 'scripts' / 'health_check.py',
         agent_path / '.aget' / 'patterns' / 'session' / 'health_check.py',
@@ -196,24 +286,20 @@ def run_health_check(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
             'message': 'No health check script found',
         }
 
+    summary = _run_health_check_in_process(script_path, agent_path, verbose)
+    if summary is not None:
+        return summary
+
     try:
         result = subprocess.run(
             [sys.executable, str(script_path), '--json'],
-            capture_output=True, text=True, timeout=30,
+            capture_output=True, text=True, timeout=HEALTH_CHECK_TIMEOUT,
             cwd=str(agent_path),
         )
 
         if result.stdout:
             try:
-                data = json.loads(result.stdout)
-                return {
-                    'status': data.get('status', 'unknown'),
-                    'checks_passed': data.get('summary', {}).get('passed', 0),
-                    'checks_total': data.get('summary', {}).get('total', 0),
-                    'warnings': data.get('summary', {}).get('warnings', 0),
-                    'errors': data.get('summary', {}).get('errors', 0),
-                    'message': '',
-                }
+                return _health_summary(json.loads(result.stdout))
             except json.JSONDecodeError:
                 pass
 
@@ -348,7 +434,10 @@ def scan_nuggets(agent_path: Path) -> List[Dict[str, Any]]:
 
 
 def get_uncommitted_changes(agent_path: Path) -> List[str]:
-    """Check for uncommitted git changes."""
+    """Check for uncommitted git changes (porcelain v1 lines)."""
+    if git_status is not None:
+        status = git_status.get_repo_status(agent_path)
+        return status['changes'] if status else []
     try:
         result = subprocess.run(
             ['git', 'status', '--porcelain'],
@@ -412,9 +501,12 @@ status: completed
 
     try:
         session_file.write_text(content)
-        return str(session_file.relative_to(agent_path))
     except IOError:
         return None
+    # Keep wake's session catalog current (its Pending Work comes from here)
+    if session_catalog is not None:
+        session_catalog.record_note(agent_path, session_file)
+    return str(session_file.relative_to(agent_path))
 
 
 def get_wind_down_data(agent_path: Path,
@@ -423,6 +515,7 @@ def get_wind_down_data(agent_path: Path,
                        verbose: bool = False) -> Dict[str, Any]:
     """Gather all data needed for wind down output."""
     now = datetime.now()
+    started = time.time()
 
     data = {
         'timestamp': now.isoformat(),
@@ -447,10 +540,12 @@ def get_wind_down_data(agent_path: Path,
     if current.get('started'):
         data['session']['started'] = current['started']
         try:
-            started = datetime.fromisoformat(current['started'])
-            data['session']['duration_seconds'] = int((now - started).total_seconds())
+            session_started = datetime.fromisoformat(current['started'])
+            data['session']['duration_seconds'] = int(
+                (now - session_started).total_seconds())
         except ValueError:
             pass
+    started = profile_phase('session state', started)
 
     # L021 Check 2: Sanity check (CAP-SESSION-012)
     if skip_health:
@@ -466,15 +561,19 @@ def get_wind_down_data(agent_path: Path,
         if verbose:
             log_diagnostic("Running health check...")
         data['health_check'] = run_health_check(agent_path, verbose)
+    started = profile_phase('health check', started)
 
     # L021 Check 3: Pending work
     data['pending_work'] = scan_pending_work(agent_path)
+    started = profile_phase('pending work', started)
 
     # Nuggets scan
     data['nuggets'] = scan_nuggets(agent_path)
+    started = profile_phase('nuggets', started)
 
     # Uncommitted changes
     data['uncommitted_changes'] = get_uncommitted_changes(agent_path)
+    started = profile_phase('git status', started)
 
     # CAP-SESSION-005: Mandatory handoff trigger
     if data['pending_work']:
@@ -482,6 +581,7 @@ def get_wind_down_data(agent_path: Path,
         session_file = create_session_file(agent_path, data, mandatory=True)
         if session_file:
             data['session_file'] = session_file
+        profile_phase('session file', started)
 
     # Determine clean close
     health_status = data['health_check'].get('status', 'unknown')
@@ -505,10 +605,17 @@ def call_extension_hook(agent_path: Path, data: Dict[str, Any],
     - Hook returns augmented data dict (additive-only per L464)
     - Hook absence = no-op
     - Hook failure = warning + continue
+
+    Run through scripts/extension_hooks.py when present (per-hook deadline,
+    latency recorded as data['extension_hook']).
     """
     ext_path = agent_path / 'scripts' / 'wind_down_ext.py'
     if not ext_path.exists():
         return data
+    if extension_hooks is not None:
+        return extension_hooks.run_hook(ext_path, 'wind_down_ext', 'post_wind_down', data,
+                                        timeout=extension_hooks.hook_timeout(agent_path),
+                                        log=log_diagnostic if verbose else None)
 
     try:
         spec = importlib.util.spec_from_file_location('wind_down_ext', str(ext_path))
@@ -642,6 +749,7 @@ def _recent_close_session_exists(agent_path, minutes=30):
 
 
 def main():
+    global _phases
     parser = argparse.ArgumentParser(
         description='Wind down protocol for AGET agents (v2.0.0)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -754,6 +862,11 @@ Exit codes:
         if args.verbose:
             log_diagnostic(f"Found agent at: {agent_path}")
 
+        # L039: keep this run's timings (.aget/telemetry/wind_down.jsonl)
+        telemetry_run = (protocol_telemetry.start_run('wind_down', agent_path, _start_time)
+                         if protocol_telemetry is not None else None)
+        _phases = []
+
         # Gather data
         data = get_wind_down_data(
             agent_path,
@@ -766,7 +879,9 @@ Exit codes:
             log_diagnostic(f"Data gathered, clean_close={data['clean_close']}")
 
         # C1 Extension Hook (WD-008)
+        started = time.time()
         data = call_extension_hook(agent_path, data, verbose=args.verbose)
+        started = profile_phase('extension hook', started)
 
         if args.verbose:
             log_diagnostic("Extension hook complete")
@@ -776,6 +891,7 @@ Exit codes:
             print(json.dumps(data, indent=2 if args.pretty else None, default=str))
         else:
             print(format_human_output(data))
+        profile_phase('output', started)
 
         if args.verbose:
             elapsed = (time.time() - _start_time) * 1000
@@ -787,9 +903,12 @@ Exit codes:
         # returning exit 1 for persistent warnings (e.g., skill drift)
         # trains users to ignore exit codes, defeating their purpose.
         health_status = data['health_check'].get('status', 'unknown')
-        if health_status == 'error':
-            return 2
-        return 0
+        exit_code = 2 if health_status == 'error' else 0
+        if telemetry_run is not None:
+            for name, ms in _phases:
+                telemetry_run.add_phase(name, ms)
+            telemetry_run.finish(exit_code)
+        return exit_code
 
     finally:
         # CAP-SESSION-010-03: Always release lock
@@ -0,0 +1,39 @@
+"""Smoke tests for scripts/bench_study_topic.py (synthetic corpus + harness)."""
+
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import bench_study_topic  # noqa: E402
+
+SMALL = {key: 3 for key in bench_study_topic.DEFAULT_COUNTS}
+
+
+def _snapshot(root):
+    return {str(p.relative_to(root)): p.read_text()
+            for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def test_generate_tree_is_deterministic(tmp_path):
+    a = bench_study_topic.generate_tree(tmp_path / "a" / "agent", SMALL, seed=7)
+    b = bench_study_topic.generate_tree(tmp_path / "b" / "agent", SMALL, seed=7)
+    assert a == b == {
+        "ldocs": 3, "patterns": 3, "plans": 3, "sops": 3, "governance": 3,
+        "specs": 3, "knowledge": 3, "ontology": 3, "sessions": 3, "inbox": 3,
+    }
+    assert _snapshot(tmp_path / "a" / "agent") == _snapshot(tmp_path / "b" / "agent")
+
+
+def test_run_benchmark_reports_every_surface(tmp_path):
+    root = tmp_path / "agent"
+    bench_study_topic.generate_tree(root, SMALL, seed=1)
+    report = bench_study_topic.run_benchmark(root, ["wake", "release signal"],
+                                             runs=2, jobs=2)
+    assert report["ranking_stability"]["stable"]
+    assert report["surface_files"]["knowledge"] == 6      # knowledge/ + ontology/
+    for data in report["topics"].values():
+        assert set(data["surfaces"]) == {key for key, _ in bench_study_topic.FINDERS}
+        assert data["main_ms"] > 0 and data["collect_jobs_ms"] is not None
+    assert "Ranking stability: STABLE" in bench_study_topic.format_report(report)
@@ -102,7 +102,7 @@ class TestCriticalPatternsEnhanced(unittest.TestCase):
             stderr=""
         )
 
-        result = wind_down_pattern()
+        result = wind_down_pattern(self.test_dir)
 
         # Check for success instead of message content
         self.assertIn(result['status'], ['success', 'completed', 'ready', 'signed_off'])
@@ -180,7 +180,7 @@ class TestCriticalPatternsEnhanced(unittest.TestCase):
 
         mock_run.side_effect = git_side_effect
 
-        result = sign_off_pattern()
+        result = sign_off_pattern(self.test_dir)
 
         # Should still succeed but skip push
         self.assertIn(result['status'], ['success', 'completed', 'ready', 'signed_off'])
@@ -228,19 +228,19 @@ class TestCriticalPatternsEnhanced(unittest.TestCase):
 
         # Test wake performance
         start = time.time()
-        wake_pattern()
+        wake_pattern(self.test_dir)
         wake_time = time.time() - start
         self.assertLess(wake_time, 2.0, "Wake pattern exceeded 2 second limit")
 
         # Test wind_down performance
         start = time.time()
-        wind_down_pattern()
+        wind_down_pattern(self.test_dir)
         wind_time = time.time() - start
         self.assertLess(wind_time, 2.0, "Wind down pattern exceeded 2 second limit")
 
         # Test sign_off performance
         start = time.time()
-        sign_off_pattern()
+        sign_off_pattern(self.test_dir)
         sign_time = time.time() - start
         self.assertLess(sign_time, 2.0, "Sign off pattern exceeded 2 second limit")
 
@@ -251,13 +251,13 @@ class TestCriticalPatternsEnhanced(unittest.TestCase):
             mock_run.side_effect = Exception("Unexpected error")
 
             # Patterns should handle errors without crashing
-            result = wake_pattern()
+            result = wake_pattern(self.test_dir)
             self.assertIn('status', result)
 
-            result = wind_down_pattern()
+            result = wind_down_pattern(self.test_dir)
             self.assertIn('status', result)
 
-            result = sign_off_pattern()
+            result = sign_off_pattern(self.test_dir)
             self.assertIn('status', result)
 
 
@@ -0,0 +1,103 @@
+"""scripts/extension_hooks.py: instance hooks run under a deadline, loaded once
+per edit, with their outcome recorded and the fail-soft contract intact."""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import extension_hooks  # noqa: E402
+import health_check  # noqa: E402
+import study_topic  # noqa: E402
+import wake_up  # noqa: E402
+import wind_down  # noqa: E402
+
+
+@pytest.fixture
+def agent(tmp_path):
+    agent = tmp_path / "agent"
+    (agent / "scripts").mkdir(parents=True)
+    (agent / ".aget").mkdir()
+    extension_hooks.clear_cache()
+    yield agent
+    extension_hooks.clear_cache()
+
+
+def _hook(agent, name, body, timeout=None):
+    path = agent / "scripts" / name
+    path.write_text(body)
+    if timeout is not None:
+        (agent / ".aget" / "config.json").write_text(
+            json.dumps({"extension_hooks": {"timeout_seconds": timeout}}))
+    return path
+
+
+def test_slow_hook_is_abandoned_at_its_deadline(agent):
+    _hook(agent, "wake_up_ext.py", "import time\n"
+          "def post_wake(data):\n    data['late'] = True\n    time.sleep(5)\n    return data\n",
+          timeout=0.2)
+    data = {"agent_path": str(agent)}
+    started = time.perf_counter()
+    result = wake_up.call_extension_hook(agent, data)
+    assert time.perf_counter() - started < 2
+    assert "late" not in result and "late" not in data
+    assert result["extension_hook"]["status"] == "timed_out"
+
+
+def test_hook_module_is_loaded_once_per_edit(agent):
+    ext = _hook(agent, "wind_down_ext.py", "LOADS = []\nLOADS.append(1)\n"
+                "def post_wind_down(data):\n    return {**data, 'loads': len(LOADS), 'v': 1}\n")
+    first = wind_down.call_extension_hook(agent, {"x": 1})
+    second = wind_down.call_extension_hook(agent, {"x": 1})
+    assert (first["loads"], first["extension_hook"]["cached"]) == (1, False)
+    assert (second["loads"], second["extension_hook"]["cached"]) == (1, True)
+    assert second["extension_hook"]["status"] == "ok"
+    assert second["extension_hook"]["duration_ms"] >= 0
+
+    ext.write_text(ext.read_text().replace("'v': 1", "'v': 2"))
+    os.utime(ext, (time.time() + 5, time.time() + 5))
+    assert wind_down.call_extension_hook(agent, {"x": 1})["v"] == 2
+
+
+def test_failing_hook_warns_and_keeps_data(agent, capsys):
+    _hook(agent, "health_check_ext.py",
+          "def post_health(data):\n    data['checks'].append('half')\n    raise RuntimeError('boom')\n")
+    data = {"checks": ["a"]}
+    result = health_check.call_extension_hook(agent, data)
+    assert result["checks"] == ["a"] and data == {"checks": ["a"]}
+    assert result["extension_hook"]["status"] == "error"
+    assert "health_check extension hook failed: boom" in capsys.readouterr().err
+
+
+def test_non_dict_hook_keeps_in_place_changes(agent):
+    _hook(agent, "wake_up_ext.py", "def post_wake(data):\n    data['added'] = 1\n")
+    result = wake_up.call_extension_hook(agent, {"a": 0})
+    assert result["added"] == 1 and result["extension_hook"]["status"] == "non_dict"
+
+
+def test_no_limit_runs_inline(agent):
+    _hook(agent, "wake_up_ext.py",
+          "import threading\ndef post_wake(data):\n"
+          "    return {**data, 'thread': threading.current_thread().name}\n", timeout=0)
+    result = wake_up.call_extension_hook(agent, {})
+    assert result["thread"] == "MainThread" and result["extension_hook"]["status"] == "ok"
+
+
+def test_study_hook_and_absent_hooks(agent, monkeypatch):
+    monkeypatch.setattr(study_topic, "get_agent_root", lambda: agent)
+    assert study_topic.call_extension_hook({"findings": {}}) == {"findings": {}}
+    _hook(agent, "study_topic_ext.py", "x = 1\n")
+    payload = study_topic.call_extension_hook({"findings": {}})
+    assert payload["extension_hook"]["status"] == "no_hook"
+
+
+def test_in_script_fallback_without_runner(agent, monkeypatch):
+    _hook(agent, "wake_up_ext.py", "def post_wake(data):\n    return {**data, 'hooked': True}\n")
+    monkeypatch.setattr(wake_up, "extension_hooks", None)
+    assert wake_up.call_extension_hook(agent, {}) == {"hooked": True}
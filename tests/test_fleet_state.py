@@ -0,0 +1,108 @@
+"""scripts/fleet_state.py: the cached registry equals yaml.safe_load of the YAML,
+and is served without parsing while the YAML's content is unchanged."""
+
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import fleet_scope  # noqa: E402
+import fleet_state  # noqa: E402
+import wake_up  # noqa: E402
+
+REGISTRY = """\
+metadata:
+  active_agents: 3
+  updated: 2026-09-30
+  generated: 2026-09-30 12:00:00
+fleet:
+  core:
+    agents:
+      - {name: alpha, location: ~/github/alpha, status: active}
+      - {name: beta, path: /srv/beta, status: active}
+  research:
+    agents:
+      - {name: gamma, location: ~/github/gamma, status: retired}
+      - {name: delta, location: ~/github/delta, status: active}
+"""
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "agent" / ".aget" / "fleet" / "FLEET_STATE.yaml"
+    path.parent.mkdir(parents=True)
+    path.write_text(REGISTRY)
+    return path
+
+
+def _no_yaml(monkeypatch):
+    def parse(text):
+        raise AssertionError("registry re-parsed")
+    monkeypatch.setattr(fleet_state, "parse_yaml", parse)
+
+
+def test_cache_round_trips_safe_load(registry, monkeypatch):
+    expected = yaml.safe_load(REGISTRY)
+    assert fleet_state.load_fleet_state(registry) == expected
+    assert fleet_state.last_load["source"] == "yaml"
+    assert fleet_state.cache_path(registry) == registry.parents[1] / "cache" / "fleet_state.json"
+
+    _no_yaml(monkeypatch)
+    cached = fleet_state.load_fleet_state(registry)
+    assert cached == expected and fleet_state.last_load["source"] == "cache"
+    assert cached["metadata"]["updated"] == date(2026, 9, 30)
+
+
+def test_touch_is_served_by_content_hash(registry, monkeypatch):
+    fleet_state.load_fleet_state(registry)
+    os.utime(registry, (1_800_000_000, 1_800_000_000))
+    _no_yaml(monkeypatch)
+    assert fleet_state.load_fleet_state(registry) == yaml.safe_load(REGISTRY)
+    assert fleet_state.last_load["source"] == "cache (content unchanged)"
+    fleet_state.load_fleet_state(registry)
+    assert fleet_state.last_load["source"] == "cache"
+
+
+def test_changed_registry_is_reparsed(registry):
+    fleet_state.load_fleet_state(registry)
+    registry.write_text(REGISTRY.replace("retired", "active"))
+    os.utime(registry, (1_800_000_000, 1_800_000_000))
+    data = fleet_state.load_fleet_state(registry)
+    assert data["fleet"]["research"]["agents"][0]["status"] == "active"
+    assert fleet_state.last_load["source"] == "yaml"
+
+
+def test_lossy_registry_is_not_cached(tmp_path):
+    path = tmp_path / "FLEET_STATE.yaml"
+    path.write_text("seats:\n  1: alpha\n  2: beta\n")
+    assert fleet_state.load_fleet_state(path) == {"seats": {1: "alpha", 2: "beta"}}
+    assert not fleet_state.cache_path(path).exists()
+    assert fleet_state.load_fleet_state(path) == {"seats": {1: "alpha", 2: "beta"}}
+
+
+def test_malformed_registry_raises_value_error(tmp_path):
+    path = tmp_path / "FLEET_STATE.yaml"
+    path.write_text("fleet: [unclosed\n")
+    with pytest.raises(ValueError):
+        fleet_state.load_fleet_state(path)
+
+
+def test_consumers_match_plain_safe_load(registry, monkeypatch):
+    agent = registry.parents[2]
+    cached_agents = fleet_scope.load_agents(registry)
+    counts = wake_up._read_fleet_state(agent)
+
+    monkeypatch.setattr(wake_up, "fleet_state", None)
+    assert wake_up._read_fleet_state(agent) == counts
+    assert counts["filesystem_count"] == 3 and counts["drift"] is False
+
+    monkeypatch.setitem(sys.modules, "fleet_state", None)   # instance predating the module
+    assert fleet_scope.load_agents(registry) == cached_agents
+    assert [name for name, _ in cached_agents] == ["alpha", "beta", "gamma", "delta"]
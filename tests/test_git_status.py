@@ -0,0 +1,91 @@
+"""scripts/git_status.py: porcelain v2 parsed back to the v1 lines callers show."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import git_status  # noqa: E402
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@example.com",
+                           *args], cwd=repo, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    for name in ("kept.txt", "edited.txt", "staged.txt", "gone.txt", "old name.txt"):
+        (repo / name).write_text(f"{name}\n" * 20)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+    git_status.clear_cache()
+    yield repo
+    git_status.clear_cache()
+
+
+def _v1(repo):
+    return _git(repo, "status", "--porcelain").splitlines()
+
+
+def test_changes_match_porcelain_v1(repo):
+    (repo / "edited.txt").write_text("changed\n")
+    (repo / "staged.txt").write_text("staged\n")
+    _git(repo, "add", "staged.txt")
+    (repo / "staged.txt").write_text("staged, then edited\n")
+    (repo / "gone.txt").unlink()
+    _git(repo, "mv", "old name.txt", "new name.txt")
+    (repo / "new dir").mkdir()
+    (repo / "new dir" / "a.txt").write_text("a\n")
+    (repo / "tab\there.txt").write_text("quoted path\n")
+    (repo / "kept.txt").rename(repo / "kept copy.txt")
+    status = git_status.get_repo_status(repo)
+    assert status["changes"] == _v1(repo)
+    assert status["branch"] == "main" and status["clean"] is False
+    assert status["upstream"] is None and status["ahead"] is None
+
+
+def test_clean_tree_and_upstream_counts(repo, tmp_path):
+    assert git_status.get_repo_status(repo)["clean"] is True
+    clone = tmp_path / "clone"
+    _git(tmp_path, "clone", "-q", str(repo), str(clone))
+    (clone / "kept.txt").write_text("local\n")
+    _git(clone, "commit", "-q", "-am", "local")
+    (repo / "kept.txt").write_text("remote\n")
+    _git(repo, "commit", "-q", "-am", "remote 1")
+    _git(repo, "commit", "-q", "--allow-empty", "-m", "remote 2")
+    _git(clone, "fetch", "-q")
+    status = git_status.get_repo_status(clone)
+    assert (status["upstream"], status["ahead"], status["behind"]) == ("origin/main", 1, 2)
+
+
+def test_detached_head_uses_rev_parse_spelling(repo):
+    _git(repo, "checkout", "-q", "--detach")
+    assert git_status.get_repo_status(repo)["branch"] == \
+        _git(repo, "rev-parse", "--abbrev-ref", "HEAD").strip() == "HEAD"
+
+
+def test_status_is_cached_per_process(repo, monkeypatch):
+    first = git_status.get_repo_status(repo)
+    (repo / "edited.txt").write_text("changed\n")
+    calls = []
+    real_run = subprocess.run
+    monkeypatch.setattr(git_status.subprocess, "run",
+                        lambda *a, **k: calls.append(a) or real_run(*a, **k))
+    assert git_status.get_repo_status(repo) == first
+    assert git_status.get_repo_status(repo, refresh=True)["changes"] == [" M edited.txt"]
+    assert len(calls) == 1
+
+
+def test_not_a_repository(tmp_path):
+    assert git_status.get_repo_status(tmp_path) is None
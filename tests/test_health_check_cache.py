@@ -0,0 +1,80 @@
+"""health_check result cache: unchanged checks are served from their last run,
+and any change to a check's declared inputs re-runs exactly that check."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import health_check  # noqa: E402
+
+
+@pytest.fixture
+def agent(tmp_path):
+    (tmp_path / ".aget").mkdir()
+    (tmp_path / ".aget" / "version.json").write_text('{"aget_version": "3.26.0"}')
+    (tmp_path / "sessions").mkdir()
+    skill = tmp_path / ".claude" / "skills" / "aget-file-issue"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: aget-file-issue\n---\n")
+    return tmp_path
+
+
+@pytest.fixture
+def ran(monkeypatch):
+    """Names of the check functions each run_housekeeping call actually ran."""
+    calls = []
+    real = health_check.run_checks
+
+    def spy(checks, *args, **kwargs):
+        calls.append([fn.__name__ for fn in checks])
+        return real(checks, *args, **kwargs)
+    monkeypatch.setattr(health_check, "run_checks", spy)
+    return calls
+
+
+def _report(data):
+    return [(c["name"], c["passed"], c["message"]) for c in data["checks"]], data["summary"]
+
+
+def test_unchanged_tree_is_served_from_cache(agent, ran):
+    first = health_check.run_housekeeping(agent)
+    second = health_check.run_housekeeping(agent)
+    assert len(ran[0]) == len(health_check.CHECKS) and ran[1] == []
+    assert _report(second) == _report(first)
+    assert all(check["cached"] for check in second["checks"])
+    assert second["cache"] == {"enabled": True, "hits": len(health_check.CHECKS), "runs": 0}
+
+
+def test_changed_inputs_rerun_only_their_checks(agent, ran):
+    health_check.run_housekeeping(agent)
+    time.sleep(0.01)
+    (agent / ".aget" / "version.json").write_text('{"aget_version": "3.27.0"}')
+    skill_md = agent / ".claude" / "skills" / "aget-file-issue" / "SKILL.md"
+    skill_md.write_text("---\nname: aget-file-issue\ndisable-model-invocation: true\n---\n")
+    data = health_check.run_housekeeping(agent)
+    assert sorted(ran[-1]) == ["check_structural_skill_frontmatter", "check_version_json"]
+    by_name = {check["name"]: check for check in data["checks"]}
+    assert by_name["version_json"]["message"] == "v3.27.0"
+    assert by_name["structural_skill_frontmatter"]["severity"] == "error"
+    assert data["status"] == "error"
+
+
+def test_no_cache_reruns_everything_and_refreshes(agent, ran):
+    health_check.run_housekeeping(agent)
+    data = health_check.run_housekeeping(agent, use_cache=False)
+    assert len(ran[-1]) == len(health_check.CHECKS)
+    assert not any(check.get("cached") for check in data["checks"])
+    health_check.run_housekeeping(agent)
+    assert ran[-1] == []
+
+
+def test_new_script_version_invalidates_results(agent, ran, monkeypatch):
+    health_check.run_housekeeping(agent)
+    monkeypatch.setattr(health_check, "_script_stamp", lambda: 1)
+    health_check.run_housekeeping(agent)
+    assert len(ran[-1]) == len(health_check.CHECKS)
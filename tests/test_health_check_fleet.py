@@ -0,0 +1,106 @@
+"""health_check --fleet: every seat fleet_scope resolves from the registry is
+checked in a process pool and aggregated; missing seats are reported."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("yaml")
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import health_check  # noqa: E402
+
+
+def _seat(root, name, version="3.26.0", sessions=True):
+    seat = root / name
+    (seat / ".aget").mkdir(parents=True)
+    (seat / ".aget" / "version.json").write_text(json.dumps({"aget_version": version}))
+    if sessions:
+        (seat / "sessions").mkdir()
+    return seat
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    _seat(tmp_path, "alpha")
+    _seat(tmp_path, "beta", sessions=False)
+    (tmp_path / "plain").mkdir()
+    registry = tmp_path / "FLEET_STATE.yaml"
+    registry.write_text(
+        "fleet:\n  agents:\n"
+        f"    - {{name: alpha, location: {tmp_path / 'alpha'}}}\n"
+        f"    - {{name: beta, location: {tmp_path / 'beta'}}}\n"
+        f"    - {{name: gone, location: {tmp_path / 'gone'}}}\n"
+        f"    - {{name: plain, path: {tmp_path / 'plain'}}}\n")
+    return registry
+
+
+def _cli(*args):
+    return subprocess.run([sys.executable, str(REPO / "scripts" / "health_check.py"), *args],
+                          capture_output=True, text=True,
+                          env={**os.environ, "AGET_TELEMETRY": "0"})
+
+
+def test_fleet_matches_per_seat_runs_and_aggregates(fleet):
+    root = fleet.parent
+    agents = [("alpha", root / "alpha"), ("beta", root / "beta"), ("gone", root / "gone")]
+    data = health_check.run_fleet(agents, workers=2)
+    alpha, beta, gone = data["seats"]
+    for seat in (alpha, beta):
+        single = health_check.run_housekeeping(Path(seat["path"]), use_cache=False)
+        assert (seat["status"], seat["summary"]) == (single["status"], single["summary"])
+    assert gone == {"name": "gone", "path": str(root / "gone"), "status": "unresolvable",
+                    "reason": "location does not exist"}
+    assert "sessions_directory" in [check["name"] for check in beta["failed"]]
+    assert data["checks"]["sessions_directory"]["seats"] == ["beta"]
+    assert data["summary"]["seats"] == 3 and data["summary"]["unresolvable"] == 1
+
+
+def test_sweep_leaves_seat_trees_untouched(fleet):
+    root = fleet.parent
+    before = sorted(p.relative_to(root) for p in root.rglob("*"))
+    health_check.run_fleet([("alpha", root / "alpha")], workers=1)
+    assert sorted(p.relative_to(root) for p in root.rglob("*")) == before
+
+
+def test_sweep_writes_nothing_into_the_seat(fleet, monkeypatch):
+    """No attestation cache and no __pycache__/ for the seat's validator,
+    whatever PYTHONDONTWRITEBYTECODE says."""
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    seat = fleet.parent / "alpha"
+    (seat / "scripts").mkdir()
+    shutil.copy(REPO / "scripts" / "check_skill_reliance_manifest.py", seat / "scripts")
+    (seat / ".aget" / "skill_reliance_manifest.yaml").write_text(
+        "meta: {as_of_version: 3.26.0}\ncore_S: [aget-wake-up]\n")
+    (seat / ".claude" / "skills" / "aget-wake-up").mkdir(parents=True)
+    before = sorted(seat.rglob("*"))
+    result = health_check._sweep_seat("alpha", str(seat), jobs=None, timeout=None)
+    assert result["status"] != "error"
+    assert sorted(seat.rglob("*")) == before
+
+
+def test_cli_fleet_json_and_table(fleet):
+    result = _cli("--fleet", "--registry", str(fleet), "--json", "--workers", "2")
+    data = json.loads(result.stdout)
+    assert [seat["name"] for seat in data["seats"]] == ["alpha", "beta", "gone", "plain"]
+    assert data["seats"][3]["reason"] == "no .aget/ directory"
+    assert data["registry"] == str(fleet)
+    assert result.returncode == {"error": 2, "warning": 1}.get(data["status"], 0)
+
+    table = _cli("--fleet", "--registry", str(fleet)).stdout
+    assert "=== AGET Fleet Health Report ===" in table
+    assert "2 unresolvable" in table and "Failing checks across the fleet:" in table
+
+
+def test_cli_fleet_rejects_missing_registry_and_selection(tmp_path):
+    missing = _cli("--fleet", "--registry", str(tmp_path / "nope.yaml"))
+    assert missing.returncode == 3 and "registry not found" in missing.stderr
+    selected = _cli("--fleet", "--only", "version_json")
+    assert selected.returncode == 3
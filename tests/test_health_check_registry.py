@@ -0,0 +1,89 @@
+"""health_check CHECKS registry: selection by name/tag (with dependencies) and
+the changed-since-last-run mode."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import health_check  # noqa: E402
+
+
+@pytest.fixture
+def agent(tmp_path):
+    (tmp_path / ".aget").mkdir()
+    (tmp_path / ".aget" / "version.json").write_text('{"aget_version": "3.26.0"}')
+    (tmp_path / "sessions").mkdir()
+    (tmp_path / ".claude").mkdir()
+    (tmp_path / ".claude" / "settings.json").write_text('{"permissions": {"allow": []}}')
+    return tmp_path
+
+
+def _names(data):
+    return [check["name"] for check in data["checks"]]
+
+
+def test_registry_covers_every_check_function():
+    registered = {spec.fn for spec in health_check.CHECKS}
+    defined = {getattr(health_check, name) for name in dir(health_check)
+               if name.startswith("check_") and callable(getattr(health_check, name))}
+    assert registered == defined
+    assert {tag for spec in health_check.CHECKS for tag in spec.tags} == \
+        {"structure", "governance", "permissions", "skills"}
+
+
+def test_full_run_keeps_serial_order(agent):
+    data = health_check.run_housekeeping(agent)
+    assert _names(data) == [spec.name for spec in health_check.CHECKS]
+    assert "selection" not in data
+
+
+def test_only_and_tags_pull_in_dependencies(agent):
+    data = health_check.run_housekeeping(agent, only=["version_json", "check_config_size"])
+    assert _names(data) == [".aget_directory", "version_json", "config_size"]
+    data = health_check.run_housekeeping(agent, tags=["permissions"])
+    assert _names(data) == ["permission_accumulation"]
+    assert data["summary"]["total"] == 1
+    with pytest.raises(ValueError, match="unknown check or tag: nope"):
+        health_check.select_checks(["nope"])
+
+
+def test_changed_reruns_only_checks_whose_inputs_moved(agent):
+    health_check.run_housekeeping(agent)
+    data = health_check.run_housekeeping(agent, changed_only=True)
+    assert _names(data) == [] and data["status"] == "healthy"
+    assert len(data["selection"]["unchanged"]) == len(health_check.CHECKS)
+
+    time.sleep(0.01)
+    settings = agent / ".claude" / "settings.json"
+    settings.write_text('{"permissions": {"allow": ["Bash(ls:*)"]}}')
+    (agent / "AGENTS.md").write_text("# Agent\n")
+    data = health_check.run_housekeeping(agent, changed_only=True)
+    assert _names(data) == ["config_size", "permission_accumulation"]
+    assert health_check.run_housekeeping(agent, changed_only=True)["checks"] == []
+
+
+def test_timed_out_check_is_not_recorded_as_current(agent, monkeypatch):
+    def hangs(agent_path):
+        time.sleep(5)
+    spec = health_check.CheckSpec(hangs, "hangs", ("structure",), ("AGENTS.md",))
+    monkeypatch.setattr(health_check, "CHECKS", [spec])
+    health_check.run_housekeeping(agent, timeout=0.1)
+    data = health_check.run_housekeeping(agent, timeout=0.1, changed_only=True)
+    assert _names(data) == ["hangs"]
+
+
+def test_cli_list_and_unknown_filter(agent):
+    script = str(REPO / "scripts" / "health_check.py")
+    listed = subprocess.run([sys.executable, script, "--list"], capture_output=True, text=True)
+    assert listed.returncode == 0 and "permission_accumulation" in listed.stdout
+    bad = subprocess.run([sys.executable, script, "--dir", str(agent), "--tags", "nope"],
+                         capture_output=True, text=True,
+                         env={**os.environ, "AGET_TELEMETRY": "0"})
+    assert bad.returncode == 3 and "unknown check or tag" in bad.stderr
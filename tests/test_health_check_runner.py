@@ -0,0 +1,68 @@
+"""health_check.run_checks: checks run concurrently under per-check timeouts,
+with results (and so the report) in the serial order."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import health_check  # noqa: E402
+from health_check import CheckResult  # noqa: E402
+
+
+def _sleeper(name, seconds, passed=True):
+    def check(agent_path):
+        time.sleep(seconds)
+        return CheckResult(name, passed, f"slept {seconds}")
+    check.__name__ = f"check_{name}"
+    return check
+
+
+def _raises(agent_path):
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def agent(tmp_path):
+    (tmp_path / ".aget").mkdir()
+    (tmp_path / ".aget" / "version.json").write_text('{"aget_version": "3.26.0"}')
+    (tmp_path / "sessions").mkdir()
+    return tmp_path
+
+
+def _strip(data):
+    data.pop("timestamp")
+    for check in data["checks"]:
+        assert check.pop("duration_ms") >= 0
+    return data
+
+
+def test_parallel_report_equals_serial(agent):
+    assert _strip(health_check.run_housekeeping(agent, jobs=8, use_cache=False)) == \
+        _strip(health_check.run_housekeeping(agent, jobs=1, use_cache=False))
+
+
+def test_io_bound_checks_overlap(agent):
+    checks = [_sleeper(f"slow{i}", 0.2) for i in range(4)]
+    started = time.monotonic()
+    results = health_check.run_checks(checks, agent, jobs=4)
+    assert time.monotonic() - started < 0.6
+    assert [r.name for r in results] == ["slow0", "slow1", "slow2", "slow3"]
+    assert all(r.duration_ms >= 150 for r in results)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_hung_check_times_out_without_blocking_the_rest(agent, jobs):
+    checks = [_sleeper("hangs", 5), _sleeper("quick", 0), _raises, _sleeper("last", 0, passed=False)]
+    started = time.monotonic()
+    results = health_check.run_checks(checks, agent, jobs=jobs, timeout=0.3)
+    assert time.monotonic() - started < 2
+    assert [r.name for r in results] == ["hangs", "quick", "_raises", "last"]
+    hung, quick, raised, last = results
+    assert (hung.passed, hung.severity, hung.message) == (False, "warning", "timed out after 0.3s")
+    assert quick.passed and not last.passed
+    assert (raised.passed, raised.message) == (False, "check raised: boom")
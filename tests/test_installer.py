@@ -43,11 +43,16 @@ def test_installer_minimal_template():
         template_dir.mkdir(parents=True, exist_ok=True)
 
         claude_template = template_dir / 'CLAUDE.md'
-        if not claude_template.exists():
+        created = not claude_template.exists()
+        if created:
             claude_template.write_text("# Test Template\n{{PROJECT_NAME}}")
 
         # Run installation
-        success = installer.install()
+        try:
+            success = installer.install()
+        finally:
+            if created:
+                claude_template.unlink()
         assert success is True
 
         # Check that files were created
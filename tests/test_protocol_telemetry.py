@@ -0,0 +1,101 @@
+"""scripts/protocol_telemetry.py: each protocol run appends a timing record,
+and the report shows p50/p95 per phase per version, flagging regressions."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import protocol_telemetry  # noqa: E402
+
+
+@pytest.fixture
+def agent(tmp_path):
+    agent = tmp_path / "agent"
+    (agent / ".aget").mkdir(parents=True)
+    (agent / ".aget" / "version.json").write_text('{"aget_version": "3.25.0"}')
+    (agent / ".aget" / "config.json").write_text(json.dumps({"wake_up": {
+        "show_git_status": False, "show_release_currency": False}}))
+    return agent
+
+
+def _run(script, agent, *args, env=None):
+    return subprocess.run([sys.executable, str(REPO / "scripts" / script), "--dir", str(agent),
+                           *args], capture_output=True, text=True,
+                          env={**os.environ, "AGET_TELEMETRY": "1", **(env or {})})
+
+
+def _records(agent, protocol):
+    path = agent / protocol_telemetry.TELEMETRY_DIR / f"{protocol}.jsonl"
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize("script,protocol,phase", [
+    ("wake_up.py", "wake_up", "imports"),
+    ("health_check.py", "health_check", "check version_json"),
+])
+def test_each_run_appends_a_record(agent, script, protocol, phase):
+    first = _run(script, agent)
+    _run(script, agent)
+    records = _records(agent, protocol)
+    assert len(records) == 2
+    record = records[-1]
+    assert record["protocol"] == protocol and record["aget_version"] == "3.25.0"
+    assert record["exit_code"] == first.returncode
+    assert phase in records[0]["phases"] and record["total_ms"] > 0   # run 2 may be cached
+    assert record["files_opened"] >= 1 and record["subprocesses"] >= 0
+
+
+def test_wind_down_records_its_phases(agent):
+    _run("wind_down.py", agent, "--force", "--skip-health")
+    phases = _records(agent, "wind_down")[0]["phases"]
+    assert list(phases)[:3] == ["session state", "health check", "pending work"]
+
+
+def test_wind_down_with_a_started_session(agent):
+    (agent / ".aget" / "session_state.json").write_text(json.dumps(
+        {"current_session": {"started": "2026-10-01T09:00:00"}}))
+    result = _run("wind_down.py", agent, "--force", "--skip-health")
+    assert "Traceback" not in result.stderr
+    assert "session state" in _records(agent, "wind_down")[0]["phases"]
+
+
+def test_disabled_by_environment_and_config(agent):
+    _run("wake_up.py", agent, env={"AGET_TELEMETRY": "0"})
+    config = json.loads((agent / ".aget" / "config.json").read_text())
+    (agent / ".aget" / "config.json").write_text(json.dumps({**config, "telemetry": {"enabled": False}}))
+    _run("wake_up.py", agent)
+    assert not (agent / protocol_telemetry.TELEMETRY_DIR).exists()
+
+
+def test_report_flags_phase_regressed_after_upgrade(agent):
+    path = agent / protocol_telemetry.TELEMETRY_DIR / "wake_up.jsonl"
+    path.parent.mkdir(parents=True)
+    lines = []
+    for i, (version, git_ms) in enumerate([("3.25.0", 10)] * 5 + [("3.26.0", 40)] * 5):
+        lines.append(json.dumps({"ts": f"2026-10-01T00:00:{i:02d}", "protocol": "wake_up",
+                                 "aget_version": version, "total_ms": 50 + git_ms,
+                                 "phases": {"git": git_ms + i % 2, "config": 1.0},
+                                 "subprocesses": 2}))
+    path.write_text("\n".join(lines) + '\n{"ts": "torn')
+    summary = protocol_telemetry.summarize(protocol_telemetry.load_records(agent))
+    old, new = summary["wake_up"]
+    assert (old["version"], old["runs"], new["version"]) == ("3.25.0", 5, "3.26.0")
+    assert old["phases"]["git"]["p50"] == 10 and new["phases"]["git"]["p95"] == 41
+    assert new["phases"]["git"]["regressed"] and not new["phases"]["config"]["regressed"]
+    report = protocol_telemetry.format_report(summary)
+    flagged = [line.split()[0] for line in report.splitlines() if "REGRESSED" in line]
+    assert flagged == ["total", "git"]
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert protocol_telemetry.percentile(values, 50) == 50
+    assert protocol_telemetry.percentile(values, 95) == 95
+    assert protocol_telemetry.percentile([7], 95) == 7
@@ -0,0 +1,102 @@
+"""Reliance-manifest attestation in process: the same verdict and line the
+validator's CLI gives, memoized until one of its inputs changes."""
+
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("yaml")
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import check_skill_reliance_manifest  # noqa: E402
+import health_check  # noqa: E402
+import wake_up  # noqa: E402
+
+VALIDATOR = REPO / "scripts" / "check_skill_reliance_manifest.py"
+
+
+@pytest.fixture
+def agent(tmp_path):
+    agent = tmp_path / "agent"
+    (agent / "scripts").mkdir(parents=True)
+    shutil.copy(VALIDATOR, agent / "scripts" / VALIDATOR.name)
+    (agent / ".aget").mkdir()
+    (agent / ".aget" / "skill_reliance_manifest.yaml").write_text(
+        "meta: {as_of_version: 3.26.0}\ncore_S: [aget-wake-up]\noptional_O: [aget-record-lesson]\n")
+    for skill in ("aget-wake-up", "aget-record-lesson", "aget-undeclared"):
+        (agent / ".claude" / "skills" / skill).mkdir(parents=True)
+    return agent
+
+
+def _cli(agent):
+    r = subprocess.run([sys.executable, str(agent / "scripts" / VALIDATOR.name)],
+                       capture_output=True, text=True, cwd=agent)
+    return {"ok": r.returncode == 0, "summary": r.stdout.strip().splitlines()[-1]}
+
+
+def _validator(agent):
+    return check_skill_reliance_manifest.load_validator(agent / "scripts" / VALIDATOR.name)
+
+
+def test_in_process_matches_cli(agent):
+    expected = _cli(agent)
+    assert expected["summary"].startswith("  [WARN] C5-coverage")
+    assert wake_up.get_reliance_attestation(agent) == expected
+    result = health_check.check_reliance_manifest(agent)
+    assert (result.passed, result.message) == (expected["ok"], expected["summary"])
+
+    shutil.rmtree(agent / ".claude" / "skills" / "aget-wake-up")
+    expected = _cli(agent)
+    assert expected["ok"] is False
+    assert wake_up.get_reliance_attestation(agent) == expected
+
+
+def test_attestation_is_memoized_by_input_mtimes(agent, monkeypatch):
+    module = _validator(agent)
+    first = module.attest(agent)
+    calls = []
+    real_validate = module.validate
+    monkeypatch.setattr(module, "validate", lambda repo=None: calls.append(repo) or real_validate(repo))
+    assert module.attest(agent) == first
+    assert calls == []
+
+    time.sleep(0.01)
+    (agent / ".claude" / "skills" / "aget-another").mkdir()
+    assert module.attest(agent)["summary"] != first["summary"]
+    assert len(calls) == 1
+
+
+def test_validator_without_attest_runs_as_subprocess(tmp_path):
+    agent = tmp_path / "agent"
+    (agent / ".aget").mkdir(parents=True)
+    (agent / ".aget" / "skill_reliance_manifest.yaml").write_text("core_S: []\n")
+    (agent / "scripts").mkdir()
+    (agent / "scripts" / VALIDATOR.name).write_text(
+        "import sys\nprint('legacy: FAIL')\nsys.exit(1)\n")
+    assert _validator(agent) is None
+    assert wake_up.get_reliance_attestation(agent) == {"ok": False, "summary": "legacy: FAIL"}
+    result = health_check.check_reliance_manifest(agent)
+    assert (result.passed, result.message) == (False, "legacy: FAIL")
+
+
+@pytest.mark.parametrize("source", [
+    "# def attest(repo): in-process API, someday\nimport sys\nprint('legacy: FAIL')\n",
+    "HELP = 'def attest('\nimport sys\nprint('legacy: FAIL')\n",
+    "ATTEST_API_VERSION = 99\nimport sys\nprint('legacy: FAIL')\n",
+    "if True:\n    ATTEST_API_VERSION = 1\nprint('legacy: FAIL')\n",
+])
+def test_only_a_declared_api_version_is_imported(tmp_path, source, capsys):
+    validator = tmp_path / VALIDATOR.name
+    validator.write_text(source)
+    assert check_skill_reliance_manifest.load_validator(validator) is None
+    assert "legacy" not in capsys.readouterr().out       # never executed
+
+
+def test_the_shared_validator_is_reused_not_reloaded():
+    assert check_skill_reliance_manifest.load_validator(VALIDATOR) is check_skill_reliance_manifest
@@ -0,0 +1,89 @@
+"""scripts/session_catalog.py: wake's Pending Work from the catalog equals the
+directory scan it replaces, and a current catalog answers without a listing."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import session_catalog  # noqa: E402
+import wake_up  # noqa: E402
+import wind_down  # noqa: E402
+
+
+def _note(agent, name, items, age=0):
+    path = agent / "sessions" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    body = "\n".join(f"- {item}" for item in items)
+    path.write_text(f"# Session\n\n## Notes\n\nx\n\n## Pending Work\n\n{body}\n\n## Next\n")
+    stamp = 1_700_000_000 + age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def _scan(agent, monkeypatch):
+    """get_pending_work as it was: glob + stat + parse (no catalog)."""
+    monkeypatch.setattr(wake_up, "session_catalog", None)
+    try:
+        return wake_up.get_pending_work(agent)
+    finally:
+        monkeypatch.undo()
+
+
+@pytest.fixture
+def agent(tmp_path):
+    agent = tmp_path / "agent"
+    (agent / ".aget").mkdir(parents=True)
+    _note(agent, "session_2026-09-01_0900.md", ["old item"], age=0)
+    _note(agent, "SESSION_2026-09-02_0900.md", [f"item {i}" for i in range(12)], age=10)
+    _note(agent, "notes.md", ["not a session note"], age=99)
+    return agent
+
+
+def test_catalog_matches_directory_scan(agent, monkeypatch):
+    expected = _scan(agent, monkeypatch)
+    assert expected["source"] == "sessions/SESSION_2026-09-02_0900.md"
+    assert wake_up.get_pending_work(agent) == expected
+    assert (agent / session_catalog.CATALOG_RELPATH).exists()
+
+    _note(agent, "session_2026-09-03_0900.md", ["new"], age=20)   # added behind its back
+    assert wake_up.get_pending_work(agent) == _scan(agent, monkeypatch)
+    assert wake_up.get_pending_work(agent)["items"] == ["new"]
+
+    (agent / "sessions" / "session_2026-09-03_0900.md").unlink()
+    assert wake_up.get_pending_work(agent) == expected
+
+
+def test_current_catalog_does_not_list_sessions(agent, monkeypatch):
+    first = wake_up.get_pending_work(agent)
+
+    def no_listing(*args, **kwargs):
+        raise AssertionError("sessions/ listed")
+
+    monkeypatch.setattr(session_catalog.os, "scandir", no_listing)
+    monkeypatch.setattr(Path, "glob", no_listing)
+    assert wake_up.get_pending_work(agent) == first
+
+
+def test_latest_note_rewritten_in_place_is_reparsed(agent):
+    wake_up.get_pending_work(agent)
+    _note(agent, "SESSION_2026-09-02_0900.md", ["rewritten"], age=30)
+    assert wake_up.get_pending_work(agent)["items"] == ["rewritten"]
+
+
+def test_wind_down_session_file_is_cataloged(agent, monkeypatch):
+    wake_up.get_pending_work(agent)
+    name = wind_down.create_session_file(agent, {"pending_work": ["ship it"]}, mandatory=True)
+    catalog = session_catalog.load_catalog(agent)
+    assert catalog["latest"] == Path(name).name
+    assert catalog["notes"][Path(name).name]["pending_work"] == ["['ship it']"]
+    assert wake_up.get_pending_work(agent) == _scan(agent, monkeypatch)
+
+
+def test_no_session_notes(tmp_path):
+    (tmp_path / "sessions").mkdir()
+    assert wake_up.get_pending_work(tmp_path) == {"source": None, "items": [], "truncated": False}
@@ -0,0 +1,476 @@
+"""Search-contract pins for scripts/study_topic.py performance paths.
+
+Every accelerated path (inverted index, ...) must be a pure optimization: the
+findings it produces are compared against the plain full-scan path on the same
+fixture tree, field for field. A fast path that changes ranking is a contract
+change, not an optimization.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import study_topic  # noqa: E402
+
+TOPICS = [
+    "wake",
+    "wind down protocol",
+    "release currency signal",
+    "checks",
+    "L477",
+    "supervisor's lessons",
+    "v3.26 contract",
+    "the and of",
+    "KELVIN",
+]
+
+
+@pytest.fixture
+def agent_tree(tmp_path, monkeypatch):
+    """A small agent tree covering every surface the finders walk."""
+    root = tmp_path / "agent"
+    files = {
+        ".aget/evolution/L477_wake_protocol.md":
+            "# L477: Wake protocol lesson\n\nWake checks run first.\nwaking ok\n",
+        ".aget/evolution/L500_release.md":
+            "# Release currency\n\nThe release currency signal compares tags.\n",
+        ".aget/evolution/discoveries/north_star.md":
+            "# North star\n\nSupervisor lessons about the wind down protocol.\n",
+        ".aget/evolution/notes.md": "wake wake wake (ignored: no L prefix)\n",
+        "patterns/session/wind_down_pattern.md":
+            "# Wind down\n\nWind-down protocol checks.\nchecked twice, checking\n",
+        "docs/patterns/PATTERN_release.md": "Release signal v3.26 contract notes.\n",
+        "planning/PROJECT_PLAN_wake.md":
+            "# Plan\n\n**Plan_Status**: In Progress\n\nwake protocol work\n",
+        "sops/SOP_release.md": "Release SOP. Currency of signal.\n",
+        "governance/CHARTER.md": "Charter: the supervisor's lessons govern wind down.\n",
+        "knowledge/notes.md": "Knowledge about wake and KELVIN units.\n",
+        "ontology/ONTOLOGY_x.yaml": "terms:\n  - wake_up\n  - release_currency\n",
+        "specs/WAKE_SPEC.md": "Wake spec: checks, checked, checking.\n",
+        "inbox/NOTIFY_release.md": "NOTIFY: release currency signal changed.\n",
+    }
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    monkeypatch.setattr(study_topic, "get_agent_root", lambda: root)
+    study_topic.activate_index(None)
+    yield root
+    study_topic.activate_index(None)
+
+
+def _all_findings(topic):
+    return {
+        "ldocs": study_topic.find_ldocs(topic),
+        "patterns": study_topic.find_patterns(topic),
+        "project_plans": study_topic.find_project_plans(topic),
+        "sops": study_topic.find_sops(topic),
+        "governance": study_topic.find_governance(topic),
+        "specs": study_topic.find_specs(topic),
+        "knowledge": study_topic.find_knowledge(topic),
+        "inbox": study_topic.find_inbox(topic),
+    }
+
+
+@pytest.mark.parametrize("topic", TOPICS)
+def test_index_prefilter_preserves_findings(agent_tree, topic):
+    """The index may only skip files; findings and scores are unchanged."""
+    expected = _all_findings(topic)
+    study_topic.activate_index(study_topic.build_index(agent_tree))
+    assert _all_findings(topic) == expected
+
+
+def test_index_rules_out_non_candidates(agent_tree):
+    """Negative pin: a file that cannot match is skipped without being read."""
+    index = study_topic.build_index(agent_tree)
+    sop = agent_tree / "sops" / "SOP_release.md"
+    assert not index.may_match(sop, "wake")
+    assert index.may_match(sop, "release")
+
+
+def test_stale_entry_is_scanned_not_trusted(agent_tree):
+    """An entry whose stat changed since indexing must fall back to a scan."""
+    index = study_topic.build_index(agent_tree)
+    study_topic.activate_index(index)
+    sop = agent_tree / "sops" / "SOP_release.md"
+    sop.write_text("Release SOP, now about wake too.\n")
+    assert [r["sop"] for r in study_topic.find_sops("wake")] == ["SOP_release.md"]
+
+
+def test_index_round_trips_through_disk(agent_tree):
+    index = study_topic.build_index(agent_tree)
+    index.save()
+    loaded = study_topic.StudyIndex.load(agent_tree / study_topic.INDEX_RELPATH)
+    assert loaded.files == index.files
+    assert loaded.postings == index.postings
+
+
+def test_refresh_reindexes_only_what_changed(agent_tree):
+    """Incremental refresh: edits re-tokenize, touches re-hash, deletes drop."""
+    import os
+
+    index = study_topic.build_index(agent_tree)
+    stats = study_topic.refresh_index(index, agent_tree)
+    assert not stats["changed"]
+
+    (agent_tree / "sops" / "SOP_release.md").write_text("Release SOP about wake.\n")
+    (agent_tree / "sops" / "SOP_new.md").write_text("New wake SOP.\n")
+    (agent_tree / "governance" / "CHARTER.md").unlink()
+    touched = agent_tree / "specs" / "WAKE_SPEC.md"
+    st = touched.stat()
+    os.utime(touched, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+    charter = index.files["governance/CHARTER.md"]["id"]
+    stats = study_topic.refresh_index(index, agent_tree)
+    assert (stats["retokenized"], stats["added"], stats["removed"], stats["touched"]) == (1, 1, 1, 1)
+    assert "governance/CHARTER.md" not in index.files
+    assert not any(charter in post for post in index.postings.values())
+    assert all(index.postings.values())                         # no emptied tokens left
+
+    study_topic.activate_index(index)
+    indexed = _all_findings("wake")
+    study_topic.activate_index(None)
+    assert indexed == _all_findings("wake")
+
+
+
+def test_sessions_are_indexed_only_when_included(agent_tree):
+    """sessions/ is opt-in, and a default refresh neither walks nor drops it."""
+    sessions = agent_tree / "sessions"
+    sessions.mkdir()
+    (sessions / "SESSION_01.md").write_text("wake protocol\n")
+    index = study_topic.build_index(agent_tree)
+    assert not any(k.startswith("sessions/") for k in index.files)
+    study_topic.refresh_index(index, agent_tree, include_sessions=True)
+    assert "sessions/SESSION_01.md" in index.files
+    assert not study_topic.refresh_index(index, agent_tree)["changed"]
+    assert "sessions/SESSION_01.md" in index.files
+
+
+def test_index_keeps_counts_not_lines_and_dedupes_links(agent_tree):
+    (agent_tree / "knowledge" / "zz_alias.md").symlink_to(agent_tree / "knowledge" / "notes.md")
+    index = study_topic.build_index(agent_tree)
+    assert "knowledge/zz_alias.md" not in index.files
+    fid = index.files["knowledge/notes.md"]["id"]
+    assert index.postings["wake"][fid] == 1
+    stem, heading, body = index.postings["notes"][fid]          # filename text only
+    assert stem and not heading and not body
+    lesson = index.files[".aget/evolution/L477_wake_protocol.md"]["id"]
+    assert index.postings["lesson"][lesson] == [0, 1, 0]        # the `# ` heading
+@pytest.mark.parametrize("topic", TOPICS)
+def test_parallel_collect_matches_sequential(agent_tree, topic):
+    """--jobs N merges deterministically: same keys, order, items and scores."""
+    (agent_tree / "sessions").mkdir()
+    (agent_tree / "sessions" / "SESSION_wake_notes.md").write_text("wake release signal\n")
+    # Same-named spec in two tiers: first root wins, as in the sequential walk.
+    (agent_tree / ".aget" / "specs").mkdir(parents=True)
+    (agent_tree / ".aget" / "specs" / "WAKE_SPEC.md").write_text("wake checks again\n")
+    sequential = study_topic.collect_findings(topic, include_sessions=True, jobs=1)
+    parallel = study_topic.collect_findings(topic, include_sessions=True, jobs=4)
+    assert list(parallel) == list(sequential)
+    assert parallel == sequential
+    assert study_topic._SCAN_POOL is None
+
+
+def test_content_cache_reads_each_file_once(agent_tree, monkeypatch):
+    """Per-run cache: title/plan-status probes and domain boosts reuse the
+    scan's read, and results equal the uncached finders'."""
+    from collections import Counter
+
+    uncached = _all_findings("wake protocol")
+    reads = Counter()
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads[self] += 1
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    cached = study_topic.collect_findings("wake protocol", domain_keywords=["lesson", "checks"])
+    assert reads and max(reads.values()) == 1
+    assert study_topic._CONTENT_CACHE is None
+    for key, items in uncached.items():
+        assert [x["file"] for x in cached[key]] == [x["file"] for x in items]
+
+
+def _study(argv):
+    output = study_topic.run_study(study_topic.build_parser().parse_args(argv))
+    output.pop("timestamp")
+    return output
+
+
+def test_index_is_opt_in(agent_tree):
+    """A default study neither builds nor reads the index; --index builds it."""
+    path = agent_tree / study_topic.INDEX_RELPATH
+    plain = _study(["-t", "wake"])
+    assert not path.exists()
+    assert _study(["-t", "wake", "--index"]) == plain
+    assert path.exists()
+    assert study_topic.index_enabled(study_topic.build_parser().parse_args(["-t", "x"]),
+                                     {"use_index": True})
+    assert not study_topic.index_enabled(
+        study_topic.build_parser().parse_args(["-t", "x", "--no-index"]), {"use_index": True})
+
+
+def test_daemon_answers_like_in_process(agent_tree):
+    """Same argv, same output dict; edits between queries are picked up."""
+    import socket
+    import threading
+    import time
+
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("no AF_UNIX")
+    server = threading.Thread(target=study_topic.serve_daemon, daemon=True)
+    server.start()
+    sock = agent_tree / study_topic.DAEMON_SOCKET_RELPATH
+    for _ in range(200):
+        if sock.exists():
+            break
+        time.sleep(0.01)
+    try:
+        for argv in (["-t", "wake protocol", "--json"],
+                     ["-t", "release", "--include-sessions", "--no-floor"]):
+            via_daemon = study_topic.query_daemon(argv)
+            assert via_daemon is not None
+            via_daemon.pop("timestamp")
+            assert via_daemon == _study(argv)
+
+        (agent_tree / "sops" / "SOP_release.md").write_text("Wake protocol SOP.\n")
+        via_daemon = study_topic.query_daemon(["-t", "wake protocol"])
+        assert [x["sop"] for x in via_daemon["findings"]["sops"]] == ["SOP_release.md"]
+    finally:
+        study_topic._send_daemon_request({"version": study_topic.DAEMON_PROTOCOL_VERSION,
+                                          "op": "shutdown"})
+        server.join(5)
+    assert not server.is_alive()
+    assert study_topic.query_daemon(["-t", "wake"]) is None     # falls back
+
+
+def test_daemon_returns_query_warnings_to_the_client(agent_tree, capsys):
+    """A warning raised while the daemon serves a query reaches the client's
+    stderr, not the daemon's."""
+    import socket
+    import threading
+    import time
+
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("no AF_UNIX")
+    (agent_tree / "scripts").mkdir(exist_ok=True)
+    (agent_tree / "scripts" / "study_topic_ext.py").write_text(
+        "def post_study(payload):\n    raise RuntimeError('hook broke')\n")
+    daemon = study_topic.StudyDaemon()
+    reply = daemon.handle({"version": study_topic.DAEMON_PROTOCOL_VERSION, "op": "study",
+                           "argv": ["-t", "wake"]})
+    assert any("hook broke" in line for line in reply["warnings"])
+    assert "hook broke" not in capsys.readouterr().err
+
+    server = threading.Thread(target=study_topic.serve_daemon, daemon=True)
+    server.start()
+    sock = agent_tree / study_topic.DAEMON_SOCKET_RELPATH
+    for _ in range(200):
+        if sock.exists():
+            break
+        time.sleep(0.01)
+    try:
+        capsys.readouterr()
+        assert study_topic.query_daemon(["-t", "wake"]) is not None
+        assert "hook broke" in capsys.readouterr().err
+    finally:
+        study_topic._send_daemon_request({"version": study_topic.DAEMON_PROTOCOL_VERSION,
+                                          "op": "shutdown"})
+        server.join(5)
+
+def test_bm25_ranker_reorders_but_keeps_membership(agent_tree):
+    """--ranker bm25 changes scores/order only; which files match is fixed."""
+    composite = _study(["-t", "wake protocol", "--no-floor"])
+    bm25 = _study(["-t", "wake protocol", "--no-floor", "--ranker", "bm25"])
+    assert bm25["search_contract"]["ranker"] == "bm25"
+    for key, items in composite["findings"].items():
+        assert sorted(x["file"] for x in bm25["findings"][key]) == sorted(x["file"] for x in items)
+        scores = [x["score"] for x in bm25["findings"][key]]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_bm25_normalizes_document_length(agent_tree):
+    """A long spec repeating a token outranks a short focused note under
+    composite_score (log-damped count, no length norm); BM25F reverses it."""
+    specs = agent_tree / "specs"
+    filler = "\n".join(f"line {i} about unrelated matters" for i in range(400))
+    (specs / "BIG_SPEC.yaml").write_text(filler + "\n" + "gizmo " * 8 + "\n")
+    (specs / "NOTE.md").write_text("Gizmo calibration.\n")
+    order = {}
+    for ranker in ("composite", "bm25"):
+        out = _study(["-t", "gizmo", "--no-floor", "--ranker", ranker])
+        order[ranker] = [x["doc"] for x in out["findings"]["specs"]]
+    assert order == {"composite": ["BIG_SPEC.yaml", "NOTE.md"],
+                     "bm25": ["NOTE.md", "BIG_SPEC.yaml"]}
+
+
+def test_streaming_scan_matches_full_scan(tmp_path, monkeypatch):
+    """Line-aligned blocks (tiny here, to force many edges) give the exact
+    search_file_for_topic result: counts, coverage, contexts, boosts, score."""
+    import random
+
+    monkeypatch.setattr(study_topic, "get_agent_root", lambda: tmp_path)
+    rng = random.Random(4935)
+    vocab = ["wake", "waking", "protocol", "protocols", "release", "x" * 120, "Wake",
+             "lesson", "lessons", "\n", "\n", " ", "-", "ΣΑΣ"]
+    for i in range(40):
+        file = tmp_path / f"2026-10-{i % 28 + 1:02d}_wake_{i}.md"
+        file.write_text("".join(rng.choice(vocab) + rng.choice([" ", "\n", ""]) for _ in range(300)))
+        for topic in ("wake", "wake protocol", "lesson lessons release", "the and"):
+            for domain in (None, ["release", "lesson", "release"]):
+                want = study_topic.search_file_for_topic(file, topic, domain_keywords=domain)
+                for block in (7, 64, 1 << 20):
+                    got = study_topic.search_file_streaming(file, topic, domain_keywords=domain,
+                                                            block_chars=block)
+                    assert got == want, (file.name, topic, block)
+
+
+
+def test_streaming_prune_never_drops_a_file_above_the_threshold(tmp_path, monkeypatch):
+    """The prune bound counts the read-but-unscanned partial line: a file whose
+    full score beats stop_at_or_below is returned whole, never _PRUNED."""
+    monkeypatch.setattr(study_topic, "get_agent_root", lambda: tmp_path)
+    file = tmp_path / "note.md"
+    for body in ("xxxxxxx\nfoo foo foo\n", "x\n" * 20 + "foo " * 9 + "\n", "xx\nfoo\nfoo foo\n"):
+        file.write_text(body)
+        want = study_topic.search_file_for_topic(file, "foo")
+        for block in (3, 7, 16, 64):
+            for threshold in (0.5, 1.0, 2.0, 3.0):
+                got = study_topic.search_file_streaming(file, "foo", stop_at_or_below=threshold,
+                                                        block_chars=block)
+                if want["score"] > threshold:
+                    assert got == want, (body, block, threshold)
+
+def test_session_top_k_is_the_head_of_the_full_list(agent_tree):
+    sessions = agent_tree / "sessions"
+    sessions.mkdir()
+    for i in range(12):
+        (sessions / f"SESSION_{i:02d}.md").write_text("wake protocol\n" * (i % 5 + 1))
+    full = study_topic.find_sessions("wake protocol")
+    assert len(full) == 12
+    for index in (None, study_topic.build_index(agent_tree, include_sessions=True)):
+        study_topic.activate_index(index)
+        for k in (1, 3, 5, 12, 20):
+            assert study_topic.find_sessions("wake protocol", top_k=k) == full[:k]
+
+
+def test_result_collector_is_floor_then_stable_sort_then_head():
+    import random
+
+    rng = random.Random(9)
+    items = [{"id": i, "score": rng.choice([0.5, 1.0, 2.0, 2.0, 3.5, 7.0])} for i in range(200)]
+    for floor in (None, 2.0):
+        kept = [x for x in items if floor is None or x["score"] >= floor]
+        expected = sorted(kept, key=lambda x: x["score"], reverse=True)
+        for k in (None, 1, 10, 1000):
+            collector = study_topic.ResultCollector(top_k=k, floor=floor)
+            for item in items:
+                collector.add(item)
+            assert collector.ranked() == expected[:k]
+            assert collector.suppressed == len(items) - len(kept)
+            assert collector.truncated == len(expected) - len(expected[:k])
+
+
+def test_top_k_changes_only_list_lengths(agent_tree):
+    """--top-k: each surface is the head of the unbounded list; the floor
+    count is unchanged and the rest is accounted for."""
+    full = _study(["-t", "wake protocol", "--no-floor", "--include-sessions"])
+    top = _study(["-t", "wake protocol", "--no-floor", "--include-sessions", "--top-k", "1"])
+    for key, items in full["findings"].items():
+        assert top["findings"][key] == items[:1]
+    contract = top["search_contract"]
+    assert contract["top_k"] == 1
+    beyond = sum(max(0, len(v) - 1) for v in full["findings"].values())
+    truncated, skipped = contract["truncated_beyond_top_k"], contract["skipped_without_scoring"]
+    assert truncated <= beyond <= truncated + skipped
+    report = study_topic.generate_report("wake protocol", top["findings"],
+                                         limit_info={"truncated": truncated})
+    assert (f"{truncated} more beyond --top-k" in report) == bool(truncated)
+    floored = _study(["-t", "wake protocol", "--top-k", "1"])
+    assert (floored["search_contract"]["suppressed_below_floor"]
+            == _study(["-t", "wake protocol"])["search_contract"]["suppressed_below_floor"])
+
+
+def _reference_scan(file_path, topic):
+    """The per-keyword matcher as it stood before the single-pass rewrite:
+    one re.finditer per keyword, line numbers by counting newlines."""
+    import re
+
+    content = file_path.read_text()
+    haystack = content + "\n" + study_topic._filename_text(file_path)
+    keywords = study_topic.prepare_keywords(topic)
+    terms = keywords if len(keywords) > 1 else [keywords[0] if keywords else topic]
+    keyword_matches, matches = {}, []
+    for kw in terms:
+        found = list(re.finditer(study_topic._token_pattern(kw), haystack, re.IGNORECASE))
+        if found:
+            keyword_matches[kw] = len(found)
+            matches.extend(found)
+    if len(keywords) > 1:
+        if len(keyword_matches) < min(max(1, (len(keywords) + 1) // 2), len(keywords)):
+            return None
+    if not matches:
+        return None
+    lines, contexts, seen = content.split("\n"), [], set()
+    for m in matches:
+        if m.start() >= len(content):
+            continue
+        n = content.count("\n", 0, m.start())
+        if n in seen:
+            continue
+        seen.add(n)
+        line = lines[n].strip()
+        contexts.append({"line": n + 1, "context": line[:100] + "..." if len(line) > 100 else line})
+        if len(contexts) >= 3:
+            break
+    coverage = len(keyword_matches) / len(keywords) if len(keywords) > 1 else None
+    return len(matches), coverage, contexts
+
+
+@pytest.mark.parametrize("topic", TOPICS + [
+    "lesson lessons",        # overlapping keywords: per-keyword fallback
+    "check checks wake",
+    "the the",               # all-stopword raw fallback keeps duplicates
+    "protocol protocols",
+    "wind-down signal",
+])
+def test_single_pass_matcher_matches_per_keyword_scan(agent_tree, topic):
+    """match_count, keyword_coverage and contexts equal the per-keyword scan."""
+    for file in sorted(p for p in agent_tree.rglob("*") if p.is_file()):
+        got = study_topic.search_file_for_topic(file, topic)
+        want = _reference_scan(file, topic)
+        if want is None:
+            assert got is None, file
+            continue
+        count, coverage, contexts = want
+        assert got["match_count"] == count, file
+        assert got.get("keyword_coverage") == coverage, file
+        assert got["contexts"] == contexts, file
+
+
+def test_single_pass_matcher_fuzz(tmp_path, monkeypatch):
+    """Randomized text over a small vocabulary designed to collide."""
+    import random
+
+    monkeypatch.setattr(study_topic, "get_agent_root", lambda: tmp_path)
+    rng = random.Random(1852)
+    vocab = ["check", "checks", "checking", "lesson", "lessons", "wake", "waked",
+             "release", "releases", "v3.26", "x", "-", ".", "\n", " ", "Check", "LESSON",
+             "\u212aey", "\u017fpec", "CHEC\u212a", "\u0130"]
+    for i in range(60):
+        text = "".join(rng.choice(vocab) + rng.choice([" ", "", "\n", "_"]) for _ in range(80))
+        file = tmp_path / f"doc_{i}.md"
+        file.write_text(text)
+        for topic in ("check", "lesson release", "wake checks", "check checks",
+                      "v3.26 wake", "lesson lessons release", "key spec check"):
+            got = study_topic.search_file_for_topic(file, topic)
+            want = _reference_scan(file, topic)
+            assert (got is None) == (want is None)
+            if want:
+                assert (got["match_count"], got.get("keyword_coverage"), got["contexts"]) == want
@@ -0,0 +1,235 @@
+"""Latency contracts for scripts/wake_up.py (probe deadline, release-currency
+cache, section-gated imports, wake snapshot)."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import wake_up  # noqa: E402
+
+
+def test_run_with_deadline_bounds_latency_and_marks_late_sections():
+    release = threading.Event()
+    collectors = [
+        ("fast", lambda: {"value": 1}, {"value": None}),
+        ("slow", lambda: release.wait(30) and {"value": 2}, {"value": None}),
+    ]
+    start = time.monotonic()
+    try:
+        gathered = wake_up.run_with_deadline(collectors, 0.2)
+    finally:
+        release.set()
+    assert time.monotonic() - start < 2
+    assert gathered == {"fast": {"value": 1}, "slow": {"value": None, "timed_out": True}}
+
+
+def test_abandoned_probe_child_dies_with_the_deadline(tmp_path):
+    """A probe's subprocess gets what is left of the wake deadline, so it is
+    killed when its abandoned probe would otherwise leave it running."""
+    import os
+    import subprocess
+
+    pid_file = tmp_path / "child.pid"
+    child = ("import os, pathlib, time\n"
+             f"pathlib.Path({str(pid_file)!r}).write_text(str(os.getpid()))\n"
+             "time.sleep(30)\n")
+
+    def probe():
+        try:
+            subprocess.run([sys.executable, "-c", child], timeout=wake_up.probe_timeout(30))
+        except subprocess.TimeoutExpired:
+            pass
+        return {}
+
+    gathered = wake_up.run_with_deadline([("slow", probe, {})], 1.0)
+    assert gathered["slow"]["timed_out"]
+    pid = int(pid_file.read_text())
+    for _ in range(50):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.1)
+    else:
+        os.kill(pid, 9)
+        pytest.fail("probe child outlived the wake deadline")
+    assert wake_up.probe_timeout(30) == 30          # outside a probe thread: unchanged
+
+def test_run_with_deadline_runs_probes_concurrently():
+    collectors = [(f"p{i}", lambda: time.sleep(0.3) or {}, {}) for i in range(4)]
+    start = time.monotonic()
+    gathered = wake_up.run_with_deadline(collectors, None)
+    assert time.monotonic() - start < 1.0
+    assert list(gathered) == ["p0", "p1", "p2", "p3"]
+    assert all("timed_out" not in v for v in gathered.values())
+
+
+def test_run_with_deadline_propagates_collector_errors():
+    def boom():
+        raise ValueError("probe failed")
+
+    with pytest.raises(ValueError, match="probe failed"):
+        wake_up.run_with_deadline([("bad", boom, {})], 5)
+
+
+def test_wake_data_marks_timed_out_release_probe(tmp_path, monkeypatch):
+    (tmp_path / ".aget").mkdir()
+    (tmp_path / ".aget" / "config.json").write_text('{"wake_up": {"wake_deadline": 0.2}}')
+    release = threading.Event()
+    monkeypatch.setattr(wake_up, "get_release_currency",
+                        lambda *a, **k: release.wait(30) and {"status": "current"})
+    try:
+        data = wake_up.get_wake_data(tmp_path)
+    finally:
+        release.set()
+    assert data["release_currency"] == {"status": "unknown", "latest": None, "timed_out": True}
+    assert "reliance_attestation" not in data
+    assert list(data)[-3:] == ["calendar", "pending_work", "release_currency"]
+
+
+def _count_fetches(monkeypatch, tag="9.9.9"):
+    calls = []
+    monkeypatch.setattr(wake_up, "fetch_latest_release",
+                        lambda timeout=5: calls.append(timeout) or tag)
+    return calls
+
+
+def test_release_currency_cold_cache_fetches_once_then_serves_cached(tmp_path, monkeypatch):
+    calls = _count_fetches(monkeypatch)
+    first = wake_up.get_release_currency("3.0.0", agent_path=tmp_path, ttl=3600)
+    second = wake_up.get_release_currency("9.9.9", agent_path=tmp_path, ttl=3600)
+    assert first == {"status": "behind", "latest": "9.9.9", "cache_age_seconds": 0}
+    assert second["status"] == "current" and second["cache_age_seconds"] >= 0
+    assert "refreshing" not in second
+    assert len(calls) == 1
+
+
+def test_release_currency_expired_cache_is_served_and_refreshed_in_background(
+        tmp_path, monkeypatch):
+    calls = _count_fetches(monkeypatch)
+    cache = tmp_path / wake_up.RELEASE_CURRENCY_CACHE
+    cache.parent.mkdir(parents=True)
+    cache.write_text('{"latest": "3.1.0", "fetched_at": %f}' % (time.time() - 7200))
+    spawned = []
+    monkeypatch.setattr(wake_up, "_spawn_release_currency_refresh",
+                        lambda path, timeout: spawned.append(path) or True)
+    result = wake_up.get_release_currency("3.1.0", agent_path=tmp_path, ttl=3600)
+    assert result["status"] == "current" and result["refreshing"] is True
+    assert result["cache_age_seconds"] >= 7200
+    assert spawned == [tmp_path] and calls == []
+
+
+def test_release_currency_without_cache_stays_live(tmp_path, monkeypatch):
+    calls = _count_fetches(monkeypatch, tag="")
+    assert wake_up.get_release_currency("3.0.0", agent_path=tmp_path, ttl=0) == {
+        "status": "unknown", "latest": None}
+    assert len(calls) == 1
+    assert not (tmp_path / wake_up.RELEASE_CURRENCY_CACHE).exists()
+
+
+def test_disabled_sections_skip_their_imports(tmp_path):
+    """Section-gated imports: with every probe switched off, a wake never
+    loads subprocess, threading or the shared scripts/ modules."""
+    import json
+    import subprocess
+
+    (tmp_path / ".aget").mkdir()
+    (tmp_path / ".aget" / "config.json").write_text(json.dumps({"wake_up": {
+        "show_git_status": False, "show_release_currency": False,
+        "show_pending_work": False, "show_reliance_attestation": False}}))
+    probe = (
+        "import sys\n"
+        f"path = {str(REPO / 'scripts' / 'wake_up.py')!r}\n"
+        f"sys.argv = [path, '--dir', {str(tmp_path)!r}, '--profile-startup']\n"
+        "try:\n"
+        "    exec(compile(open(path).read(), path, 'exec'),"
+        " {'__name__': '__main__', '__file__': path})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('subprocess', 'threading', 'git_status', 'session_catalog',"
+        " 'importlib.util') if m in sys.modules))\n"
+    )
+    proc = subprocess.run([sys.executable, "-S", "-c", probe], capture_output=True, text=True,
+                          cwd=str(tmp_path))
+    assert proc.stdout.strip().splitlines()[-1] == "[]"
+    assert "startup: total" in proc.stderr
+
+
+@pytest.fixture
+def snap_agent(tmp_path, monkeypatch):
+    agent = tmp_path / "agent"
+    (agent / ".aget").mkdir(parents=True)
+    (agent / ".aget" / "version.json").write_text('{"aget_version": "3.1.0"}')
+    (agent / ".aget" / "config.json").write_text(
+        '{"wake_up": {"show_git_status": false, "show_release_currency": false}}')
+    (agent / ".aget" / "skill_reliance_manifest.yaml").write_text("core_S: []\n")
+    (agent / "scripts").mkdir()
+    (agent / "scripts" / "check_skill_reliance_manifest.py").write_text(
+        "import pathlib\n"
+        "log = pathlib.Path(__file__).with_name('runs.log')\n"
+        "log.write_text(log.read_text() + 'x' if log.exists() else 'x')\n"
+        "print('OK: 0 findings')\n")
+    (agent / "sessions").mkdir()
+    (agent / "sessions" / "session_2026-09-01.md").write_text("## Pending Work\n- one\n")
+    monkeypatch.setattr(wake_up, "_wake_snapshot", None)
+    return agent
+
+
+def _wake(agent):
+    data = wake_up.get_wake_data(agent, use_snapshot=True)
+    wake_up.save_wake_snapshot(agent, wake_up._wake_snapshot)
+    report = data.pop("wake_snapshot")
+    data.pop("timestamp")
+    return data, report
+
+
+def test_snapshot_reuses_unchanged_sections(snap_agent):
+    first, report = _wake(snap_agent)
+    assert report["reused"] == []
+    assert first["reliance_attestation"] == {"ok": True, "summary": "OK: 0 findings"}
+    again, report = _wake(snap_agent)
+    assert again == first
+    assert sorted(report["reused"]) == ["identity", "pending_work",
+                                        "reliance_attestation", "structure"]
+    assert (snap_agent / "scripts" / "runs.log").read_text() == "x"    # validator ran once
+    fresh = wake_up.get_wake_data(snap_agent)
+    fresh.pop("timestamp")
+    assert fresh == first
+
+
+def test_snapshot_recomputes_only_invalidated_sections(snap_agent):
+    _wake(snap_agent)
+    time.sleep(0.01)
+    (snap_agent / ".aget" / "version.json").write_text('{"aget_version": "3.2.0"}')
+    (snap_agent / "sessions" / "session_2026-09-02.md").write_text("## Pending Work\n- two\n")
+    data, report = _wake(snap_agent)
+    assert sorted(report["recomputed"]) == ["identity", "pending_work"]
+    assert data["version"]["aget_version"] == "3.2.0"
+    assert data["pending_work"]["items"] == ["two"]
+    (snap_agent / ".aget" / "skill_reliance_manifest.yaml").write_text("core_S: [x]\n")
+    _, report = _wake(snap_agent)
+    assert report["recomputed"] == ["reliance_attestation"]
+
+
+def test_snapshot_save_waits_for_a_late_section_write(snap_agent):
+    """A probe abandoned at the deadline may still write its section: the
+    save serialises under the same lock, never a dict changing under it."""
+    _wake(snap_agent)
+    snapshot = wake_up.load_wake_snapshot(snap_agent)
+    snapshot["recomputed"].append("late")
+    saver = threading.Thread(target=wake_up.save_wake_snapshot, args=(snap_agent, snapshot))
+    with snapshot["lock"]:
+        saver.start()
+        saver.join(0.2)
+        assert saver.is_alive()                      # blocked behind the writer
+        snapshot["sections"]["late"] = {"inputs": [], "stamps": [], "value": 1}
+    saver.join(5)
+    saved = wake_up.load_wake_snapshot(snap_agent)
+    assert saved["sections"]["late"]["value"] == 1
+    assert "lock" not in (snap_agent / wake_up.WAKE_SNAPSHOT).read_text()
@@ -0,0 +1,96 @@
+"""wind_down.run_health_check: in process, the same summary `health_check.py
+--json` gives; instance copies it cannot call that way still run as before."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import wind_down  # noqa: E402
+
+HOOK = """\
+def post_health(data):
+    data['checks'].append({'name': 'instance_check', 'passed': False})
+    data['summary']['total'] += 1
+    data['summary']['warnings'] += 1
+    data['status'] = 'warning'
+    return data
+"""
+
+
+@pytest.fixture
+def agent(tmp_path):
+    agent = tmp_path / "agent"
+    (agent / ".aget").mkdir(parents=True)
+    (agent / ".aget" / "version.json").write_text('{"aget_version": "3.26.0"}')
+    (agent / "scripts").mkdir()
+    shutil.copy(REPO / "scripts" / "health_check.py", agent / "scripts" / "health_check.py")
+    return agent
+
+
+def _no_subprocess(monkeypatch):
+    def refuse(*args, **kwargs):
+        raise AssertionError(f"subprocess spawned: {args}")
+    monkeypatch.setattr(wind_down.subprocess, "run", refuse)
+
+
+def _as_subprocess(agent, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(wind_down, "_run_health_check_in_process", lambda *a, **k: None)
+        return wind_down.run_health_check(agent)
+
+
+def test_in_process_matches_subprocess(agent, monkeypatch):
+    expected = _as_subprocess(agent, monkeypatch)
+    _no_subprocess(monkeypatch)
+    assert wind_down.run_health_check(agent) == expected
+    assert expected["checks_total"] > 0
+
+
+def test_extension_hook_still_counts(agent, monkeypatch):
+    (agent / "scripts" / "health_check_ext.py").write_text(HOOK)
+    expected = _as_subprocess(agent, monkeypatch)
+    assert expected["status"] == "warning"
+    _no_subprocess(monkeypatch)
+    assert wind_down.run_health_check(agent) == expected
+
+
+LEGACY_MAIN = """\
+if __name__ == '__main__':
+    import json
+    print(json.dumps({'status': 'healthy', 'summary': {'passed': 7, 'total': 7}}))
+"""
+
+
+@pytest.mark.parametrize("extra", [
+    "",                                                         # no run_housekeeping
+    "def run_housekeeping(path):\n    raise AssertionError('called in process')\n",
+    "# HOUSEKEEPING_API_VERSION = 1  (a comment declares nothing)\nimport sys\n"
+    "if 'wind_down' in sys.modules:\n    raise AssertionError('run in process')\n",
+])
+def test_incompatible_copy_runs_as_subprocess(agent, extra):
+    (agent / "scripts" / "health_check.py").write_text(extra + LEGACY_MAIN)
+    summary = wind_down.run_health_check(agent)
+    assert (summary["status"], summary["checks_passed"], summary["checks_total"]) == \
+        ("healthy", 7, 7)
+
+
+def test_hung_extension_hook_is_bounded(agent, monkeypatch):
+    """A post_health hook that never returns (hook deadline off) costs
+    HEALTH_CHECK_TIMEOUT, as the subprocess did, not the whole wind-down."""
+    import time
+
+    (agent / ".aget" / "config.json").write_text('{"extension_hooks": {"timeout_seconds": 0}}')
+    (agent / "scripts" / "health_check_ext.py").write_text(
+        "import time\ndef post_health(data):\n    time.sleep(60)\n    return data\n")
+    monkeypatch.setattr(wind_down, "HEALTH_CHECK_TIMEOUT", 0.5)
+    _no_subprocess(monkeypatch)
+    started = time.monotonic()
+    summary = wind_down.run_health_check(agent)
+    assert time.monotonic() - started < 5
+    assert summary["status"] == "error" and "timed out" in summary["message"]